@@ -0,0 +1,217 @@
+from glob import glob
+from os.path import isfile
+from subprocess import DEVNULL, run
+from sys import argv, executable
+from time import perf_counter
+
+import pyindo.compiler
+
+
+# Recursive program which computes the same fibonacci numbers over and over
+# again, unless the function is memoized with the `ingat` annotation
+FIBONACCI_PROGRAM = """{annotation}fungsi fib(n: desimal): desimal {{
+    jika (n < 2) {{
+        hasilkan n;
+    }}
+    hasilkan fib(n - 1) + fib(n - 2);
+}}
+
+fungsi utama() {{
+    tampilkan("${{fib({n})}}\\n");
+}}
+"""
+
+
+def generate_program(function_count: int) -> str:
+    """
+    Generate a large program with a lot of small functions
+    which are all called from the entrypoint
+    """
+
+    program = ""
+    for i in range(function_count):
+        program += f"""fungsi f{i}(a: desimal, b: desimal): desimal {{
+    variabel c: desimal = a * {i} + b - 3;
+    jika (c > 10) {{
+        tampilkan("nilai ${{c}} besar\\n");
+    }}
+    hasilkan c + a * (b - 1);
+}}
+"""
+
+    program += "fungsi utama() {\n"
+    for i in range(function_count):
+        program += f'    tampilkan("${{f{i}({i}, 2)}}\\n");\n'
+    program += "}\n"
+
+    return program
+
+
+def collect_assemblies(program: str) -> list:
+    """
+    Compile the program while keeping every instruction
+    stream (along with its arguments) given to the assembler
+    """
+
+    from pyindo.parser import parse_program
+
+    assemblies = []
+    assemble = pyindo.compiler.assemble
+
+    def collect(*args, **kwargs):
+        assemblies.append((args, kwargs))
+        return assemble(*args, **kwargs)
+
+    pyindo.compiler.assemble = collect
+    try:
+        bytecodes, _ = parse_program(program + "\0")
+        pyindo.compiler.compile_bytecodes(bytecodes)
+    finally:
+        pyindo.compiler.assemble = assemble
+
+    return assemblies
+
+
+def assemble_with_bytecode(
+    bytecodes: list,
+    name: str = "<module>",
+    argnames: list = [],
+    flags: int = 0,
+    first_line_number: int = 1,
+):
+    from bytecode import Bytecode
+
+    compiled_bytecode = Bytecode(bytecodes)
+    compiled_bytecode.name = name
+    compiled_bytecode.argcount = len(argnames)
+    compiled_bytecode.argnames = argnames
+    compiled_bytecode.flags = flags
+    compiled_bytecode.first_lineno = first_line_number
+
+    return compiled_bytecode.to_code()
+
+
+def benchmark_assembler(assembler, assemblies: list, repeat: int = 5) -> float:
+    best_time = float("inf")
+
+    for _ in range(repeat):
+        start_time = perf_counter()
+        for args, kwargs in assemblies:
+            assembler(*args, **kwargs)
+
+        best_time = min(best_time, perf_counter() - start_time)
+
+    return best_time
+
+
+def get_pool_programs() -> list:
+    """
+    Test programs which could be run on their own, without
+    any compiler option and without any module next to them
+    """
+
+    programs = []
+    for program in sorted(glob("tests/success/*.pyind")):
+        source = open(program, "r").read()
+        if not isfile(program.replace(".pyind", ".options")) and "impor" not in source:
+            programs.append((program, source))
+
+    return programs
+
+
+def benchmark_pool(programs: list, repeat: int = 20) -> tuple:
+    """
+    Run the programs through the execution pool and through a fresh
+    interpreter each, returns the programs per second of both
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+    from pyindo.pool import ExecutionPool
+
+    with ExecutionPool() as pool:
+        # Keep every worker busy, just like several tenants would
+        with ThreadPoolExecutor(pool.worker_count) as executor:
+            list(executor.map(pool.run, [source for _, source in programs] * repeat))
+
+        pool_throughput = pool.get_throughput()
+
+    start_time = perf_counter()
+    for program, _ in programs:
+        run([executable, "main.py", program], stdout=DEVNULL, stderr=DEVNULL)
+
+    process_throughput = len(programs) / (perf_counter() - start_time)
+
+    return (pool_throughput, process_throughput)
+
+
+def benchmark_memoization(n: int, annotation: str = "") -> tuple:
+    """
+    Run the recursive fibonacci program, returns the time taken along
+    with the memo statistics (None if the function is not memoized)
+    """
+
+    from contextlib import redirect_stdout
+    from io import StringIO
+    from pyindo.parser import parse_program
+
+    bytecodes, _ = parse_program(
+        FIBONACCI_PROGRAM.format(annotation=annotation, n=n) + "\0"
+    )
+    code = pyindo.compiler.compile_bytecodes(bytecodes)
+    namespace = {"__name__": "__main__"}
+
+    start_time = perf_counter()
+    with redirect_stdout(StringIO()):
+        exec(code, namespace)
+
+    elapsed_time = perf_counter() - start_time
+    fib = namespace["fib"]
+
+    return (elapsed_time, fib.cache_info() if hasattr(fib, "cache_info") else None)
+
+
+if __name__ == "__main__":
+    function_count = int(argv[1]) if len(argv) > 1 else 500
+
+    assemblies = collect_assemblies(generate_program(function_count))
+    instruction_count = sum(len(args[0]) for args, _ in assemblies)
+
+    print("==========================")
+    print("[+] Benchmarking assembler")
+    print("==========================")
+    print(f"{len(assemblies)} code objects, {instruction_count} instructions")
+
+    pyindo_time = benchmark_assembler(pyindo.compiler.assemble, assemblies)
+    bytecode_time = benchmark_assembler(assemble_with_bytecode, assemblies)
+
+    print(f"pyindo assembler   : {pyindo_time * 1000:.1f} ms")
+    print(f"bytecode to_code() : {bytecode_time * 1000:.1f} ms")
+    print(f"speedup            : {bytecode_time / pyindo_time:.1f}x")
+
+    programs = get_pool_programs()
+
+    print("\n===============================")
+    print("[+] Benchmarking execution pool")
+    print("===============================")
+    print(f"{len(programs)} programs")
+
+    pool_throughput, process_throughput = benchmark_pool(programs)
+
+    print(f"execution pool      : {pool_throughput:.1f} programs/sec")
+    print(f"fresh interpreter   : {process_throughput:.1f} programs/sec")
+    print(f"speedup             : {pool_throughput / process_throughput:.1f}x")
+
+    fibonacci_n = 30
+
+    print("\n=============================")
+    print("[+] Benchmarking memoization")
+    print("=============================")
+    print(f"fib({fibonacci_n})")
+
+    plain_time, _ = benchmark_memoization(fibonacci_n)
+    memoized_time, cache_info = benchmark_memoization(fibonacci_n, "ingat ")
+
+    print(f"plain               : {plain_time * 1000:.1f} ms")
+    print(f"memoized            : {memoized_time * 1000:.3f} ms")
+    print(f"speedup             : {plain_time / memoized_time:.0f}x")
+    print(f"memo                : {cache_info.hits} hits, {cache_info.misses} misses")
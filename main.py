@@ -1,15 +1,17 @@
 from os import (
     EX_USAGE,  # Exit code that means that some kind of configuration error occurred.
     EX_NOINPUT,  # Exit code that means an input file did not exist or was not readable.
+    environ,
 )
-from os.path import isfile
+from os.path import abspath, dirname, isfile
 from sys import argv, exit
-from pyindo.compiler import compile_bytecodes
-from pyindo.parser import parse_program
-from bytecode import Bytecode, dump_bytecode, CompilerFlags
+from pyindo.client import request
 from contextlib import redirect_stdout
 from io import StringIO
 
+# The compiler itself is only imported whenever the program is not
+# compiled by the compile server, so the client could start faster
+
 
 def help(exit_code=EX_USAGE) -> None:
     """
@@ -18,6 +20,7 @@ def help(exit_code=EX_USAGE) -> None:
 
     print(
         """\rUsage: python main.py [input file] [options]
+        \r       python main.py serve [socket path]
         \r
         \rWhere `input file` is a file with program written 
         \rin pyindo language inside.
@@ -25,7 +28,24 @@ def help(exit_code=EX_USAGE) -> None:
         \rAvailable options: 
         \r  -O      Enable program optimizations 
         \r  -D      Output python bytecode disassembly result
-        \r          wiht filename: [input file name].pyc"""
+        \r          wiht filename: [input file name].pyc
+        \r  -W, --watch
+        \r          Recompile and rerun the program whenever
+        \r          the input file is changed
+        \r  --profile
+        \r          Sample the running program and write the
+        \r          collapsed stacks (for flamegraph) to a file
+        \r          named: [input file name].folded
+        \r  --coverage
+        \r          Record the lines which are run and write
+        \r          the lcov report to a file named:
+        \r          [input file name].lcov
+        \r
+        \r  -S, --server
+        \r          Compile and run the program by the compile
+        \r          server (see `serve`), which is also used
+        \r          whenever $PYINDO_SOCKET is set, unless -D,
+        \r          -W, --profile or --coverage is used"""
     )
     exit(exit_code)
 
@@ -62,44 +82,215 @@ def parse_argument() -> tuple[str, dict]:
                 enabled_options["optimization"] = True
             case "-D":
                 enabled_options["debug_output"] = True
+            case "-W" | "--watch":
+                enabled_options["watch"] = True
+            case "--profile":
+                enabled_options["profile"] = True
+            case "--coverage":
+                enabled_options["coverage"] = True
+            case "-S" | "--server":
+                enabled_options["server"] = True
             case _:
                 help()
 
     return (f_input, enabled_options)
 
 
-if __name__ == "__main__":
-    if len(argv) < 2:
-        help()
+def compile_program(
+    f_input: str, enabled_options: dict, function_cache=None
+) -> tuple:
+    from pyindo.compiler import compile_bytecodes
+    from pyindo.importer import install
+    from pyindo.parser import parse_program
 
-    # Get the first argument to the program as a file input
-    f_input, enabled_options = parse_argument()
+    # Modules are searched next to the program first
+    install(dirname(abspath(f_input)), "optimization" in enabled_options.keys())
 
     # Read the file input given in the first argument
     with open(f_input, "r") as f:
         f_buffer = f.read() + "\0"
 
-        bytecodes, codechunks = parse_program(f_buffer)
-        compiled_bytecode = compile_bytecodes(bytecodes)
+    bytecodes, codechunks = parse_program(
+        f_buffer, "optimization" in enabled_options.keys(), function_cache
+    )
+    compiled_code = compile_bytecodes(
+        bytecodes,
+        is_optimized="optimization" in enabled_options.keys(),
+        file_name=f_input,
+    )
+
+    return (compiled_code, codechunks)
+
+
+def write_disassembly(f_input: str, compiled_code, codechunks: list):
+    from bytecode import Bytecode, dump_bytecode
+
+    f = StringIO()
+    with redirect_stdout(f):
+        dump_bytecode(Bytecode.from_code(compiled_code), lineno=True)
+
+    disassembly = f.getvalue()
+
+    for chunk in codechunks:
+        f = StringIO()
+        with redirect_stdout(f):
+            dump_bytecode(Bytecode.from_code(chunk), lineno=True)
+
+        disassembly += f"Disassembly of {chunk}:\n"
+        disassembly += f.getvalue()
+
+    open(f_input.replace(".pyind", ".pyc"), "w").write(disassembly)
+
+
+def profile(f_input: str, code) -> None:
+    """
+    Run the program while sampling its stack, then write the
+    samples as collapsed stacks next to the input file
+    """
+
+    from os.path import basename
+    from sys import stderr
+    from pyindo.profiler import SamplingProfiler
+
+    profiler = SamplingProfiler(code, basename(f_input))
+    profiler.start()
+
+    try:
+        exec(code, {"__name__": "__main__"})
+    finally:
+        profiler.stop()
+
+        f_output = f_input.replace(".pyind", ".folded")
+        with open(f_output, "w") as f:
+            f.writelines(f"{stack}\n" for stack in profiler.get_collapsed_stacks())
+
+        print(
+            f"\n[+] {sum(profiler.samples.values())} samples written to {f_output}",
+            file=stderr,
+        )
+
+
+def coverage(f_input: str, code, codechunks: list) -> None:
+    """
+    Run the program while recording the lines being run,
+    then write them as an lcov report next to the input file
+    """
+
+    from sys import stderr
+    from pyindo.coverage import LineCoverage
+
+    line_coverage = LineCoverage(code, codechunks)
+    line_coverage.start()
+
+    try:
+        exec(code, {"__name__": "__main__"})
+    finally:
+        line_coverage.stop()
+
+        f_output = f_input.replace(".pyind", ".lcov")
+        with open(f_output, "w") as f:
+            f.writelines(
+                f"{line}\n" for line in line_coverage.get_lcov_report(abspath(f_input))
+            )
+
+        covered_lines = line_coverage.hit_lines & line_coverage.executable_lines
+        print(
+            f"\n[+] {len(covered_lines)} of {len(line_coverage.executable_lines)} lines covered, written to {f_output}",
+            file=stderr,
+        )
+
+
+def watch(f_input: str, enabled_options: dict) -> None:
+    """
+    Keep on recompiling and running the program whenever the input
+    file is changed, unchanged functions are reused from the cache
+    """
+
+    from pyindo.cache import FunctionCache
+    from pyindo.importer import unload_modules
+    from pyindo.watcher import FileWatcher
+
+    function_cache = FunctionCache()
+    file_watcher = FileWatcher([f_input])
+
+    try:
+        while True:
+            try:
+                compiled_code, codechunks = compile_program(
+                    f_input, enabled_options, function_cache
+                )
 
-        if "optimization" in enabled_options.keys():
-            compiled_bytecode.flags |= CompilerFlags.OPTIMIZED
+                # Every run starts from a clean global scope
+                # and imports the latest version of each module
+                unload_modules()
+                exec(compiled_code, {"__name__": "__main__"})
+
+                if "debug_output" in enabled_options.keys():
+                    write_disassembly(f_input, compiled_code, codechunks)
+            except SystemExit:
+                # Compile error is already shown by the compiler
+                pass
+            except Exception as e:
+                print(f"\n{type(e).__name__}: {e}", end="")
+
+            print(f"\n[+] Waiting for {f_input} to be changed...")
+            file_watcher.wait()
+    except KeyboardInterrupt:
+        file_watcher.close()
+
+
+if __name__ == "__main__":
+    if len(argv) < 2:
+        help()
+
+    if argv[1] == "serve":
+        from pyindo.server import serve
+
+        serve(argv[2] if len(argv) > 2 else None)
+        exit(0)
+
+    if argv[1] == "repl":
+        from pyindo.repl import Repl
+
+        Repl().loop()
+        exit(0)
+
+    # Get the first argument to the program as a file input
+    f_input, enabled_options = parse_argument()
 
-        exec(compiled_bytecode.to_code())
+    if "watch" in enabled_options.keys():
+        watch(f_input, enabled_options)
+        exit(0)
 
-        if "debug_output" in enabled_options.keys():
-            f = StringIO()
-            with redirect_stdout(f):
-                dump_bytecode(compiled_bytecode, lineno=True)
+    # Compile server is only used when it is asked for, so a program is
+    # never compiled by a server which is started by someone else
+    is_server_used = "server" in enabled_options.keys() or "PYINDO_SOCKET" in environ
 
-            disassembly = f.getvalue()
+    if (
+        is_server_used
+        and enabled_options.keys().isdisjoint({"debug_output", "profile", "coverage"})
+        and (
+            response := request(
+                {
+                    "action": "run",
+                    "path": abspath(f_input),
+                    "optimized": "optimization" in enabled_options.keys(),
+                }
+            )
+        )
+    ):
+        header, _ = response
+        print(header["output"], end="")
+        exit(header["exit_code"])
 
-            for chunk in codechunks:
-                f = StringIO()
-                with redirect_stdout(f):
-                    dump_bytecode(Bytecode.from_code(chunk), lineno=True)
+    compiled_code, codechunks = compile_program(f_input, enabled_options)
 
-                disassembly += f"Disassembly of {chunk}:\n" 
-                disassembly += f.getvalue()
+    if "profile" in enabled_options.keys():
+        profile(f_input, compiled_code)
+    elif "coverage" in enabled_options.keys():
+        coverage(f_input, compiled_code, codechunks)
+    else:
+        exec(compiled_code, {"__name__": "__main__"})
 
-            open(f_input.replace(".pyind", ".pyc"), "w").write(disassembly)
+    if "debug_output" in enabled_options.keys():
+        write_disassembly(f_input, compiled_code, codechunks)
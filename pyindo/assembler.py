@@ -0,0 +1,299 @@
+from dis import (
+    EXTENDED_ARG,
+    HAVE_ARGUMENT,
+    hasconst,
+    hasjabs,
+    hasjrel,
+    haslocal,
+    hasname,
+    opmap,
+    stack_effect,
+)
+from types import CodeType
+from typing import Any, List, Tuple
+
+from bytecode import Label
+
+
+# Flags of the code object, the same as the CO_* flags
+CO_OPTIMIZED = 0x0001
+CO_NEWLOCALS = 0x0002
+CO_GENERATOR = 0x0020
+CO_NOFREE = 0x0040
+
+# Instructions which never continue to the next one
+FLOW_ENDING_OPCODES = {
+    opmap["RETURN_VALUE"],
+    opmap["RAISE_VARARGS"],
+    opmap["RERAISE"],
+    opmap["JUMP_FORWARD"],
+    opmap["JUMP_ABSOLUTE"],
+}
+
+GENERATOR_OPCODES = {opmap["YIELD_VALUE"], opmap["YIELD_FROM"]}
+
+JUMP_OPCODES = {*hasjrel, *hasjabs}
+
+# Largest deltas which fit in a single entry of the line table
+MAX_BYTES_DELTA = 254
+MAX_LINE_DELTA = 127
+
+# Every code object is made by replacing the parts of this one
+TEMPLATE_CODE = compile("", "<string>", "exec")
+
+# File name of the code objects which source is not read from a file
+DEFAULT_FILE_NAME = TEMPLATE_CODE.co_filename
+
+
+def get_constant_key(constant: Any) -> tuple:
+    """
+    Key of a constant inside the constant table, equal
+    values of different types (1, 1.0 and True) are kept
+    as different constants just like what python does
+    """
+
+    if isinstance(constant, tuple):
+        return (tuple, tuple(get_constant_key(item) for item in constant))
+    elif isinstance(constant, frozenset):
+        return (frozenset, frozenset(get_constant_key(item) for item in constant))
+    elif isinstance(constant, float):
+        # Keep 0.0 and -0.0 apart, and make nan equal to itself
+        return (float, repr(constant))
+    elif isinstance(constant, CodeType):
+        return (CodeType, id(constant))
+
+    return (type(constant), constant)
+
+
+def get_instruction_size(arg: int) -> int:
+    """
+    Number of code units of an instruction, including
+    the EXTENDED_ARG prefixes needed by its argument
+    """
+
+    if arg > 0xFFFFFF:
+        return 4
+    elif arg > 0xFFFF:
+        return 3
+    elif arg > 0xFF:
+        return 2
+
+    return 1
+
+
+def get_max_stack_size(opcodes: List[int], args: List[int], targets: dict) -> int:
+    """
+    Walk every path of the instructions to find the
+    deepest stack that the code object could ever have
+    """
+
+    depths = [-1] * len(opcodes)
+    pending: List[Tuple[int, int]] = [(0, 0)]
+    max_depth = 0
+
+    while pending:
+        index, depth = pending.pop()
+
+        while index < len(opcodes) and depth > depths[index]:
+            depths[index] = depth
+            opcode, arg = opcodes[index], args[index]
+
+            if opcode in JUMP_OPCODES:
+                jump_depth = depth + stack_effect(opcode, arg, jump=True)
+                max_depth = max(max_depth, jump_depth)
+                pending.append((targets[index], jump_depth))
+
+                depth += stack_effect(opcode, arg, jump=False)
+            else:
+                depth += stack_effect(
+                    opcode, arg if opcode >= HAVE_ARGUMENT else None
+                )
+
+            max_depth = max(max_depth, depth)
+
+            if opcode in FLOW_ENDING_OPCODES:
+                break
+
+            index += 1
+
+    return max_depth
+
+
+def get_line_table(
+    line_numbers: List[int], sizes: List[int], first_line_number: int
+) -> bytes:
+    """
+    Encode the line number of each instruction into the
+    (bytes delta, line delta) pairs used by python 3.10
+    """
+
+    line_table = bytearray()
+    previous_line_number = first_line_number
+
+    index = 0
+    while index < len(line_numbers):
+        # Instructions next to each other on the same line share one range
+        line_number = line_numbers[index]
+        range_size = 0
+        while index < len(line_numbers) and line_numbers[index] == line_number:
+            range_size += sizes[index]
+            index += 1
+
+        line_delta = line_number - previous_line_number
+        previous_line_number = line_number
+
+        while line_delta > MAX_LINE_DELTA:
+            line_table.extend((0, MAX_LINE_DELTA))
+            line_delta -= MAX_LINE_DELTA
+        while line_delta < -MAX_LINE_DELTA:
+            line_table.extend((0, -MAX_LINE_DELTA & 0xFF))
+            line_delta += MAX_LINE_DELTA
+
+        bytes_delta = range_size * 2
+        while bytes_delta > MAX_BYTES_DELTA:
+            line_table.extend((MAX_BYTES_DELTA, line_delta & 0xFF))
+            line_delta = 0
+            bytes_delta -= MAX_BYTES_DELTA
+
+        line_table.extend((bytes_delta, line_delta & 0xFF))
+
+    return bytes(line_table)
+
+
+def assemble(
+    bytecodes: list,
+    name: str = "<module>",
+    argnames: List[str] = [],
+    flags: int = 0,
+    first_line_number: int = 1,
+    file_name: str = DEFAULT_FILE_NAME,
+) -> CodeType:
+    """
+    Assemble the instructions (and labels) of the compiler into a python
+    3.10 code object, the tables are filled in a single pass over the
+    instructions and only the jumps are resolved again until every
+    EXTENDED_ARG prefix they need is known
+    """
+
+    consts: dict = {}
+    const_values: list = []
+    names: dict = {}
+    varnames: dict = {name: index for index, name in enumerate(argnames)}
+
+    opcodes: List[int] = []
+    args: List[int] = []
+    line_numbers: List[int] = []
+    jump_labels: dict = {}
+    label_indexes: dict = {}
+
+    line_number = first_line_number
+    for bytecode in bytecodes:
+        if isinstance(bytecode, Label):
+            label_indexes[id(bytecode)] = len(opcodes)
+            continue
+
+        opcode = opmap[bytecode.name]
+        arg = bytecode.arg
+
+        if opcode in hasconst:
+            key = get_constant_key(arg)
+            if key not in consts:
+                consts[key] = len(const_values)
+                const_values.append(arg)
+
+            arg = consts[key]
+        elif opcode in hasname:
+            arg = names.setdefault(arg, len(names))
+        elif opcode in haslocal:
+            arg = varnames.setdefault(arg, len(varnames))
+        elif opcode in JUMP_OPCODES:
+            jump_labels[len(opcodes)] = arg
+            arg = 0
+        elif opcode < HAVE_ARGUMENT:
+            arg = 0
+        else:
+            arg = int(arg)
+
+        location = bytecode.location
+        if location is not None and location.lineno is not None:
+            line_number = location.lineno
+
+        opcodes.append(opcode)
+        args.append(arg)
+        line_numbers.append(line_number)
+
+    # Index of the instruction each jump is landing on
+    targets = {
+        index: label_indexes[id(label)] for index, label in jump_labels.items()
+    }
+
+    # Sizes could only grow, so keep on resolving
+    # the jumps until none of them is growing again
+    sizes = [get_instruction_size(arg) for arg in args]
+    while True:
+        offsets = [0] * (len(opcodes) + 1)
+        for index, size in enumerate(sizes):
+            offsets[index + 1] = offsets[index] + size
+
+        is_resized = False
+        for index, target in targets.items():
+            arg = (
+                offsets[target] - offsets[index + 1]
+                if opcodes[index] in hasjrel
+                else offsets[target]
+            )
+            args[index] = arg
+
+            if get_instruction_size(arg) > sizes[index]:
+                sizes[index] = get_instruction_size(arg)
+                is_resized = True
+
+        if not is_resized:
+            break
+
+    code = bytearray()
+    for opcode, arg, size in zip(opcodes, args, sizes):
+        for shift in range(8 * (size - 1), 0, -8):
+            code.extend((EXTENDED_ARG, (arg >> shift) & 0xFF))
+
+        code.extend((opcode, arg & 0xFF))
+
+    flags |= CO_NOFREE
+    if any(opcode in GENERATOR_OPCODES for opcode in opcodes):
+        flags |= CO_GENERATOR
+
+    return TEMPLATE_CODE.replace(
+        co_argcount=len(argnames),
+        co_posonlyargcount=0,
+        co_kwonlyargcount=0,
+        co_nlocals=len(varnames),
+        co_stacksize=get_max_stack_size(opcodes, args, targets),
+        co_flags=flags,
+        co_code=bytes(code),
+        co_consts=tuple(const_values),
+        co_names=tuple(names),
+        co_varnames=tuple(varnames),
+        co_freevars=(),
+        co_cellvars=(),
+        co_filename=file_name,
+        co_name=name,
+        co_firstlineno=first_line_number,
+        co_linetable=get_line_table(line_numbers, sizes, first_line_number),
+    )
+
+
+def set_filename(code: CodeType, file_name: str) -> CodeType:
+    """
+    Set the file name of the code object along with every
+    function code object which is declared inside
+    """
+
+    return code.replace(
+        co_filename=file_name,
+        co_consts=tuple(
+            set_filename(constant, file_name)
+            if isinstance(constant, CodeType)
+            else constant
+            for constant in code.co_consts
+        ),
+    )
@@ -0,0 +1,132 @@
+from hashlib import sha256
+from types import CodeType
+from typing import Union
+from bytecode import Instr
+from bytecode.instr import InstrLocation
+
+import re
+
+
+IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Strings and comments, along with the token which closes each of them
+SPAN_CLOSING_TOKENS = {
+    '"""': '"""',
+    '"': '"',
+    "'": "'",
+    "//": "\n",
+    "/*": "*/",
+}
+
+SPAN_TOKEN_RE = re.compile(r'"""|"|\'|//|/\*|[{}]')
+
+
+class FunctionCache:
+    """
+    Compiled bytecodes of each top level function, keyed by the hash of its
+    source and of every function it depends on, so only the function that
+    is changed needs to be parsed again when the program is recompiled
+    """
+
+    def __init__(self):
+        self._entries: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Union[dict, None]:
+        return self._entries.get(key)
+
+    def set(self, key: str, entry: dict) -> None:
+        self._entries[key] = entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def get_function_span_end(program_buffer: str, pos: int) -> int:
+    """
+    Find the position of the curly bracket which closes the body of the
+    function declared at the given position, strings and comments are
+    skipped, returns -1 if the body could not be found
+    """
+
+    depth = 0
+    while match := SPAN_TOKEN_RE.search(program_buffer, pos):
+        token = match.group()
+
+        if token in SPAN_CLOSING_TOKENS:
+            # Jump over the whole string or comment
+            closing_pos = program_buffer.find(SPAN_CLOSING_TOKENS[token], match.end())
+            if closing_pos == -1:
+                return -1
+
+            pos = closing_pos + len(SPAN_CLOSING_TOKENS[token])
+            continue
+
+        depth += 1 if token == "{" else -1
+        if depth == 0:
+            return match.start()
+
+        pos = match.end()
+
+    return -1
+
+
+def get_function_key(
+    function_source: str, dependency_keys: dict, is_optimized: bool
+) -> str:
+    """
+    Hash the function source along with the key of each of the
+    declared functions (or imported modules) that it mentions
+    """
+
+    function_hash = sha256(function_source.encode())
+    function_hash.update(b"O" if is_optimized else b"")
+
+    for identifier in sorted(set(IDENTIFIER_RE.findall(function_source))):
+        if identifier in dependency_keys:
+            function_hash.update(f"{identifier}:{dependency_keys[identifier]}".encode())
+
+    return function_hash.hexdigest()
+
+
+def shift_line_numbers(entry: dict, line_offset: int) -> dict:
+    """
+    Move the cached bytecodes of a function to another line,
+    for when the lines above it are changed
+    """
+
+    if line_offset == 0:
+        return entry
+
+    codechunk = entry["codechunk"]
+    if codechunk:
+        codechunk = codechunk.replace(
+            co_firstlineno=codechunk.co_firstlineno + line_offset
+        )
+
+    bytecodes = []
+    for bytecode in entry["bytecodes"]:
+        if isinstance(bytecode, Instr):
+            bytecode = bytecode.copy()
+
+            if isinstance(bytecode.arg, CodeType) and bytecode.arg is entry["codechunk"]:
+                bytecode.arg = codechunk
+
+            if (location := bytecode.location) and location.lineno is not None:
+                bytecode.location = InstrLocation(
+                    location.lineno + line_offset,
+                    location.end_lineno and location.end_lineno + line_offset,
+                    location.col_offset,
+                    location.end_col_offset,
+                )
+
+        bytecodes.append(bytecode)
+
+    return {
+        **entry,
+        "first_line": entry["first_line"] + line_offset,
+        "bytecodes": bytecodes,
+        "codechunk": codechunk,
+    }
@@ -0,0 +1,215 @@
+from typing import Tuple, Union
+
+from pyindo.types import LiteralString, LocalIdentifier, TypedBytecodes
+
+
+NUMBER_TYPES = ["desimal", "pecahan"]
+
+HASHABLE_TYPES = [*NUMBER_TYPES, "campuran", "boolean"]
+
+ARRAY_TYPE = "himpunan"
+
+DICTIONARY_TYPE = "kamus"
+
+ELEMENTWISE_OPERATIONS = ["+", "-", "*", "/", "%", "**"]
+
+
+def get_operand_type(
+    operand: tuple or list or str, identifier_types: dict
+) -> Union[str, None]:
+    """
+    Get the type of an operand, returns None if
+    the type could not be known at compile time
+    """
+
+    match operand:
+        case TypedBytecodes():
+            return operand.value_type
+        case list(_):
+            return None
+        case (v_value, v_type) if v_type == LocalIdentifier:
+            return identifier_types.get(v_value)
+        case (_, v_type) if v_type == int:
+            return "desimal"
+        case (_, v_type) if v_type == float:
+            return "pecahan"
+        case (_, v_type) if v_type in [str, LiteralString]:
+            return "campuran"
+        case (_, v_type) if v_type == bool:
+            return "boolean"
+        case str(_):
+            return identifier_types.get(operand)
+
+    return None
+
+
+def get_operation_type(
+    l_type: Union[str, None], r_type: Union[str, None], o_type: str
+) -> Union[str, None]:
+    """
+    Get the type of the result of an operation
+    based on the type of both of its operands
+    """
+
+    if o_type in ELEMENTWISE_OPERATIONS and (
+        is_number_array(l_type) or is_number_array(r_type)
+    ):
+        element_type = get_operation_type(
+            get_element_type(l_type) if is_number_array(l_type) else l_type,
+            get_element_type(r_type) if is_number_array(r_type) else r_type,
+            o_type,
+        )
+
+        return f"{ARRAY_TYPE}<{element_type}>" if element_type else None
+
+    match o_type:
+        case "==" | "!=" | ">" | "<" | ">=" | "<=" | "didalam":
+            return "boolean"
+        case "&&" | "||":
+            return l_type if l_type == r_type else None
+        case "/":
+            if l_type in NUMBER_TYPES and r_type in NUMBER_TYPES:
+                return "pecahan"
+        case "**":
+            # A negative exponent makes even an integer power a float, the
+            # caller could narrow it down once the exponent is known
+            if l_type in NUMBER_TYPES and r_type in NUMBER_TYPES:
+                return "pecahan"
+        case "+" | "-" | "*" | "%":
+            if l_type in NUMBER_TYPES and r_type in NUMBER_TYPES:
+                return "desimal" if l_type == r_type == "desimal" else "pecahan"
+
+            if o_type == "+" and l_type == r_type == "campuran":
+                return "campuran"
+
+            if o_type == "*" and {l_type, r_type} == {"campuran", "desimal"}:
+                return "campuran"
+        case "&" | "|" | "<<" | ">>":
+            if l_type == r_type == "desimal":
+                return "desimal"
+
+    return None
+
+
+def split_container_type(value_type: Union[str, None]) -> Tuple[Union[str, None], list]:
+    """
+    Split a container type such as `kamus<campuran,himpunan<desimal>>`
+    into its container name and the types of its content
+    """
+
+    if value_type is None or "<" not in value_type or not value_type.endswith(">"):
+        return (value_type, [])
+
+    container_type = value_type[: value_type.index("<")]
+
+    content_types = [""]
+    angle_bracket_depth = 0
+    for char in value_type[len(container_type) + 1 : -1]:
+        if char == "," and angle_bracket_depth == 0:
+            content_types.append("")
+            continue
+
+        if char == "<":
+            angle_bracket_depth += 1
+        elif char == ">":
+            angle_bracket_depth -= 1
+
+        content_types[-1] += char
+
+    return (container_type, content_types)
+
+
+def get_element_type(container_type: Union[str, None]) -> Union[str, None]:
+    """
+    Get the type of each element of a container such as `desimal`
+    from `himpunan<desimal>` or `kamus<campuran,desimal>`, returns
+    None if it is not a container or the type is unknown
+    """
+
+    if container_type == "campuran":
+        return "campuran"
+
+    match split_container_type(container_type):
+        case (container, [element_type]) if container == ARRAY_TYPE:
+            return element_type
+        case (container, [_, element_type]) if container == DICTIONARY_TYPE:
+            return element_type
+        case (container, _) if container in [ARRAY_TYPE, DICTIONARY_TYPE]:
+            return "apapun"
+
+    return None
+
+
+def is_array_type(value_type: Union[str, None]) -> bool:
+    return split_container_type(value_type)[0] == ARRAY_TYPE
+
+
+def is_number_array(value_type: Union[str, None]) -> bool:
+    return is_array_type(value_type) and get_element_type(value_type) in NUMBER_TYPES
+
+
+def get_common_type(value_types: list) -> str:
+    """
+    Get a type which could hold every one of the given types
+    """
+
+    if len(value_types) > 0 and all(
+        value_type == value_types[0] for value_type in value_types
+    ):
+        if value_types[0] is not None:
+            return value_types[0]
+
+    if len(value_types) > 0 and all(
+        value_type in NUMBER_TYPES for value_type in value_types
+    ):
+        return "pecahan"
+
+    return "apapun"
+
+
+def get_array_type(element_types: list) -> str:
+    """
+    Get the type of an array literal based on the type of its elements
+    """
+
+    return f"{ARRAY_TYPE}<{get_common_type(element_types)}>"
+
+
+def get_dictionary_type(key_types: list, element_types: list) -> str:
+    """
+    Get the type of a dictionary literal based on
+    the type of its keys and the type of its elements
+    """
+
+    return (
+        f"{DICTIONARY_TYPE}<{get_common_type(key_types)},"
+        f"{get_common_type(element_types)}>"
+    )
+
+
+def is_assignable(value_type: Union[str, None], declared_type: Union[str, None]) -> bool:
+    """
+    Check whether a value of a type could be
+    stored inside an identifier of a declared type
+    """
+
+    if value_type is None or declared_type in [None, "apapun"]:
+        return True
+
+    if value_type == declared_type:
+        return True
+
+    value_container, value_content = split_container_type(value_type)
+    declared_container, declared_content = split_container_type(declared_type)
+    if value_container in [ARRAY_TYPE, DICTIONARY_TYPE]:
+        # Container is assignable whenever each of its content is
+        return value_container == declared_container and all(
+            value_content_type == "apapun"
+            or is_assignable(value_content_type, declared_content_type)
+            for value_content_type, declared_content_type in zip(
+                value_content, declared_content
+            )
+        )
+
+    # Integer could always be used as a float
+    return value_type == "desimal" and declared_type == "pecahan"
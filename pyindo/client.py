@@ -0,0 +1,78 @@
+from os import environ, getuid
+from os.path import join
+from socket import AF_UNIX, SOCK_STREAM, socket
+from struct import pack, unpack
+from tempfile import gettempdir
+from typing import Tuple, Union
+
+import json
+
+
+# Each message is a json header followed by a binary
+# body, both of them are prefixed by their length
+MESSAGE_LENGTH_FORMAT = "!I"
+MESSAGE_LENGTH_SIZE = 4
+
+
+def get_socket_path() -> str:
+    return environ.get(
+        "PYINDO_SOCKET", join(gettempdir(), f"pyindo-{getuid()}.sock")
+    )
+
+
+def receive_exactly(connection: socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection is closed before the message is complete")
+
+        data += chunk
+
+    return data
+
+
+def send_message(connection: socket, header: dict, body: bytes = b"") -> None:
+    header_data = json.dumps(header).encode()
+    connection.sendall(
+        pack(MESSAGE_LENGTH_FORMAT, len(header_data))
+        + header_data
+        + pack(MESSAGE_LENGTH_FORMAT, len(body))
+        + body
+    )
+
+
+def receive_message(connection: socket) -> Tuple[dict, bytes]:
+    (header_length,) = unpack(
+        MESSAGE_LENGTH_FORMAT, receive_exactly(connection, MESSAGE_LENGTH_SIZE)
+    )
+    header = json.loads(receive_exactly(connection, header_length))
+
+    (body_length,) = unpack(
+        MESSAGE_LENGTH_FORMAT, receive_exactly(connection, MESSAGE_LENGTH_SIZE)
+    )
+    body = receive_exactly(connection, body_length)
+
+    return (header, body)
+
+
+def request(
+    header: dict, body: bytes = b"", socket_path: Union[str, None] = None
+) -> Union[Tuple[dict, bytes], None]:
+    """
+    Send a request to the compile server, returns None if there
+    is no server running (or it is gone before responding) so the
+    caller could compile the program by itself instead
+    """
+
+    with socket(AF_UNIX, SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path or get_socket_path())
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+
+        try:
+            send_message(connection, header, body)
+            return receive_message(connection)
+        except (ConnectionError, EOFError):
+            return None
@@ -1,11 +1,70 @@
 from types import CodeType
 from typing import Tuple, Union
-from bytecode import Compare, Instr, Bytecode, Label
-
-from pyindo.types import LiteralString
+from bytecode import Compare, Instr, Label
+from bytecode.instr import InstrLocation
+
+from pyindo.assembler import (
+    CO_NEWLOCALS,
+    CO_OPTIMIZED,
+    DEFAULT_FILE_NAME,
+    assemble,
+    set_filename,
+)
+from pyindo.checker import (
+    ELEMENTWISE_OPERATIONS,
+    HASHABLE_TYPES,
+    NUMBER_TYPES,
+    is_number_array,
+)
+from pyindo.types import LiteralString, LocalIdentifier
 
 import re
 import codecs
+import operator
+
+
+# Maximum number of instructions inside a function
+# body for it to be inlined at its call sites
+INLINE_INSTRUCTION_LIMIT = 32
+
+# Maximum right operand of a power or shift operation
+# on literals which is still computed at compile time
+FOLD_OPERAND_LIMIT = 64
+
+# Typecode of the contiguous array used to keep himpunan of numbers,
+# himpunan of any other element type is kept inside a deque instead
+ARRAY_TYPECODES = {
+    "desimal": "q",
+    "pecahan": "d",
+}
+
+FOLDABLE_OPERATIONS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "**": operator.pow,
+    "&": operator.and_,
+    "|": operator.or_,
+    "<<": operator.lshift,
+    ">>": operator.rshift,
+}
+
+
+# Functions of pyindo.stdlib which could be called without being
+# declared first, along with the type of the value they return
+BUILTIN_FUNCTIONS = {
+    "baca_baris": "apapun",
+    "baca_potongan": "apapun",
+    "hitung_baris": "desimal",
+    "salin_berkas": "desimal",
+    "buka_penulis": "apapun",
+    "tulis": None,
+    "tutup": None,
+    "rentang": "apapun",
+    "statistik_ingatan": "apapun",
+}
 
 
 def decode_escapes(s):
@@ -36,6 +95,10 @@ def load_const_or_name(data: tuple or str) -> Instr:
                 return Instr("LOAD_CONST", float(v_value))
             case (v_value, v_type) if v_type == str:
                 return Instr("LOAD_CONST", str(v_value))
+            case (v_value, v_type) if v_type == LiteralString:
+                return Instr("LOAD_CONST", decode_escapes(v_value))
+            case (v_value, v_type) if v_type == LocalIdentifier:
+                return Instr("LOAD_FAST", v_value)
             case (v_value, v_type) if v_type == bool:
                 if v_value in ["benar", "BENAR"]:
                     return Instr("LOAD_CONST", True)
@@ -49,39 +112,94 @@ def load_const_or_name(data: tuple or str) -> Instr:
         print("TODO: Compiler error")
 
 
+def load_operand(operand: tuple or list or str) -> list:
+    if isinstance(operand, list):
+        # Operand is an already evaluated expression
+        return operand
+
+    return [load_const_or_name(operand)]
+
+
 def bool_operation(
-    l_operand: tuple or list or str, r_operand: tuple or str or None, o_type: str
+    l_operand: tuple or list or str, r_operand: tuple or list or str, o_type: str
 ) -> list:
     bytecodes = []
+    end_label = Label()
 
-    if isinstance(l_operand, tuple) or isinstance(l_operand, str):
-        bytecodes.append(load_const_or_name(l_operand))
-    else:
-        bytecodes.extend(l_operand)
-
-    if r_operand:
-        bytecodes.append(load_const_or_name(r_operand))
+    bytecodes.extend(load_operand(l_operand))
 
+    # Only evaluate the right operand whenever the left one
+    # could not decide the result of the whole operation
     match o_type:
         case "&&":
-            print("TODO: Implement the && bool operation")
+            bytecodes.append(Instr("JUMP_IF_FALSE_OR_POP", end_label))
         case "||":
-            print("TODO: Implement the || bool operation")
+            bytecodes.append(Instr("JUMP_IF_TRUE_OR_POP", end_label))
+
+    bytecodes.extend(load_operand(r_operand))
+    bytecodes.append(end_label)
 
     return bytecodes
 
 
+def fold_constants(
+    l_operand: tuple or list or str, r_operand: tuple or list or str, o_type: str
+) -> Union[tuple, None]:
+    """
+    Compute an operation of two number literals at compile time, returns
+    None if it could not be done without changing the program behavior
+    """
+
+    operands = []
+    for operand in [l_operand, r_operand]:
+        match operand:
+            case (v_value, v_type) if v_type in [int, float]:
+                operands.append(v_type(v_value))
+            case _:
+                return None
+
+    l_value, r_value = operands
+    if o_type in ["**", "<<"] and abs(r_value) > FOLD_OPERAND_LIMIT:
+        return None
+
+    try:
+        value = FOLDABLE_OPERATIONS[o_type](l_value, r_value)
+    except (ArithmeticError, TypeError, ValueError):
+        # Let the error happen when the program is running instead
+        return None
+
+    if not isinstance(value, (int, float)):
+        return None
+
+    return (value, type(value))
+
+
 def math_operation(
-    l_operand: tuple or list or str, r_operand: tuple or str or None, o_type: str
+    l_operand: tuple or list or str,
+    r_operand: tuple or list or str or None,
+    o_type: str,
+    l_type: Union[str, None] = None,
+    r_type: Union[str, None] = None,
 ) -> list:
     bytecodes = []
-    if isinstance(l_operand, tuple) or isinstance(l_operand, str):
-        bytecodes.append(load_const_or_name(l_operand))
-    else:
-        bytecodes.extend(l_operand)
+
+    if o_type in ELEMENTWISE_OPERATIONS and (
+        is_number_array(l_type) or is_number_array(r_type)
+    ):
+        return elementwise_operation(l_operand, r_operand, o_type)
+
+    bytecodes.extend(load_operand(l_operand))
+
+    match (o_type, r_operand):
+        case ("**", (v_value, v_type)) if (
+            l_type in NUMBER_TYPES and v_type == int and int(v_value) == 2
+        ):
+            # Squaring a number is a lot faster with a multiplication
+            bytecodes.extend([Instr("DUP_TOP"), Instr("BINARY_MULTIPLY")])
+            return bytecodes
 
     if r_operand:
-        bytecodes.append(load_const_or_name(r_operand))
+        bytecodes.extend(load_operand(r_operand))
 
     match o_type:
         case "+":
@@ -110,18 +228,62 @@ def math_operation(
     return bytecodes
 
 
+def elementwise_operation(
+    l_operand: tuple or list or str, r_operand: tuple or list or str, o_type: str
+) -> list:
+    """
+    Compute an operation on himpunan of numbers with a single call
+    to the runtime kernel instead of looping through each element
+    """
+
+    return [
+        *import_from("pyindo.runtime", "elementwise"),
+        Instr("LOAD_CONST", o_type),
+        *load_operand(l_operand),
+        *load_operand(r_operand),
+        Instr("CALL_FUNCTION", 3),
+    ]
+
+
+def get_constant_elements(operand: tuple or list or str) -> Union[tuple, None]:
+    """
+    Get the elements of an array literal which only contains
+    constants, returns None if the operand is not such literal
+    """
+
+    match operand:
+        case [
+            Instr(name="BUILD_LIST"),
+            Instr(name="LOAD_CONST", arg=tuple() as constants),
+            Instr(name="LIST_EXTEND"),
+        ]:
+            return constants
+
+    return None
+
+
 def comparison(
-    l_operand: tuple or list or str, r_operand: tuple or str or None, c_type: str
+    l_operand: tuple or list or str,
+    r_operand: tuple or list or str or None,
+    c_type: str,
+    l_type: Union[str, None] = None,
 ) -> list:
     bytecodes = []
 
-    if isinstance(l_operand, tuple) or isinstance(l_operand, str):
-        bytecodes.append(load_const_or_name(l_operand))
-    else:
-        bytecodes.extend(l_operand)
+    if c_type == "didalam" and (constants := get_constant_elements(r_operand)):
+        # Membership against a constant literal never needs to build the
+        # literal, a hashable value could even be looked up in a set
+        r_operand = [
+            Instr(
+                "LOAD_CONST",
+                frozenset(constants) if l_type in HASHABLE_TYPES else constants,
+            )
+        ]
+
+    bytecodes.extend(load_operand(l_operand))
 
     if r_operand:
-        bytecodes.append(load_const_or_name(r_operand))
+        bytecodes.extend(load_operand(r_operand))
 
     match c_type:
         case "==":
@@ -136,49 +298,86 @@ def comparison(
             bytecodes.append(Instr("COMPARE_OP", Compare.GE))
         case "<=":
             bytecodes.append(Instr("COMPARE_OP", Compare.LE))
+        case "didalam":
+            bytecodes.append(Instr("CONTAINS_OP", 0))
 
     return bytecodes
 
 
-def condition(
-    expressions: list,
-    statements: list,
-    other_statements: list,
-    c_type: str,
-    jump_label: Union[Label, None],
-    condition_label: Union[Label, None],
+def fuse_condition_jumps(
+    expressions: list, false_label: Label, true_label: Label
 ) -> list:
-    bytecodes = []
+    """
+    Replace the short-circuit jumps that land right at the end of a
+    boolean expression with direct jumps to the branch targets, as the
+    value of the expression is only consumed by the branch itself
+    """
 
-    match c_type:
-        case "selainnya":
-            bytecodes.extend(statements)
-        case "selainnya jika" | "jika":
-            bytecodes.extend(expressions)
+    trailing_labels = []
+    for bytecode in expressions[::-1]:
+        if not isinstance(bytecode, Label):
+            break
+
+        trailing_labels.append(bytecode)
+
+    bytecodes = []
+    for bytecode in expressions:
+        if isinstance(bytecode, Instr) and any(
+            bytecode.arg is label for label in trailing_labels
+        ):
+            match bytecode.name:
+                case "JUMP_IF_FALSE_OR_POP":
+                    bytecode = Instr(
+                        "POP_JUMP_IF_FALSE", false_label, lineno=bytecode.lineno
+                    )
+                case "JUMP_IF_TRUE_OR_POP":
+                    bytecode = Instr(
+                        "POP_JUMP_IF_TRUE", true_label, lineno=bytecode.lineno
+                    )
+
+        bytecodes.append(bytecode)
 
-            if condition_label:
-                bytecodes.append(Instr("POP_JUMP_IF_FALSE", condition_label))
+    return bytecodes
 
-            bytecodes.extend(statements)
 
-            if jump_label:
-                bytecodes.append(Instr("JUMP_FORWARD", jump_label))
+def define_condition_header(expressions: list, false_label: Label) -> list:
+    """
+    Evaluate the condition of a branch, jump to
+    the given label whenever it is not fulfilled
+    """
 
-            bytecodes.extend(other_statements)
+    statements_label = Label()
+    bytecodes = fuse_condition_jumps(expressions, false_label, statements_label)
+    bytecodes.extend(
+        [
+            Instr("POP_JUMP_IF_FALSE", false_label),
+            statements_label,
+        ]
+    )
 
     return bytecodes
 
 
-def format_print(args: list, line_number: int, is_global_scope: bool) -> list:
+def define_condition_tail(
+    false_label: Union[Label, None], end_label: Label, is_last_branch: bool
+) -> list:
     bytecodes = []
 
-    bytecodes.append(
-        Instr(
-            "LOAD_NAME" if is_global_scope else "LOAD_GLOBAL",
-            "print",
-            lineno=line_number,
-        )
-    )
+    if not is_last_branch:
+        # Skip the other branches of the chain
+        bytecodes.append(Instr("JUMP_FORWARD", end_label))
+
+    if false_label:
+        bytecodes.append(false_label)
+
+    if is_last_branch:
+        bytecodes.append(end_label)
+
+    return bytecodes
+
+
+def format_string(args: list) -> list:
+    bytecodes = []
 
     computed_args_len = 0
     for arg in args:
@@ -186,14 +385,45 @@ def format_print(args: list, line_number: int, is_global_scope: bool) -> list:
             case (v_value, v_type) if v_type == LiteralString:
                 bytecodes.append(Instr("LOAD_CONST", decode_escapes(v_value)))
                 computed_args_len += 1
-            case list(_) as arg_bytecodes if len(arg_bytecodes) > 0:
-                bytecodes.extend(arg)
+            case list(_) as arg_bytecodes if len(arg_bytecodes) == 0:
+                pass
+            case (v_value, v_type) if v_type == str:
+                # Only a constant is surely a string, the declared type of any
+                # other value is not checked once the program is running
+                bytecodes.append(Instr("LOAD_CONST", str(v_value)))
+                computed_args_len += 1
+            case _:
+                bytecodes.extend(load_operand(arg))
                 bytecodes.append(Instr("FORMAT_VALUE", 0))
                 computed_args_len += 1
 
+    bytecodes.append(Instr("BUILD_STRING", computed_args_len))
+
+    return bytecodes
+
+
+def load_expression(expressions: list) -> list:
+    if len(expressions) == 1:
+        return load_operand(expressions[0])
+
+    # Expression with several segments could only came from a format string
+    return format_string(expressions)
+
+
+def format_print(args: list, line_number: int, is_global_scope: bool) -> list:
+    bytecodes = []
+
+    bytecodes.append(
+        Instr(
+            "LOAD_NAME" if is_global_scope else "LOAD_GLOBAL",
+            "print",
+            lineno=line_number,
+        )
+    )
+
+    bytecodes.extend(format_string(args))
     bytecodes.extend(
         [
-            Instr("BUILD_STRING", computed_args_len),
             Instr("LOAD_CONST", ""),
             Instr("LOAD_CONST", ("end",)),
             Instr("CALL_FUNCTION_KW", 2),
@@ -205,34 +435,437 @@ def format_print(args: list, line_number: int, is_global_scope: bool) -> list:
 
 
 def call_function(
-    function_name: str, function_params: list, line_number: int, is_global_scope: bool
+    function_name: str,
+    function_args: list,
+    line_number: int,
+    is_global_scope: bool,
+    is_statement: bool = True,
 ) -> list:
     bytecodes = []
 
     match function_name:
         case "tampilkan":
-            bytecodes = format_print(function_params, line_number, is_global_scope)
+            bytecodes = format_print(
+                [expression for arg in function_args for expression in arg],
+                line_number,
+                is_global_scope,
+            )
             return bytecodes
 
-    bytecodes.append(Instr("LOAD_NAME", function_name))
+        case _ if function_name in BUILTIN_FUNCTIONS:
+            bytecodes.extend(import_from("pyindo.stdlib", function_name))
+
+        case _:
+            bytecodes.append(
+                Instr("LOAD_NAME" if is_global_scope else "LOAD_GLOBAL", function_name)
+            )
+
+    for arg in function_args:
+        bytecodes.extend(load_expression(arg))
+
+    bytecodes.append(Instr("CALL_FUNCTION", len(function_args)))
+
+    if is_statement:
+        # Return value of the function is not used by anything
+        bytecodes.append(Instr("POP_TOP"))
+
+    return bytecodes
+
+
+def import_from(module_name: str, name: str) -> list:
+    return [
+        Instr("LOAD_CONST", 0),
+        Instr("LOAD_CONST", (name,)),
+        Instr("IMPORT_NAME", module_name),
+        Instr("IMPORT_FROM", name),
+        Instr("ROT_TWO"),
+        Instr("POP_TOP"),
+    ]
+
+
+def define_import(module_name: str, names: list) -> list:
+    bytecodes = [
+        Instr("LOAD_CONST", 0),
+        Instr("LOAD_CONST", tuple(names)),
+        Instr("IMPORT_NAME", module_name),
+    ]
+    for name in names:
+        bytecodes.extend([Instr("IMPORT_FROM", name), Instr("STORE_NAME", name)])
+
+    bytecodes.append(Instr("POP_TOP"))
+    return bytecodes
+
+
+def is_constant_expression(expressions: list) -> bool:
+    return (
+        len(expressions) == 1
+        and isinstance(expressions[0], tuple)
+        and expressions[0][1] in [int, float, bool, str, LiteralString]
+    )
+
+
+def define_array(elements: list) -> list:
+    if len(elements) > 0 and all(
+        is_constant_expression(element) for element in elements
+    ):
+        # Constant elements are loaded at once as a tuple
+        return [
+            Instr("BUILD_LIST", 0),
+            Instr(
+                "LOAD_CONST",
+                tuple(load_const_or_name(element[0]).arg for element in elements),
+            ),
+            Instr("LIST_EXTEND", 1),
+        ]
+
+    bytecodes = []
+    for element in elements:
+        bytecodes.extend(load_expression(element))
+
+    bytecodes.append(Instr("BUILD_LIST", len(elements)))
+
+    return bytecodes
+
+
+def define_dictionary(keys: list, elements: list) -> list:
+    bytecodes = []
+
+    if len(keys) > 0 and all(is_constant_expression(key) for key in keys):
+        # Constant keys are loaded at once as a tuple
+        for element in elements:
+            bytecodes.extend(load_expression(element))
 
-    if len(function_params) > 0:
         bytecodes.extend(
             [
-                # TODO:
-                # Add function params bytecode to the function call
-                # if there are any
+                Instr(
+                    "LOAD_CONST", tuple(load_const_or_name(key[0]).arg for key in keys)
+                ),
+                Instr("BUILD_CONST_KEY_MAP", len(keys)),
             ]
         )
 
-    bytecodes.extend(
-        [
-            Instr("CALL_FUNCTION", 0),
-            Instr("POP_TOP"),
-            Instr("LOAD_CONST", None),
-            Instr("RETURN_VALUE"),
+        return bytecodes
+
+    for key, element in zip(keys, elements):
+        bytecodes.extend(load_expression(key))
+        bytecodes.extend(load_expression(element))
+
+    bytecodes.append(Instr("BUILD_MAP", len(keys)))
+
+    return bytecodes
+
+
+def define_array_storage(bytecodes: list, element_type: Union[str, None]) -> list:
+    """
+    Convert a himpunan into the storage picked from its element type, numbers
+    are kept inside a contiguous typed array and any other elements are kept
+    inside a deque so removing the first element does not shift the others
+    """
+
+    match bytecodes:
+        case [
+            Instr(name="BUILD_LIST"),
+            Instr(name="LOAD_CONST") as constants,
+            Instr(name="LIST_EXTEND"),
+        ]:
+            # Fill the storage directly from the constant elements
+            bytecodes = [constants]
+
+    if element_type in ARRAY_TYPECODES:
+        return [
+            *import_from("pyindo.runtime", "number_array"),
+            Instr("LOAD_CONST", ARRAY_TYPECODES[element_type]),
+            *bytecodes,
+            Instr("CALL_FUNCTION", 2),
         ]
-    )
+
+    return [
+        *import_from("pyindo.runtime", "ElementDeque"),
+        *bytecodes,
+        Instr("CALL_FUNCTION", 1),
+    ]
+
+
+def subscript(container: tuple or list or str, index: list) -> list:
+    return [
+        *load_operand(container),
+        *load_expression(index),
+        Instr("BINARY_SUBSCR"),
+    ]
+
+
+def define_subscript_assignment(
+    container: list, index: list, expressions: list
+) -> list:
+    return [
+        *load_expression(expressions),
+        *load_expression(container),
+        *load_expression(index),
+        Instr("STORE_SUBSCR"),
+    ]
+
+
+def define_number_element_assignment(
+    identifier: tuple or str, index: list, expressions: list
+) -> list:
+    """
+    Store an element of a himpunan of integers, the himpunan is stored
+    back into its identifier as it is turned into a list whenever the
+    element does not fit in its typed array
+    """
+
+    return [
+        *import_from("pyindo.runtime", "store_element"),
+        *load_operand(identifier),
+        *load_expression(index),
+        *load_expression(expressions),
+        Instr("CALL_FUNCTION", 3),
+        *store_identifier(identifier),
+    ]
+
+
+def define_subscript_deletion(container: list, index: list) -> list:
+    return [
+        *load_expression(container),
+        *load_expression(index),
+        Instr("DELETE_SUBSCR"),
+    ]
+
+
+def define_deletion(identifier: tuple or str) -> list:
+    match identifier:
+        case (v_value, v_type) if v_type == LocalIdentifier:
+            return [Instr("DELETE_FAST", v_value)]
+        case str(_):
+            return [Instr("DELETE_NAME", identifier)]
+
+    return []
+
+
+def store_identifier(identifier: tuple or str) -> list:
+    match identifier:
+        case (v_value, v_type) if v_type == LocalIdentifier:
+            return [Instr("STORE_FAST", v_value)]
+        case str(_):
+            return [Instr("STORE_NAME", identifier)]
+
+    return []
+
+
+def define_assignment(identifier: tuple or str, expressions: list) -> list:
+    bytecodes = []
+
+    if len(expressions) > 0:
+        bytecodes.extend(load_expression(expressions))
+    else:
+        bytecodes.append(Instr("LOAD_CONST", None))
+
+    bytecodes.extend(store_identifier(identifier))
+
+    return bytecodes
+
+
+def define_store(identifier: tuple or str) -> list:
+    match identifier:
+        case (v_value, v_type) if v_type == LocalIdentifier:
+            return [Instr("STORE_FAST", v_value)]
+        case str(_):
+            return [Instr("STORE_NAME", identifier)]
+
+    return []
+
+
+def define_loop_header(
+    identifier: tuple or str, expressions: list, start_label: Label, end_label: Label
+) -> list:
+    """
+    Take the elements of the iterable one at a time, so a generator
+    or a range is never turned into a whole himpunan first
+    """
+
+    return [
+        *load_expression(expressions),
+        Instr("GET_ITER"),
+        start_label,
+        Instr("FOR_ITER", end_label),
+        *define_store(identifier),
+    ]
+
+
+def define_loop_tail(start_label: Label, end_label: Label) -> list:
+    return [Instr("JUMP_ABSOLUTE", start_label), end_label]
+
+
+def define_loop_break(end_label: Label) -> list:
+    # Iterator of the loop is still on top of the stack
+    return [Instr("POP_TOP"), Instr("JUMP_ABSOLUTE", end_label)]
+
+
+def define_loop_continue(start_label: Label) -> list:
+    return [Instr("JUMP_ABSOLUTE", start_label)]
+
+
+def define_yield(expressions: list) -> list:
+    bytecodes = []
+
+    if len(expressions) > 0:
+        bytecodes.extend(load_expression(expressions))
+    else:
+        bytecodes.append(Instr("LOAD_CONST", None))
+
+    bytecodes.extend([Instr("YIELD_VALUE"), Instr("POP_TOP")])
+
+    return bytecodes
+
+
+def define_return(expressions: list) -> list:
+    bytecodes = []
+
+    if len(expressions) > 0:
+        bytecodes.extend(load_expression(expressions))
+    else:
+        bytecodes.append(Instr("LOAD_CONST", None))
+
+    bytecodes.append(Instr("RETURN_VALUE"))
+
+    return bytecodes
+
+
+def define_tail_call(
+    expressions: list,
+    function_name: str,
+    function_params: list,
+    entry_label: Label,
+) -> Union[list, None]:
+    """
+    Compile `hasilkan` of a call to the function itself into
+    a rebind of its parameters and a jump back to its entry,
+    returns None if the expression is not a self tail call
+    """
+
+    if len(expressions) != 1 or not isinstance(expressions[0], list):
+        return None
+
+    call_bytecodes = expressions[0]
+    if (
+        len(call_bytecodes) < 2
+        or not isinstance(call_bytecodes[0], Instr)
+        or not isinstance(call_bytecodes[-1], Instr)
+        or call_bytecodes[0].name != "LOAD_GLOBAL"
+        or call_bytecodes[0].arg != function_name
+        or call_bytecodes[-1].name != "CALL_FUNCTION"
+        or call_bytecodes[-1].arg != len(function_params)
+    ):
+        return None
+
+    # Every argument is evaluated before any parameter is rebound
+    bytecodes = [*call_bytecodes[1:-1]]
+    for param in function_params[::-1]:
+        bytecodes.append(Instr("STORE_FAST", param["name"]))
+
+    bytecodes.append(Instr("JUMP_ABSOLUTE", entry_label))
+
+    return bytecodes
+
+
+def define_inline_bytecodes(function_bytecodes: dict) -> Union[list, None]:
+    """
+    Get the body of a small leaf function so it could be inlined at
+    its call sites, returns None if the function should not be inlined
+    """
+
+    bytecodes = [*function_bytecodes["content"]]
+    if (
+        len(bytecodes) == 0
+        or not isinstance(bytecodes[-1], Instr)
+        or bytecodes[-1].name != "RETURN_VALUE"
+    ):
+        bytecodes.extend(function_bytecodes["tail"][0])
+
+    instructions = [bytecode for bytecode in bytecodes if isinstance(bytecode, Instr)]
+    if len(instructions) > INLINE_INSTRUCTION_LIMIT:
+        return None
+
+    for instruction in instructions:
+        if (
+            instruction.name.startswith("CALL_")
+            or instruction.name in ["GET_ITER", "FOR_ITER", "YIELD_VALUE"]
+            or instruction.arg is function_bytecodes["entry"]
+        ):
+            # Not a leaf function or it could not be
+            # placed inside an expression of other function
+            return None
+
+    return bytecodes
+
+
+def define_inline_call(
+    function_name: str,
+    function_args: list,
+    function_params: list,
+    function_body: list,
+    is_module_scope: bool,
+    is_statement: bool = True,
+) -> list:
+    """
+    Place the body of a function directly at its call site, the function
+    locals are renamed with the function name as their prefix
+    """
+
+    bytecodes = []
+    end_label = Label()
+    labels = {}
+
+    local_names = {
+        "LOAD_FAST": "LOAD_NAME" if is_module_scope else "LOAD_FAST",
+        "STORE_FAST": "STORE_NAME" if is_module_scope else "STORE_FAST",
+        "DELETE_FAST": "DELETE_NAME" if is_module_scope else "DELETE_FAST",
+    }
+    store_name = local_names["STORE_FAST"]
+
+    for arg in function_args:
+        bytecodes.extend(load_expression(arg))
+
+    for param in function_params[::-1]:
+        bytecodes.append(Instr(store_name, f"{function_name}.{param['name']}"))
+
+    for bytecode in function_body:
+        if isinstance(bytecode, Label):
+            bytecodes.append(labels.setdefault(bytecode, Label()))
+            continue
+
+        match bytecode.name:
+            case "RETURN_VALUE":
+                bytecodes.append(
+                    Instr("JUMP_FORWARD", end_label, lineno=bytecode.lineno)
+                )
+            case "LOAD_FAST" | "STORE_FAST" | "DELETE_FAST" as instr_name:
+                bytecodes.append(
+                    Instr(
+                        local_names[instr_name],
+                        f"{function_name}.{bytecode.arg}",
+                        lineno=bytecode.lineno,
+                    )
+                )
+            case _ if isinstance(bytecode.arg, Label):
+                bytecodes.append(
+                    Instr(
+                        bytecode.name,
+                        labels.setdefault(bytecode.arg, Label()),
+                        lineno=bytecode.lineno,
+                    )
+                )
+            case _:
+                bytecodes.append(bytecode.copy())
+
+    if bytecodes[-1].name == "JUMP_FORWARD" and bytecodes[-1].arg is end_label:
+        # Last return could just continue to the end of the function body
+        bytecodes.pop()
+
+    bytecodes.append(end_label)
+
+    if is_statement:
+        bytecodes.append(Instr("POP_TOP"))
 
     return bytecodes
 
@@ -242,6 +875,7 @@ def define_function_content(
     function_bytecodes: dict,
     is_entrypoint_function: bool,
     line_number: int,
+    memo_size: Union[int, None] = None,
 ) -> Tuple[list, CodeType]:
     bytecodes = []
     bytecode_codechunk = None
@@ -249,13 +883,9 @@ def define_function_content(
     if is_entrypoint_function:
         # Function content definition for entrypoint
         tail_bytecodes, tail_label = function_bytecodes["tail"]
-        bytecodes.extend(
-            [
-                *function_bytecodes["header"],
-                Instr("POP_JUMP_IF_FALSE", tail_label),
-                *function_bytecodes["content"],
-            ]
-        )
+        bytecodes.extend(function_bytecodes["header"])
+        bytecodes.append(Instr("POP_JUMP_IF_FALSE", tail_label))
+        bytecodes.extend(function_bytecodes["content"])
 
         if len(function_bytecodes["content"]) > 0 and isinstance(
             function_bytecodes["content"][-1], Label
@@ -268,10 +898,28 @@ def define_function_content(
         if function_name:
             # Not an anonymous function so need to compile the function and
             # store its identifier in the bytecode
-            compiled_bytecode = compile_bytecodes(
-                [*function_bytecodes["content"], *function_bytecodes["tail"][0]]
+            bytecode_codechunk = compile_bytecodes(
+                [
+                    function_bytecodes["entry"],
+                    *function_bytecodes["content"],
+                    *function_bytecodes["tail"][0],
+                ],
+                function_name,
+                function_bytecodes["params"],
+                line_number,
             )
-            bytecode_codechunk = compiled_bytecode.to_code()
+
+            if memo_size is not None:
+                # Wrap the function with functools.lru_cache just like a
+                # decorator, so every call (recursive calls included as
+                # they are looked up by name) goes through the memo
+                bytecodes.extend(
+                    [
+                        *import_from("functools", "lru_cache"),
+                        Instr("LOAD_CONST", memo_size),
+                        Instr("CALL_FUNCTION", 1),
+                    ]
+                )
 
             bytecodes.extend(
                 [
@@ -282,9 +930,13 @@ def define_function_content(
                         "MAKE_FUNCTION",
                         4 if len(function_bytecodes["header"]) > 0 else 0,
                     ),
-                    Instr("STORE_NAME", function_name),
                 ]
             )
+
+            if memo_size is not None:
+                bytecodes.append(Instr("CALL_FUNCTION", 1))
+
+            bytecodes.append(Instr("STORE_NAME", function_name))
         else:
             # This is an anonymous function which means that we dont have to
             # compile the function and store its identifier in the bytecode
@@ -312,7 +964,7 @@ def define_function_tail(is_entrypoint_function: bool) -> Tuple[list, Label]:
 
     return (
         [
-            Instr("LOAD_CONST", None),  # TODO: Add function return value
+            Instr("LOAD_CONST", None),
             Instr("RETURN_VALUE"),
         ],
     )
@@ -344,7 +996,7 @@ def define_function_wrapper(
             bytecodes.extend(
                 [
                     Instr("LOAD_CONST", param["name"], lineno=line_number),
-                    Instr("LOAD_NAME", param["type"], lineno=line_number),
+                    Instr("LOAD_CONST", param["type"], lineno=line_number),
                 ]
             )
 
@@ -354,5 +1006,46 @@ def define_function_wrapper(
     return (bytecodes, define_function_tail(is_entrypoint_function))
 
 
-def compile_bytecodes(bytecodes: list) -> Bytecode:
-    return Bytecode(bytecodes)
+def compile_bytecodes(
+    bytecodes: list,
+    function_name: str = None,
+    function_params: list = [],
+    first_line_number: int = 1,
+    is_optimized: bool = False,
+    file_name: str = DEFAULT_FILE_NAME,
+) -> CodeType:
+    if function_name:
+        return assemble(
+            bytecodes,
+            function_name,
+            [param["name"] for param in function_params],
+            CO_OPTIMIZED | CO_NEWLOCALS,
+            first_line_number,
+        )
+
+    code = assemble(
+        bytecodes,
+        flags=CO_OPTIMIZED if is_optimized else 0,
+        first_line_number=first_line_number,
+        file_name=file_name,
+    )
+
+    if file_name != DEFAULT_FILE_NAME:
+        # Function code objects are assembled while the program is
+        # still being parsed, so they are given the file name afterwards
+        code = set_filename(code, file_name)
+
+    return code
+
+
+def set_location(bytecodes: list, location: InstrLocation) -> list:
+    """
+    Point every instruction which has no location yet
+    to the source of the statement it is compiled from
+    """
+
+    for bytecode in bytecodes:
+        if isinstance(bytecode, Instr) and bytecode.location is None:
+            bytecode.location = location
+
+    return bytecodes
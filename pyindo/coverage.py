@@ -0,0 +1,118 @@
+from dis import opmap
+from types import CodeType, FrameType
+from typing import List, Union
+
+import sys
+
+from pyindo.profiler import get_code_objects
+
+
+def is_implicit_return(code: CodeType, start: int, end: int) -> bool:
+    """
+    Whether the instructions are the tail of the function which
+    returns None when its closing curly bracket is reached
+    """
+
+    co_code = code.co_code
+    return (
+        end == len(co_code)
+        and end - start == 4
+        and co_code[start] == opmap["LOAD_CONST"]
+        and code.co_consts[co_code[start + 1]] is None
+        and co_code[start + 2] == opmap["RETURN_VALUE"]
+    )
+
+
+def get_executable_lines(code: CodeType) -> set:
+    """
+    Lines which have any instruction in them, the closing curly
+    bracket of a function is not counted as it is never reached
+    by the functions which always return a value
+    """
+
+    return {
+        line
+        for start, end, line in code.co_lines()
+        if line is not None and line > 0 and not is_implicit_return(code, start, end)
+    }
+
+
+class LineCoverage:
+    """
+    Record which lines of the pyindo program are run, each line is only
+    recorded once as a code object is not traced anymore once every
+    one of its lines have been hit
+
+    Lines of the code objects are the lines of the .pyind source itself
+    as every instruction is given the location of its statement
+    """
+
+    def __init__(self, code: CodeType, codechunks: list = []):
+        self.hit_lines: set = set()
+
+        self._code_objects = get_code_objects(code)
+        for codechunk in codechunks:
+            self._code_objects |= get_code_objects(codechunk)
+
+        self.executable_lines: set = set()
+        for code_object in self._code_objects:
+            self.executable_lines |= get_executable_lines(code_object)
+
+        # Lines of each code object which have not been hit yet
+        self._remaining_lines = {
+            code_object: get_executable_lines(code_object)
+            for code_object in self._code_objects
+        }
+
+    def _trace_call(
+        self, frame: FrameType, event: str, arg: object
+    ) -> Union[object, None]:
+        # Code objects which every line have been hit are not traced anymore
+        if frame.f_code not in self._remaining_lines:
+            return None
+
+        return self._trace_line
+
+    def _trace_line(
+        self, frame: FrameType, event: str, arg: object
+    ) -> Union[object, None]:
+        if event != "line":
+            return self._trace_line
+
+        code = frame.f_code
+        if (remaining_lines := self._remaining_lines.get(code)) is None:
+            frame.f_trace_lines = False
+            return None
+
+        self.hit_lines.add(frame.f_lineno)
+        remaining_lines.discard(frame.f_lineno)
+        if not remaining_lines:
+            del self._remaining_lines[code]
+            frame.f_trace_lines = False
+
+        return self._trace_line
+
+    def start(self) -> None:
+        sys.settrace(self._trace_call)
+
+    def stop(self) -> None:
+        sys.settrace(None)
+
+    def get_lcov_report(self, source_path: str) -> List[str]:
+        """
+        Format the covered lines as an lcov tracefile, which could be
+        read by genhtml and most of the coverage services
+        """
+
+        covered_lines = self.hit_lines & self.executable_lines
+        return [
+            "TN:",
+            f"SF:{source_path}",
+            *[
+                f"DA:{line},{int(line in covered_lines)}"
+                for line in sorted(self.executable_lines)
+            ],
+            f"LF:{len(self.executable_lines)}",
+            f"LH:{len(covered_lines)}",
+            "end_of_record",
+        ]
@@ -0,0 +1,357 @@
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from functools import lru_cache
+from glob import glob
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER, LazyLoader, spec_from_loader
+from os import makedirs, replace, stat
+from os.path import abspath, basename, dirname, isfile, join, splitdrive
+from struct import calcsize, pack
+from types import CodeType, ModuleType
+from typing import Sequence, Tuple, Union
+
+import marshal
+import sys
+
+
+SOURCE_SUFFIX = ".pyind"
+CACHE_DIRECTORY = "__pycache__"
+
+# Magic number of the python version, the flags (whether the module is
+# optimized), the hash of the compiler, then the modification time and the
+# size of the source, much like the header of a .pyc file
+CACHE_HEADER_FORMAT = "<I8sII"
+CACHE_HEADER_SIZE = len(MAGIC_NUMBER) + calcsize(CACHE_HEADER_FORMAT)
+
+CACHE_FLAG_OPTIMIZED = 0b1
+
+
+@lru_cache(maxsize=None)
+def get_compiler_hash() -> bytes:
+    """
+    Hash of the source of the compiler itself, so the cache written by
+    another version of the compiler is never read (it could be compiling
+    the same module differently)
+    """
+
+    compiler_hash = sha256()
+    for compiler_path in sorted(glob(join(dirname(abspath(__file__)), "*.py"))):
+        with open(compiler_path, "rb") as f:
+            compiler_hash.update(f.read())
+
+    return compiler_hash.digest()[:8]
+
+
+def get_cache_header(is_optimized: bool, source_mtime: int, source_size: int) -> bytes:
+    return MAGIC_NUMBER + pack(
+        CACHE_HEADER_FORMAT,
+        CACHE_FLAG_OPTIMIZED if is_optimized else 0,
+        get_compiler_hash(),
+        source_mtime,
+        source_size,
+    )
+
+
+def get_cache_path(source_path: str, is_optimized: bool = False) -> str:
+    """
+    Path of the cached code of a module, it is put inside __pycache__
+    next to the source with the .pyind suffix kept in its name so it
+    never collides with the cache of a python module of the same name,
+    or inside `sys.pycache_prefix` whenever it is set (just like python)
+    """
+
+    cache_name = f"{basename(source_path)}.{sys.implementation.cache_tag}"
+    if is_optimized:
+        cache_name += ".opt-1"
+
+    if sys.pycache_prefix is not None:
+        source_directory = splitdrive(dirname(abspath(source_path)))[1]
+        return join(
+            sys.pycache_prefix, source_directory.lstrip("/\\"), f"{cache_name}.pyc"
+        )
+
+    return join(dirname(source_path), CACHE_DIRECTORY, f"{cache_name}.pyc")
+
+
+def get_source_stat(source_path: str) -> Tuple[int, int]:
+    """
+    Modification time and size of a source, which are kept
+    in the cache header to know whether it is still up to date
+    """
+
+    source_stat = stat(source_path)
+    return (
+        int(source_stat.st_mtime) & 0xFFFFFFFF,
+        source_stat.st_size & 0xFFFFFFFF,
+    )
+
+
+class PyindoLoader(Loader):
+    """
+    Load a pyindo module by running its compiled code, the code is
+    read from the cache whenever the source is not changed since it
+    was compiled, otherwise it is compiled and written to the cache
+
+    The cache also keeps the functions that the module declares (along
+    with their return types) so the programs importing it could be
+    compiled without compiling the module again
+    """
+
+    def __init__(self, fullname: str, path: str, is_optimized: bool = False):
+        self.name = fullname
+        self.path = path
+        self.is_optimized = is_optimized
+
+    def get_filename(self, fullname: str) -> str:
+        return self.path
+
+    def get_source(self, fullname: str) -> str:
+        with open(self.path, "r") as f:
+            return f.read()
+
+    def _read_cache(self, source_mtime: int, source_size: int) -> Union[dict, None]:
+        try:
+            with open(get_cache_path(self.path, self.is_optimized), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if data[:CACHE_HEADER_SIZE] != get_cache_header(
+            self.is_optimized, source_mtime, source_size
+        ):
+            return None
+
+        try:
+            return marshal.loads(data[CACHE_HEADER_SIZE:])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def _write_cache(self, source_mtime: int, source_size: int, entry: dict) -> None:
+        cache_path = get_cache_path(self.path, self.is_optimized)
+        data = get_cache_header(self.is_optimized, source_mtime, source_size)
+        data += marshal.dumps(entry)
+
+        # Written to another file first so a half written
+        # cache is never read by another process
+        try:
+            makedirs(dirname(cache_path), exist_ok=True)
+            with open(f"{cache_path}.tmp", "wb") as f:
+                f.write(data)
+
+            replace(f"{cache_path}.tmp", cache_path)
+        except OSError:
+            # Cache is only an optimization, a read only
+            # directory should not stop the module from loading
+            pass
+
+    def _compile(self) -> dict:
+        from pyindo.compiler import compile_bytecodes
+        from pyindo.parser import parse_program
+
+        # Module does not need an entrypoint of its own
+        global_scope = {
+            "functions": [],
+            "return_types": {},
+            "inline_functions": {},
+            "identifiers": {},
+            "constants": [],
+        }
+        bytecodes, _ = parse_program(
+            self.get_source(self.name) + "\0",
+            self.is_optimized,
+            global_scope=global_scope,
+        )
+
+        return {
+            "code": compile_bytecodes(
+                bytecodes, is_optimized=self.is_optimized, file_name=self.path
+            ),
+            "functions": global_scope["functions"],
+            "return_types": global_scope["return_types"],
+        }
+
+    def get_entry(self) -> dict:
+        """
+        Get the compiled code of the module along with its declared
+        functions, from the cache whenever it is still up to date
+        """
+
+        source_mtime, source_size = get_source_stat(self.path)
+
+        if entry := self._read_cache(source_mtime, source_size):
+            return entry
+
+        entry = self._compile()
+        self._write_cache(source_mtime, source_size, entry)
+
+        return entry
+
+    def get_code(self, fullname: str) -> CodeType:
+        return self.get_entry()["code"]
+
+    def create_module(self, spec: ModuleSpec) -> None:
+        # Use the default module creation
+        return None
+
+    def exec_module(self, module: ModuleType) -> None:
+        exec(self.get_code(module.__name__), module.__dict__)
+
+
+class PyindoFinder(MetaPathFinder):
+    """
+    Find pyindo modules (files with the .pyind suffix) inside the
+    directories of sys.path, or inside the package being imported from,
+    each module is only loaded once any of its attribute is accessed
+    """
+
+    def __init__(self, is_optimized: bool = False):
+        self.is_optimized = is_optimized
+
+        # Names of the modules found by this finder, the modules could
+        # not be checked directly as doing so would load the lazy ones
+        self.module_names: set = set()
+
+    def find_source(
+        self, fullname: str, path: Union[Sequence[str], None] = None
+    ) -> Union[str, None]:
+        module_name = fullname.rpartition(".")[2]
+
+        for directory in path if path is not None else sys.path:
+            source_path = join(directory or ".", f"{module_name}{SOURCE_SUFFIX}")
+            if isfile(source_path):
+                return source_path
+
+        return None
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Union[Sequence[str], None] = None,
+        target: Union[ModuleType, None] = None,
+    ) -> Union[ModuleSpec, None]:
+        source_path = self.find_source(fullname, path)
+        if source_path is None:
+            return None
+
+        loader = PyindoLoader(fullname, source_path, self.is_optimized)
+        spec = spec_from_loader(fullname, LazyLoader(loader), origin=source_path)
+        spec.has_location = True
+
+        self.module_names.add(fullname)
+
+        return spec
+
+
+def install(
+    search_path: Union[str, None] = None, is_optimized: bool = False
+) -> PyindoFinder:
+    """
+    Make pyindo modules importable, the search path (such as the
+    directory of the program being run) is searched before the others
+    """
+
+    if search_path is not None and search_path not in sys.path:
+        sys.path.insert(0, search_path)
+
+    for finder in sys.meta_path:
+        if isinstance(finder, PyindoFinder):
+            finder.is_optimized = is_optimized
+            return finder
+
+    finder = PyindoFinder(is_optimized)
+    sys.meta_path.insert(0, finder)
+
+    # Forget the directories which are searched
+    # before the finder is installed
+    sys.path_importer_cache.clear()
+
+    return finder
+
+
+def find_module_source(
+    module_name: str, is_optimized: bool = False
+) -> Union[str, None]:
+    """
+    Find the source of a pyindo module, returns None if it is not one
+    """
+
+    finder = install(is_optimized=is_optimized)
+    parent_name = module_name.rpartition(".")[0]
+
+    path = None
+    if parent_name:
+        # Parent packages are imported to know where to find the module
+        from importlib import import_module
+
+        try:
+            path = import_module(parent_name).__path__
+        except (ImportError, AttributeError):
+            return None
+
+    return finder.find_source(module_name, path)
+
+
+def get_module_functions(
+    module_name: str, is_optimized: bool = False
+) -> Union[Tuple[list, dict], None]:
+    """
+    Get the functions declared by the module along with their
+    return types, returns None if it is not a pyindo module
+    """
+
+    source_path = find_module_source(module_name, is_optimized)
+    if source_path is None:
+        return None
+
+    entry = PyindoLoader(module_name, source_path, is_optimized).get_entry()
+    return (entry["functions"], entry["return_types"])
+
+
+def get_module_path(module_name: str, is_optimized: bool = False) -> Union[str, None]:
+    """
+    Get the path of the source of a pyindo (or python) module,
+    returns None if it is built in or it could not be found
+    """
+
+    source_path = find_module_source(module_name, is_optimized)
+    if source_path is None:
+        from importlib.util import find_spec
+
+        try:
+            spec = find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+
+        source_path = spec.origin if spec else None
+
+    return source_path if source_path and isfile(source_path) else None
+
+
+def get_module_key(module_name: str, is_optimized: bool = False) -> str:
+    """
+    Get the key of the source of a module, which is changed
+    whenever the source is changed, so whatever is compiled
+    against the module is known to be compiled again
+    """
+
+    source_path = get_module_path(module_name, is_optimized)
+    if source_path is None:
+        # Built in module, which could not be changed
+        return module_name
+
+    source_mtime, source_size = get_source_stat(source_path)
+    return f"{source_path}:{source_mtime}:{source_size}"
+
+
+def unload_modules() -> None:
+    """
+    Remove every pyindo module from the imported modules,
+    so they are loaded again the next time they are imported
+    """
+
+    for finder in sys.meta_path:
+        if isinstance(finder, PyindoFinder):
+            for module_name in finder.module_names:
+                sys.modules.pop(module_name, None)
+
+            finder.module_names.clear()
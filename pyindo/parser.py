@@ -3,20 +3,73 @@ from os import (
     EX_SOFTWARE,  # Exit code that means an internal software error was detected.
 )
 from string import ascii_letters, digits
+from sys import exit
 from types import CodeType
 from enum import Enum
-from typing import Any, List, NoReturn, Tuple, Union
+from typing import Any, Collection, List, NoReturn, Tuple, Union
+import re
+
 from pyindo.compiler import (
-    condition,
+    BUILTIN_FUNCTIONS,
     math_operation,
     bool_operation,
     call_function,
     comparison,
+    load_expression,
+    load_operand,
+    subscript,
+    define_array,
+    define_condition_header,
+    define_condition_tail,
+    define_dictionary,
+    define_array_storage,
+    define_assignment,
+    define_deletion,
+    define_number_element_assignment,
+    define_subscript_assignment,
+    define_subscript_deletion,
+    define_return,
+    define_tail_call,
     define_function_content,
+    define_function_tail,
     define_function_wrapper,
+    define_import,
+    define_loop_break,
+    define_loop_continue,
+    define_loop_header,
+    define_loop_tail,
+    define_yield,
+    define_inline_bytecodes,
+    define_inline_call,
+    fold_constants,
+    set_location,
+)
+from pyindo.checker import (
+    get_array_type,
+    get_dictionary_type,
+    get_element_type,
+    is_array_type,
+    get_operand_type,
+    get_operation_type,
+    is_assignable,
+)
+from pyindo.cache import (
+    FunctionCache,
+    get_function_key,
+    get_function_span_end,
+    shift_line_numbers,
+)
+from pyindo.tokens import (
+    BOOLEAN_KIND,
+    FLOAT_KIND,
+    IDENTIFIER_KIND,
+    INTEGER_KIND,
+    LOCAL_IDENTIFIER_KIND,
+    TokenBuffer,
 )
-from pyindo.types import LiteralString
-from bytecode import Label
+from pyindo.types import LiteralString, LocalIdentifier, TypedBytecodes
+from bytecode import Instr, Label
+from bytecode.instr import InstrLocation
 
 
 class Context(Enum):
@@ -28,6 +81,14 @@ class Context(Enum):
     SINGLE_QUOTE = "''"
 
 
+class RoundBracket(Enum):
+    GROUPING = "grouping"
+    PARAMETERS = "parameters"
+    ARGUMENTS = "arguments"
+    CONDITION = "condition"
+    LOOP = "loop"
+
+
 class Bracket(Enum):
     OPENING_CURLY_BRACKET = "{"
     CLOSING_CURLY_BRACKET = "}"
@@ -57,7 +118,7 @@ class Operator(Enum):
     BIT_SHIFT_LEFT = "<<"
     BIT_SHIFT_RIGHT = ">>"
     GREATER_THAN_EQUAL = ">="
-    LESS_THAN_EQUAL = ">="
+    LESS_THAN_EQUAL = "<="
     NOT_EQUAL = "!="
 
 
@@ -121,6 +182,13 @@ class Keyword(Enum):
     DELETE = "hapus"
     RETURN = "hasilkan"
     MAIN = "utama"
+    AND = "dan"
+    OR = "atau"
+    IN = "didalam"
+    FROM = "dari"
+    IMPORT = "impor"
+    YIELD = "berikan"
+    MEMO = "ingat"
     # Dont tokenize this as this just act as a
     # marker throughout the whole parser process
     ELIF = "selainnya jika"
@@ -146,6 +214,13 @@ TOKENS = {
     Keyword.DELETE: 114,
     Keyword.RETURN: 115,
     Keyword.MAIN: 116,
+    Keyword.AND: 117,
+    Keyword.OR: 118,
+    Keyword.IN: 119,
+    Keyword.FROM: 120,
+    Keyword.IMPORT: 121,
+    Keyword.YIELD: 122,
+    Keyword.MEMO: 123,
     SelfOperator.SELF_PLUS: 200,
     SelfOperator.SELF_MINUS: 201,
     SelfOperator.SELF_MULTIPLY: 202,
@@ -239,58 +314,235 @@ FUNCTION_KEYWORD_TOKENS = [
     ]
 ]
 
+TYPE_DECLARATION_TOKENS = [
+    *[TOKENS[e] for e in Type],
+    TOKENS[Bracket.OPENING_ANGLE_BRACKET],
+    TOKENS[Bracket.CLOSING_ANGLE_BRACKET],
+]
+
+STATEMENT_BOUNDARY_TOKENS = [
+    -1,
+    TOKENS[Punctuation.SEMICOLON],
+    TOKENS[Punctuation.SINGLELINE_COMMENT],
+    TOKENS[Punctuation.CLOSING_MULTILINE_COMMENT],
+    TOKENS[Bracket.OPENING_CURLY_BRACKET],
+    TOKENS[Bracket.CLOSING_CURLY_BRACKET],
+    TOKENS[Keyword.THEN],
+    TOKENS[Keyword.ELSE],
+]
+
+# Characters which end a statement and those which could never start one
+STATEMENT_END_CHARS = ";{}"
+NON_STATEMENT_START_CHARS = " \t\r\n/;{}"
+
+# Tokens which could come before each name inside an import statement
+IMPORT_STATEMENT_TOKENS = [
+    TOKENS[Keyword.FROM],
+    TOKENS[Keyword.IMPORT],
+    TOKENS[Punctuation.COMMA],
+]
+
+# Binding power of each binary operator, the higher one binds tighter
+BINARY_OPERATOR_PRECEDENCES = {
+    TOKENS[Operator.OR]: 0,
+    TOKENS[Operator.AND]: 1,
+    TOKENS[Operator.EQUAL]: 2,
+    TOKENS[Operator.NOT_EQUAL]: 2,
+    TOKENS[Operator.GREATER_THAN]: 2,
+    TOKENS[Operator.LESS_THAN]: 2,
+    TOKENS[Operator.GREATER_THAN_EQUAL]: 2,
+    TOKENS[Operator.LESS_THAN_EQUAL]: 2,
+    TOKENS[Keyword.IN]: 2,
+    TOKENS[Operator.BIT_AND]: 3,
+    TOKENS[Operator.BIT_OR]: 3,
+    TOKENS[Operator.BIT_NOT]: 3,
+    TOKENS[Operator.BIT_SHIFT_LEFT]: 3,
+    TOKENS[Operator.BIT_SHIFT_RIGHT]: 3,
+    TOKENS[Operator.PLUS]: 4,
+    TOKENS[Operator.MINUS]: 4,
+    TOKENS[Operator.MULTIPLY]: 5,
+    TOKENS[Operator.DIVIDE]: 5,
+    TOKENS[Operator.MODULO]: 5,
+    TOKENS[Operator.POWER]: 6,
+}
+
+# Operators which are grouped from the right (2 ** 3 ** 2 is 2 ** 9)
+RIGHT_ASSOCIATIVE_OPERATOR_TOKENS = {TOKENS[Operator.POWER]}
+
+OPERATOR_STRINGS = {TOKENS[e]: e.value for e in [*Operator, Keyword.IN]}
+
+OPERATOR_TOKENS = {TOKENS[e] for e in Operator}
+
+COMPARISON_OPERATOR_TOKENS = {
+    TOKENS[e]
+    for e in [
+        Operator.EQUAL,
+        Operator.NOT_EQUAL,
+        Operator.GREATER_THAN,
+        Operator.LESS_THAN,
+        Operator.GREATER_THAN_EQUAL,
+        Operator.LESS_THAN_EQUAL,
+        Keyword.IN,
+    ]
+}
+
+BOOL_OPERATOR_TOKENS = {TOKENS[Operator.AND], TOKENS[Operator.OR]}
+
+# Keywords and brackets which are the same as an operator inside an expression
+OPERATOR_ALIAS_TOKENS = {
+    TOKENS[Keyword.EQUAL]: TOKENS[Operator.EQUAL],
+    TOKENS[Keyword.NOT_EQUAL]: TOKENS[Operator.NOT_EQUAL],
+    TOKENS[Keyword.AND]: TOKENS[Operator.AND],
+    TOKENS[Keyword.OR]: TOKENS[Operator.OR],
+    TOKENS[Bracket.OPENING_ANGLE_BRACKET]: TOKENS[Operator.LESS_THAN],
+    TOKENS[Bracket.CLOSING_ANGLE_BRACKET]: TOKENS[Operator.GREATER_THAN],
+}
+
+# Tokens which are skipped inside an expression
+IGNORED_EXPRESSION_TOKENS = {
+    TOKENS[Punctuation.SPACE],
+    TOKENS[Punctuation.SINGLEQUOTE],
+    TOKENS[Punctuation.DOUBLEQUOTE],
+    TOKENS[Punctuation.OPENING_MULTILINE_COMMENT],
+    TOKENS[Punctuation.CLOSING_MULTILINE_COMMENT],
+    TOKENS[Punctuation.COMMA],
+    TOKENS[Punctuation.DOLLAR],
+    TOKENS[Bracket.OPENING_CURLY_BRACKET],
+    TOKENS[Bracket.CLOSING_CURLY_BRACKET],
+}
+
+# Number of results kept by the memo of a function which is annotated
+# with `ingat` without any size, the same default as functools.lru_cache
+MEMO_SIZE = 128
+
+
+class LoopBytecode:
+    """
+    Loop over each element of an iterable (`untuk (x didalam y)`), just like
+    a condition branch every bytecode of it is appended straight into the
+    content of the function it is inside, and the iterable is consumed lazily
+    """
+
+    __slots__ = ("_start_label", "_end_label", "_location")
+
+    def __init__(self):
+        self._start_label = Label()
+        self._end_label = Label()
+        self._location: Union[InstrLocation, None] = None
+
+    def create_header_bytecodes(
+        self, identifier: tuple or str, expressions: list, location: InstrLocation
+    ) -> list:
+        self._location = location
+
+        return set_location(
+            define_loop_header(
+                identifier, expressions, self._start_label, self._end_label
+            ),
+            location,
+        )
+
+    def create_tail_bytecodes(self, location: Union[InstrLocation, None]) -> list:
+        # Jump back is where a signal is handled inside the loop, it is put
+        # on the last line of the body (just like python does) so sampling
+        # the loop lands on its body instead of its header
+        return set_location(
+            define_loop_tail(self._start_label, self._end_label),
+            location or self._location,
+        )
+
+    def create_break_bytecodes(self) -> list:
+        return define_loop_break(self._end_label)
 
-# TODO: Create LoopBytecode
+    def create_continue_bytecodes(self) -> list:
+        return define_loop_continue(self._start_label)
 
 
 class ConditionBytecode:
-    def __init__(self, c_type: str):
+    """
+    Branch of a condition chain (`jika`, `selainnya jika` and `selainnya`),
+    the branch itself only keeps the labels it jumps to, every bytecode of
+    it is appended straight into the content of the function it is inside
+    """
+
+    __slots__ = ("_condition_type", "_false_label", "_end_label", "_location")
+
+    def __init__(
+        self, c_type: str, previous_branch: Union[ConditionBytecode, None] = None
+    ):
         self._condition_type = c_type
-        self._conditional_expression = []
-        self._conditional_statements = []
-        self._other_coditional_statements = []
+        self._false_label: Union[Label, None] = None
+        self._location: Union[InstrLocation, None] = None
+
+        # Every branch of the chain jumps to the same end
+        self._end_label: Label = (
+            previous_branch.end_label if previous_branch else Label()
+        )
 
     @property
     def condition_type(self) -> str:
         return self._condition_type
 
-    def set_conditional_expression(self, expressions: list) -> None:
-        self._conditional_expression = expressions
+    @property
+    def end_label(self) -> Label:
+        return self._end_label
 
-    def add_conditional_statement(self, statements: list) -> None:
-        self._conditional_statements.extend(statements)
+    def create_header_bytecodes(
+        self, expressions: list, location: InstrLocation
+    ) -> list:
+        self._location = location
 
-    def add_other_conditional_statement(self, statements: list) -> None:
-        other_condition_label = Label()
-        self._other_coditional_statements.extend([other_condition_label, *statements])
+        if self._condition_type == Keyword.ELSE.value:
+            return []
 
-        return other_condition_label
+        self._false_label = Label()
+        return set_location(
+            define_condition_header(expressions, self._false_label), location
+        )
 
-    def create_condition_bytecodes(
-        self,
-        jump_label: Union[Label, None] = None,
-        condition_label: Union[Label, None] = None,
-    ) -> list:
-        return condition(
-            self._conditional_expression,
-            self._conditional_statements,
-            self._other_coditional_statements,
-            self._condition_type,
-            jump_label,
-            condition_label,
+    def create_tail_bytecodes(self, is_last_branch: bool) -> list:
+        # Jumps between the branches belong to the condition itself
+        return set_location(
+            define_condition_tail(self._false_label, self._end_label, is_last_branch),
+            self._location,
         )
 
 
 class FunctionBytecode:
+    __slots__ = (
+        "_params",
+        "_header",
+        "_tail",
+        "_content",
+        "_function_name",
+        "_line_number",
+        "_entry_label",
+        "_return_type",
+        "_identifiers",
+        "_constant_identifiers",
+        "_function_bytecodes",
+        "_function_codechunk",
+        "_loops",
+        "_memo_size",
+        "_is_generator",
+    )
+
     def __init__(self, function_name: Union[str, None] = None):
         self._params: list = []
         self._header: list = []
         self._tail: Tuple[list, Label] = ()
         self._content: list = []
         self._function_name: Union[str, None] = function_name
+        self._line_number: int = 1
+        self._entry_label: Label = Label()
+        self._return_type: Union[str, None] = None
         self._identifiers: dict = {}
+        self._constant_identifiers: list = []
         self._function_bytecodes: list = []
         self._function_codechunk: Union[CodeType, None] = None
+        self._loops: List[LoopBytecode] = []
+        self._memo_size: Union[int, None] = None
+        self._is_generator: bool = False
 
     @property
     def function_tail(self) -> Tuple[list, Label]:
@@ -300,10 +552,59 @@ class FunctionBytecode:
     def function_name(self) -> Union[str, None]:
         return self._function_name
 
+    @property
+    def function_params(self) -> list:
+        return self._params
+
+    @property
+    def return_type(self) -> Union[str, None]:
+        return self._return_type
+
+    @property
+    def identifier_types(self) -> dict:
+        return self._identifiers
+
+    @property
+    def constant_identifiers(self) -> list:
+        return self._constant_identifiers
+
+    @property
+    def is_entrypoint_function(self) -> bool:
+        return self._function_name == Keyword.MAIN.value
+
+    @property
+    def is_memoized(self) -> bool:
+        return self._memo_size is not None
+
+    @property
+    def current_loop(self) -> Union[LoopBytecode, None]:
+        return self._loops[-1] if len(self._loops) > 0 else None
+
+    def enter_loop(self, loop_bytecode: LoopBytecode) -> None:
+        self._loops.append(loop_bytecode)
+
+    def exit_loop(self) -> LoopBytecode:
+        return self._loops.pop()
+
     def set_function_params(self, parameters: list) -> None:
         self._params = parameters
 
-    def set_header_bytecodes(self, line_number: int) -> None:
+        for param in parameters:
+            self.add_identifier(param["name"], param["type"])
+
+    def set_return_type(self, return_type: Union[str, None]) -> None:
+        self._return_type = return_type
+
+    def set_memo_size(self, memo_size: Union[int, None]) -> None:
+        self._memo_size = memo_size
+
+    def set_generator(self, is_generator: bool) -> None:
+        self._is_generator = is_generator
+
+    def set_header_bytecodes(self, location: InstrLocation) -> None:
+        line_number = location.lineno
+        self._line_number = line_number
+
         if self._function_name == Keyword.MAIN.value:
             self._header, self._tail = define_function_wrapper(
                 self.function_name,
@@ -319,36 +620,90 @@ class FunctionBytecode:
                 line_number,
             )
 
+        set_location(self._header, location)
+
     def is_identifier_exist(self, identifier_name: str) -> bool:
         return identifier_name in self._identifiers.keys()
 
-    def add_identifier(self, identifier_name: str) -> None:
-        # TODO: add some bytecodes here to set identifier to local name
-        self._identifiers[identifier_name] = None
+    def get_identifier_kind(self) -> int:
+        if self._function_name == Keyword.MAIN.value:
+            # Entrypoint content lives in the global scope
+            return IDENTIFIER_KIND
+
+        return LOCAL_IDENTIFIER_KIND
+
+    def add_identifier(
+        self,
+        identifier_name: str,
+        identifier_type: Union[str, None] = None,
+        is_constant: bool = False,
+    ) -> None:
+        self._identifiers[identifier_name] = identifier_type
+
+        if is_constant:
+            self._constant_identifiers.append(identifier_name)
 
-    def set_identifier_value(
-        self, line_number: int, identifier_name: str, value: Any
+    def set_identifier_type(
+        self, identifier_name: str, identifier_type: Union[str, None]
     ) -> None:
-        self._identifiers[identifier_name] = value
-        # TODO: add some bytecodes here to add value to the identifier
-        self._content.extend()
+        self._identifiers[identifier_name] = identifier_type
+
+    def get_identifier_type(self, identifier_name: str) -> Union[str, None]:
+        return self._identifiers.get(identifier_name)
+
+    def is_identifier_constant(self, identifier_name: str) -> bool:
+        return identifier_name in self._constant_identifiers
 
     def add_content_bytecodes(self, bytecodes: list) -> None:
         self._content.extend(bytecodes)
 
-    def create_function_bytecodes(self, line_number: int) -> None:
+    def get_last_location(self) -> Union[InstrLocation, None]:
+        for bytecode in reversed(self._content):
+            if isinstance(bytecode, Instr) and bytecode.location is not None:
+                return bytecode.location
+
+        return None
+
+    def create_return_bytecodes(self, expressions: list) -> list:
+        # Jumping back to the entry from inside a loop would leave the
+        # iterator of the loop behind, jumping back inside a memoized
+        # function would skip the memo for each of the following calls, and
+        # a generator would keep yielding instead of returning the new one
+        if (
+            self._function_name != Keyword.MAIN.value
+            and len(self._loops) == 0
+            and not self.is_memoized
+            and not self._is_generator
+        ):
+            tail_call_bytecodes = define_tail_call(
+                expressions, self._function_name, self._params, self._entry_label
+            )
+
+            if tail_call_bytecodes:
+                return tail_call_bytecodes
+
+        return define_return(expressions)
+
+    def create_function_bytecodes(self, location: InstrLocation) -> None:
+        set_location(self._tail[0], location)
+
         bytecodes, function_codechunk = define_function_content(
             self._function_name,
             {
+                "params": self._params,
+                "entry": self._entry_label,
                 "header": self._header,
                 "tail": self._tail,
                 "content": self._content,
             },
             self._function_name == Keyword.MAIN.value,
-            line_number,
+            self._line_number,
+            self._memo_size,
         )
 
-        self._function_bytecodes = bytecodes
+        self._function_bytecodes = set_location(
+            bytecodes, InstrLocation(self._line_number, None, None, None)
+        )
 
         if self._function_name:
             self._function_codechunk = function_codechunk
@@ -356,6 +711,20 @@ class FunctionBytecode:
     def get_function_bytecodes(self) -> Tuple[list, CodeType or None]:
         return (self._function_bytecodes, self._function_codechunk)
 
+    def get_inline_bytecodes(self) -> Union[list, None]:
+        # Body of a memoized function placed in the call
+        # sites would be run without going through its memo
+        if self.is_entrypoint_function or self.is_memoized:
+            return None
+
+        return define_inline_bytecodes(
+            {
+                "entry": self._entry_label,
+                "tail": self._tail,
+                "content": self._content,
+            }
+        )
+
 
 def token_to_string(token: int) -> str:
     """
@@ -450,7 +819,7 @@ def search(
         else:
             if (
                 char == Punctuation.SPACE.value
-                and len(parsed_buffer) >= token_class.value
+                and len(parsed_buffer) >= len(token_class.value)
             ):
                 if should_exist:
                     error(
@@ -473,26 +842,234 @@ def search(
 
 
 def get_first_token(
-    token_list: List[int],
+    token_list: Union[List[int], TokenBuffer],
     is_forward: bool,
     from_pos: int = None,
     other_than: list = [Punctuation.SPACE],
 ) -> Tuple[int, int]:
-    token = None
-
-    from_pos = from_pos if from_pos else len(token_list)
-    token_list = token_list[from_pos:] if is_forward else token_list[:from_pos][::-1]
-    for pos, token in enumerate(token_list):
-        is_in_whitelist = False
-        for token_whitelist in other_than:
-            is_in_whitelist |= token == TOKENS[token_whitelist]
+    skipped_tokens = [TOKENS[token_whitelist] for token_whitelist in other_than]
 
-        if not is_in_whitelist:
-            return token, pos
+    from_pos = from_pos if from_pos is not None else len(token_list)
+    token_positions = (
+        range(from_pos, len(token_list))
+        if is_forward
+        else range(from_pos - 1, -1, -1)
+    )
+    for distance, token_pos in enumerate(token_positions):
+        token = token_list[token_pos]
+        if token not in skipped_tokens:
+            return token, distance
 
     return -1, -1
 
 
+def get_opening_bracket_pos(token_list: list) -> int:
+    """
+    Get the position of the opening round bracket which
+    match the last unclosed round bracket in the token list
+    """
+
+    depth = 0
+    for pos in range(len(token_list) - 1, -1, -1):
+        if token_list[pos] == TOKENS[Bracket.CLOSING_ROUND_BRACKET]:
+            depth += 1
+        elif token_list[pos] == TOKENS[Bracket.OPENING_ROUND_BRACKET]:
+            if depth == 0:
+                return pos
+
+            depth -= 1
+
+    return -1
+
+
+def get_statement_tokens(token_list: list) -> list:
+    """
+    Get all of the tokens (other than space) of the statement
+    which is ended by the last token in the token list
+    """
+
+    statement_tokens = []
+    for token_pos in range(len(token_list) - 2, -1, -1):
+        token = token_list[token_pos]
+        if token in STATEMENT_BOUNDARY_TOKENS and not is_format_bracket(
+            token_list, token_pos
+        ):
+            break
+
+        if token != TOKENS[Punctuation.SPACE]:
+            statement_tokens.append(token)
+
+    return statement_tokens[::-1]
+
+
+def is_format_bracket(token_list: list, token_pos: int) -> bool:
+    """
+    Check whether the curly bracket at the position opens or closes the
+    expression of a format string (`${}`) instead of a block of statements
+    """
+
+    opening_pos = token_pos
+    if token_list[token_pos] == TOKENS[Bracket.CLOSING_CURLY_BRACKET]:
+        # Find the curly bracket which is closed by this one
+        depth = 0
+        for opening_pos in range(token_pos, -1, -1):
+            if token_list[opening_pos] == TOKENS[Bracket.CLOSING_CURLY_BRACKET]:
+                depth += 1
+            elif token_list[opening_pos] == TOKENS[Bracket.OPENING_CURLY_BRACKET]:
+                depth -= 1
+                if depth == 0:
+                    break
+    elif token_list[token_pos] != TOKENS[Bracket.OPENING_CURLY_BRACKET]:
+        return False
+
+    return opening_pos > 0 and token_list[opening_pos - 1] == TOKENS[
+        Punctuation.DOLLAR
+    ]
+
+
+def is_generator_source(program_buffer: str, pos: int) -> bool:
+    """
+    Check whether the function which body is opened at the position yields
+    any value, the whole body is checked as a `berikan` could come after
+    any of the returns, a `berikan` inside a string or a comment is also
+    counted which only costs the tail call optimization of the function
+    """
+
+    body_end = get_function_span_end(program_buffer, pos)
+    return (
+        re.search(
+            rf"\b{Keyword.YIELD.value}\b",
+            program_buffer[pos : body_end if body_end != -1 else None],
+        )
+        is not None
+    )
+
+
+def get_memo_size(
+    token_list: list, function_pos: int, line_number: int
+) -> Union[int, None]:
+    """
+    Get the number of results kept by the memo of the function declared at
+    the position (from either `ingat` or `ingat([size])` right before the
+    function), returns None if the function is not annotated at all
+    """
+
+    token, distance = get_first_token(token_list, False, function_pos)
+    if token == TOKENS[Keyword.MEMO]:
+        return MEMO_SIZE
+    elif token != TOKENS[Bracket.CLOSING_ROUND_BRACKET]:
+        return None
+
+    annotation_tokens = []
+    token_pos = function_pos - 1 - distance
+    for _ in range(3):
+        token, distance = get_first_token(token_list, False, token_pos)
+        token_pos -= 1 + distance
+        annotation_tokens.insert(0, token)
+
+    if (
+        annotation_tokens[0] != TOKENS[Keyword.MEMO]
+        or annotation_tokens[1] != TOKENS[Bracket.OPENING_ROUND_BRACKET]
+        or not isinstance(annotation_tokens[2], tuple)
+        or annotation_tokens[2][1] != int
+    ):
+        error(
+            f"Expecting '{Keyword.MEMO.value}' or '{Keyword.MEMO.value}([size])' before '{Keyword.FUNCTION.value}'",
+            line_number,
+        )
+
+    return int(annotation_tokens[2][0])
+
+
+def is_inside_string_literal(context_stack: List[Context]) -> bool:
+    """
+    Check whether the current position is inside a string but
+    not inside any of its format string expression
+    """
+
+    return len(context_stack) > 0 and context_stack[-1] in [
+        Context.DOUBLE_QUOTE,
+        Context.SINGLE_QUOTE,
+    ]
+
+
+def get_function_bytecode(
+    bytecode_stack: List[Union[FunctionBytecode, ConditionBytecode]]
+) -> Union[FunctionBytecode, None]:
+    for bytecode_class in bytecode_stack[::-1]:
+        if isinstance(bytecode_class, FunctionBytecode):
+            return bytecode_class
+
+    return None
+
+
+def get_identifier_types(
+    bytecode_stack: List[Union[FunctionBytecode, ConditionBytecode]]
+) -> dict:
+    function_bytecode = get_function_bytecode(bytecode_stack)
+    return function_bytecode.identifier_types if function_bytecode else {}
+
+
+def get_identifier_name(identifier: tuple or str) -> str:
+    return identifier if isinstance(identifier, str) else identifier[0]
+
+
+def get_column(program_buffer: str, pos: int) -> int:
+    return pos - program_buffer.rfind("\n", 0, pos) - 1
+
+
+def get_statement_location(
+    program_buffer: str,
+    statement_start: Union[Tuple[int, int], None],
+    pos: int,
+    line_number: int,
+) -> InstrLocation:
+    """
+    Get the source span of the statement which ends at the given
+    position, starting from where its first character is found
+    """
+
+    start_line_number, start_column = statement_start or (
+        line_number,
+        get_column(program_buffer, pos),
+    )
+
+    return InstrLocation(
+        start_line_number,
+        line_number,
+        start_column,
+        get_column(program_buffer, pos) + 1,
+    )
+
+
+def get_previous_branch(
+    bytecode_stack: List[Union[FunctionBytecode, ConditionBytecode]],
+    line_number: int,
+) -> ConditionBytecode:
+    if len(bytecode_stack) == 0 or not isinstance(
+        bytecode_stack[-1], ConditionBytecode
+    ):
+        error(f"Unexpected '{Keyword.ELSE.value}'", line_number)
+
+    return bytecode_stack.pop()
+
+
+def add_statement_bytecodes(
+    bytecode_stack: List[Union[FunctionBytecode, ConditionBytecode]],
+    program_bytecodes: list,
+    bytecodes: list,
+    location: InstrLocation,
+) -> None:
+    set_location(bytecodes, location)
+
+    # Statements inside a condition are placed
+    # right into the content of their function
+    if function_bytecode := get_function_bytecode(bytecode_stack):
+        function_bytecode.add_content_bytecodes(bytecodes)
+    else:
+        program_bytecodes.extend(bytecodes)
+
+
 def check_legal_identifier(identifier: str, line_number: int) -> Union[None, NoReturn]:
     is_legal = identifier[0] not in digits
 
@@ -507,229 +1084,949 @@ def clean_identifier(identifier: str) -> str:
     clean_str = ""
 
     for char in identifier:
-        if char in [*ascii_letters, *digits, "_"]:
+        # Dot is kept for float literal
+        if char in [*ascii_letters, *digits, "_", "."]:
             clean_str += char
 
     return clean_str
 
 
-def convert_to_postfix(token_list: list) -> list:
-    stack = []
-    postfix = []
-
-    OPERATORS = {
-        TOKENS[Operator.BIT_AND]: 0,
-        TOKENS[Operator.BIT_OR]: 0,
-        TOKENS[Operator.BIT_NOT]: 0,
-        TOKENS[Operator.BIT_SHIFT_LEFT]: 0,
-        TOKENS[Operator.BIT_SHIFT_RIGHT]: 0,
-        TOKENS[Operator.PLUS]: 1,
-        TOKENS[Operator.MINUS]: 1,
-        TOKENS[Operator.MULTIPLY]: 2,
-        TOKENS[Operator.DIVIDE]: 2,
-        TOKENS[Operator.MODULO]: 2,
-        TOKENS[Operator.POWER]: 3,
-        TOKENS[Operator.EQUAL]: 4,
-        TOKENS[Operator.NOT_EQUAL]: 4,
-        TOKENS[Operator.GREATER_THAN]: 4,
-        TOKENS[Operator.LESS_THAN]: 4,
-        TOKENS[Operator.GREATER_THAN_EQUAL]: 4,
-        TOKENS[Operator.LESS_THAN_EQUAL]: 4,
-        TOKENS[Operator.AND]: 4,
-        TOKENS[Operator.OR]: 4,
-    }
+def evaluate_operation(
+    token: int, l_operand: Any, r_operand: Any, identifier_types: dict
+) -> Union[TypedBytecodes, tuple]:
+    operator = OPERATOR_STRINGS[token]
+    l_type = get_operand_type(l_operand, identifier_types)
+    r_type = get_operand_type(r_operand, identifier_types)
+    value_type = get_operation_type(l_type, r_type, operator)
 
-    for pos, token in enumerate(token_list):
-        if isinstance(token, tuple) or isinstance(token, str):
-            postfix.append(token)
-        elif token == TOKENS[Bracket.OPENING_ROUND_BRACKET]:
-            stack.append(token)
-        elif token == TOKENS[Bracket.CLOSING_ROUND_BRACKET]:
-            while stack[-1] != TOKENS[Bracket.OPENING_ROUND_BRACKET]:
-                postfix.append(stack.pop())
-            stack.pop()
-        else:
-            while (
-                len(stack) > 0
-                and stack[-1] != TOKENS[Bracket.OPENING_ROUND_BRACKET]
-                and OPERATORS[stack[-1]] >= OPERATORS[token]
-            ):
-                postfix.append(stack.pop())
-            stack.append(token)
+    match (operator, r_operand):
+        case ("**", (v_value, v_type)) if (
+            l_type == "desimal" and v_type == int and int(v_value) >= 0
+        ):
+            # Integer power is only an integer when the exponent is not negative
+            value_type = "desimal"
+
+    if token in COMPARISON_OPERATOR_TOKENS:
+        return TypedBytecodes(
+            comparison(l_operand, r_operand, operator, l_type), value_type
+        )
+    elif token in BOOL_OPERATOR_TOKENS:
+        return TypedBytecodes(
+            bool_operation(l_operand, r_operand, operator), value_type
+        )
+
+    if folded_constant := fold_constants(l_operand, r_operand, operator):
+        return folded_constant
+
+    return TypedBytecodes(
+        math_operation(l_operand, r_operand, operator, l_type, r_type), value_type
+    )
+
+
+def parse_operand(
+    token_list: list, pos: int, identifier_types: dict
+) -> Tuple[Any, int]:
+    """
+    Parse a single operand (or a whole expression inside round
+    brackets), returns it along with the position right after it
+    """
+
+    token = token_list[pos] if pos < len(token_list) else None
+    if token == TOKENS[Bracket.OPENING_ROUND_BRACKET]:
+        operand, pos = parse_operation(token_list, pos + 1, 0, identifier_types)
+        if pos >= len(token_list) or token_list[pos] != TOKENS[
+            Bracket.CLOSING_ROUND_BRACKET
+        ]:
+            compiler_error("Expecting ')' in bytecode expression evaluator")
+
+        return operand, pos + 1
+    elif isinstance(token, (tuple, str, list)):
+        return token, pos + 1
+
+    token = token_list[pos - 1] if token is None else token
+    compiler_error(
+        f"Orphan '{token_to_string(token)}' token without any expression in bytecode expression evaluator"
+    )
+
+
+def parse_operation(
+    token_list: list, pos: int, min_precedence: int, identifier_types: dict
+) -> Tuple[Any, int]:
+    """
+    Parse the operation starting at the position with precedence climbing,
+    only the operators which bind at least as tight as the minimum
+    precedence are taken, every operation is turned into its bytecodes
+    right away so the result is the operand of the outer operation
+    """
+
+    l_operand, pos = parse_operand(token_list, pos, identifier_types)
 
-        if pos == len(token_list) - 1 and len(stack) > 0:
-            while len(stack) != 0:
-                postfix.append(stack.pop())
+    while pos < len(token_list):
+        token = token_list[pos]
+        if not isinstance(token, int):
+            # Next operand starts another expression
+            break
 
-    return postfix
+        precedence = BINARY_OPERATOR_PRECEDENCES.get(token)
+        if precedence is None or precedence < min_precedence:
+            break
 
+        r_operand, pos = parse_operation(
+            token_list,
+            pos + 1,
+            precedence if token in RIGHT_ASSOCIATIVE_OPERATOR_TOKENS else precedence + 1,
+            identifier_types,
+        )
+        l_operand = evaluate_operation(token, l_operand, r_operand, identifier_types)
+
+    return l_operand, pos
+
+
+def evaluate_expressions(token_list: list, identifier_types: dict = {}) -> list:
+    """
+    Evaluate the operands and operators into expressions, operands
+    which are next to each other without any operator between them
+    are evaluated as separate expressions
+    """
+
+    expressions = []
+    pos = 0
+    while pos < len(token_list):
+        expression, pos = parse_operation(token_list, pos, 0, identifier_types)
 
-def evaluate_to_bytecode(postfix_token_list: list) -> list:
-    if len(postfix_token_list) == 1:
-        if isinstance(postfix_token_list[0], tuple) or isinstance(
-            postfix_token_list[0], str
+        # Keep the type of identifiers which type is known
+        # for the rest of the compilation process
+        if isinstance(expression, str) or (
+            isinstance(expression, tuple) and expression[1] == LocalIdentifier
         ):
-            return [postfix_token_list[0]]
-        else:
-            compiler_error(
-                f"Orphan '{token_to_string(postfix_token_list[0])}' token without any expression in bytecode expression evaluator"
-            )
+            if operand_type := get_operand_type(expression, identifier_types):
+                expression = TypedBytecodes(load_operand(expression), operand_type)
 
-    stack = []
-    bytecodes = []
-    for token in postfix_token_list:
-        if isinstance(token, tuple) or isinstance(token, str):
-            if isinstance(token, tuple) and token[1] == LiteralString:
-                bytecodes.append(token)
-            else:
-                stack.append(token)
-        else:
-            if len(stack) > 1:
-                r_operand = stack.pop()
-                l_operand = stack.pop()
-            else:
-                r_operand = stack.pop()
-                l_operand = bytecodes[-1]
-
-            match token_to_string(token):
-                case _ as token_string if token_string in [
-                    Operator.EQUAL.value,
-                    Operator.NOT_EQUAL.value,
-                    Operator.GREATER_THAN.value,
-                    Operator.LESS_THAN.value,
-                    Operator.GREATER_THAN_EQUAL.value,
-                    Operator.LESS_THAN_EQUAL.value,
-                ]:
-                    if len(stack) > 1:
-                        bytecodes = comparison(l_operand, r_operand, token_string)
-                    else:
-                        bytecodes.append(comparison(l_operand, r_operand, token_string))
-
-                case _ as token_string if token_string in [
-                    Operator.BIT_AND.value,
-                    Operator.BIT_OR.value,
-                    Operator.BIT_NOT.value,
-                    Operator.BIT_SHIFT_LEFT.value,
-                    Operator.BIT_SHIFT_RIGHT.value,
-                    Operator.PLUS.value,
-                    Operator.MINUS.value,
-                    Operator.MULTIPLY.value,
-                    Operator.DIVIDE.value,
-                    Operator.MODULO.value,
-                    Operator.POWER.value,
-                ]:
-                    if len(stack) > 1:
-                        bytecodes = math_operation(l_operand, r_operand, token_string)
-                    else:
-                        bytecodes.append(
-                            math_operation(l_operand, r_operand, token_string)
-                        )
+        expressions.append(expression)
 
-                case _ as token_string if token_string in [
-                    Operator.AND.value,
-                    Operator.OR.value,
-                ]:
-                    if len(stack) > 1:
-                        bytecodes = bool_operation(l_operand, r_operand, token_string)
-                    else:
-                        bytecodes.append(
-                            bool_operation(l_operand, r_operand, token_string)
-                        )
+    return expressions
+
+
+def get_format_segment_positions(token_list: list) -> set:
+    """
+    Get the positions of the literal strings which are the segments of
+    a format string (a string with any `${}` inside of it), any other
+    literal string is just a constant operand of the expression
+    """
+
+    segment_positions = set()
+
+    # Each opened string is kept as [quote, literal positions, is format
+    # string] while each opened `${}` expression is kept as None
+    string_stack = []
+    for pos, token in enumerate(token_list):
+        is_inside_string = len(string_stack) > 0 and string_stack[-1] is not None
+
+        if isinstance(token, tuple) and token[1] == LiteralString:
+            if is_inside_string:
+                string_stack[-1][1].append(pos)
+        elif not isinstance(token, int):
+            continue
+        elif token in [
+            TOKENS[Punctuation.SINGLEQUOTE],
+            TOKENS[Punctuation.DOUBLEQUOTE],
+        ]:
+            if is_inside_string and string_stack[-1][0] == token:
+                _, literal_positions, is_format_string = string_stack.pop()
+                if is_format_string:
+                    segment_positions.update(literal_positions)
+            else:
+                string_stack.append([token, [], False])
+        elif token == TOKENS[Punctuation.DOLLAR] and is_inside_string:
+            string_stack[-1][2] = True
+            string_stack.append(None)
+        elif (
+            token == TOKENS[Bracket.CLOSING_CURLY_BRACKET]
+            and len(string_stack) > 0
+            and string_stack[-1] is None
+        ):
+            string_stack.pop()
 
-    return bytecodes
+    return segment_positions
 
 
-def parse_expression(token_list: list, line_number: int) -> list:
+def parse_expression(
+    token_list: list, line_number: int, identifier_types: dict = {}
+) -> list:
+    expressions = []
     parsed_tokens = []
     bracket_stack = []
-    for token in token_list:
+    square_bracket_tokens = []
+    square_bracket_depth = 0
+    format_segment_positions = get_format_segment_positions(token_list)
+    for pos, token in enumerate(token_list):
+        if square_bracket_depth > 0:
+            # Collect everything inside the square brackets
+            # and parse it at once when it is closed
+            square_bracket_tokens.append(token)
+            if token == TOKENS[Bracket.OPENING_SQUARE_BRACKET]:
+                square_bracket_depth += 1
+            elif token == TOKENS[Bracket.CLOSING_SQUARE_BRACKET]:
+                square_bracket_depth -= 1
+
+            if square_bracket_depth == 0:
+                parsed_tokens.append(
+                    parse_square_brackets(
+                        parsed_tokens,
+                        square_bracket_tokens[1:-1],
+                        line_number,
+                        identifier_types,
+                    )
+                )
+                square_bracket_tokens = []
+
+            continue
+
+        if token == TOKENS[Bracket.OPENING_SQUARE_BRACKET]:
+            square_bracket_tokens.append(token)
+            square_bracket_depth += 1
+            continue
+
         if isinstance(token, int):
-            match token_to_string(token):
-                case Keyword.EQUAL.value:
-                    parsed_tokens.append(TOKENS[Operator.EQUAL])
-
-                case Keyword.NOT_EQUAL.value:
-                    parsed_tokens.append(TOKENS[Operator.NOT_EQUAL])
-
-                case Bracket.OPENING_ROUND_BRACKET.value:
-                    parsed_tokens.append(token)
-                    bracket_stack.append(token)
-
-                case Bracket.CLOSING_ROUND_BRACKET.value:
-                    parsed_tokens.append(token)
-                    bracket_stack.pop()
-
-                case _ as token_string if token in [*[TOKENS[e] for e in Operator]]:
-                    if parsed_tokens[-1] in [*[TOKENS[e] for e in Operator]]:
-                        error(f"Illegal token '{token_string}'", line_number)
-
-                    parsed_tokens.append(token)
-
-                case _ as token_string if token not in [
-                    TOKENS[Punctuation.SPACE],
-                    TOKENS[Punctuation.SINGLEQUOTE],
-                    TOKENS[Punctuation.DOUBLEQUOTE],
-                    TOKENS[Punctuation.OPENING_MULTILINE_COMMENT],
-                    TOKENS[Punctuation.CLOSING_MULTILINE_COMMENT],
-                    TOKENS[Punctuation.COMMA],
-                    TOKENS[Punctuation.DOLLAR],
-                    TOKENS[Bracket.OPENING_CURLY_BRACKET],
-                    TOKENS[Bracket.CLOSING_CURLY_BRACKET],
-                ]:
-                    error(f"Illegal token '{token_string}'", line_number)
+            token = OPERATOR_ALIAS_TOKENS.get(token, token)
+
+            if token == TOKENS[Bracket.OPENING_ROUND_BRACKET]:
+                parsed_tokens.append(token)
+                bracket_stack.append(token)
+            elif token == TOKENS[Bracket.CLOSING_ROUND_BRACKET]:
+                parsed_tokens.append(token)
+                bracket_stack.pop()
+            elif token in OPERATOR_TOKENS:
+                if len(parsed_tokens) == 0 or (
+                    isinstance(parsed_tokens[-1], int)
+                    and parsed_tokens[-1] in OPERATOR_TOKENS
+                ):
+                    error(f"Illegal token '{token_to_string(token)}'", line_number)
+
+                parsed_tokens.append(token)
+            elif token == TOKENS[Keyword.IN]:
+                parsed_tokens.append(token)
+            elif token not in IGNORED_EXPRESSION_TOKENS:
+                error(f"Illegal token '{token_to_string(token)}'", line_number)
+        elif pos in format_segment_positions:
+            # Format string split the expression into several
+            # segments which are evaluated separately
+            if len(parsed_tokens) > 0:
+                expressions.extend(
+                    evaluate_expressions(parsed_tokens, identifier_types)
+                )
+                parsed_tokens = []
+
+            expressions.append(token)
         else:
             parsed_tokens.append(token)
 
     if len(bracket_stack) > 0:
         error("Expecting ')'", line_number)
 
-    if len(parsed_tokens) == 0:
+    if square_bracket_depth > 0:
+        error("Expecting ']'", line_number)
+
+    if len(parsed_tokens) == 0 and len(expressions) == 0:
         error("Expression not found", line_number)
 
-    return evaluate_to_bytecode(convert_to_postfix(parsed_tokens))
+    if len(parsed_tokens) > 0:
+        expressions.extend(evaluate_expressions(parsed_tokens, identifier_types))
 
+    return expressions
 
-def parse_parameters(token_list: list, line_number: int) -> list:
-    parameters = []
 
-    cur_tokens = []
-    for pos, token in enumerate(token_list):
-        if token == TOKENS[Punctuation.COMMA]:
-            parameters.extend(parse_expression(cur_tokens, line_number))
-            cur_tokens = []
+def parse_square_brackets(
+    parsed_tokens: list, token_list: list, line_number: int, identifier_types: dict
+) -> TypedBytecodes:
+    """
+    Parse either an array literal such as `[1, 2, 3]`, a dictionary
+    literal such as `["satu": 1, "dua": 2]` (`[:]` when empty) or an
+    indexing such as `angka[0]` when it follows an operand
+    """
 
-        cur_tokens.append(token)
+    if len(parsed_tokens) > 0 and isinstance(parsed_tokens[-1], (tuple, str, list)):
+        container = parsed_tokens.pop()
 
-        if pos == len(token_list) - 1 and len(cur_tokens) > 0:
-            parameters.extend(parse_expression(cur_tokens, line_number))
+        return TypedBytecodes(
+            subscript(
+                container, parse_expression(token_list, line_number, identifier_types)
+            ),
+            get_element_type(get_operand_type(container, identifier_types)),
+        )
 
-    return parameters
+    if get_top_level_token_pos(token_list, TOKENS[Punctuation.COLON]) != -1:
+        return parse_dictionary(token_list, line_number, identifier_types)
 
+    elements = parse_arguments(token_list, line_number, identifier_types)
 
-def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
-    is_entrypoint_exist = False
+    return TypedBytecodes(
+        define_array(elements),
+        get_array_type(
+            [get_expression_type(element, identifier_types) for element in elements]
+        ),
+    )
 
-    token_list = []
-    parsed_params = []
-    declared_functions = []
-    global_identifiers = {}
 
-    context_stack: List[Context] = []
-    bytecode_stack: List[Union[FunctionBytecode, ConditionBytecode]] = []
-    function_context_stack: List[str] = []
+def parse_dictionary(
+    token_list: list, line_number: int, identifier_types: dict
+) -> TypedBytecodes:
+    keys = []
+    elements = []
 
-    program_bytecodes = []
-    program_codechunks = []
+    if token_list != [TOKENS[Punctuation.COLON]]:
+        for entry_tokens in split_arguments(token_list):
+            colon_pos = get_top_level_token_pos(
+                entry_tokens, TOKENS[Punctuation.COLON]
+            )
+            if colon_pos == -1:
+                error(
+                    f"Expecting '{Punctuation.COLON.value}' in dictionary entry",
+                    line_number,
+                )
 
-    parsed_buffer = ""
-    line_number = 1
+            keys.append(
+                parse_expression(entry_tokens[:colon_pos], line_number, identifier_types)
+            )
+            elements.append(
+                parse_expression(
+                    entry_tokens[colon_pos + 1 :], line_number, identifier_types
+                )
+            )
+
+    return TypedBytecodes(
+        define_dictionary(keys, elements),
+        get_dictionary_type(
+            [get_expression_type(key, identifier_types) for key in keys],
+            [get_expression_type(element, identifier_types) for element in elements],
+        ),
+    )
+
+
+def parse_subscript_target(
+    token_list: list, line_number: int, identifier_types: dict
+) -> Tuple[list, list]:
+    """
+    Split the target of a subscript assignment or deletion
+    such as `angka[0]` into its container and its index
+    """
+
+    index_pos = -1
+    square_bracket_depth = 0
+    for pos, token in enumerate(token_list):
+        if token == TOKENS[Bracket.OPENING_SQUARE_BRACKET]:
+            if square_bracket_depth == 0:
+                index_pos = pos
+
+            square_bracket_depth += 1
+        elif token == TOKENS[Bracket.CLOSING_SQUARE_BRACKET]:
+            square_bracket_depth -= 1
+
+    if index_pos < 1 or token_list[-1] != TOKENS[Bracket.CLOSING_SQUARE_BRACKET]:
+        error("Illegal subscript", line_number)
+
+    return (
+        parse_expression(token_list[:index_pos], line_number, identifier_types),
+        parse_expression(token_list[index_pos + 1 : -1], line_number, identifier_types),
+    )
+
+
+def parse_arguments(
+    token_list: list, line_number: int, identifier_types: dict = {}
+) -> list:
+    """
+    Parse comma separated expressions, each of the argument
+    is returned as its own list of evaluated expressions
+    """
+
+    return [
+        parse_expression(argument_tokens, line_number, identifier_types)
+        for argument_tokens in split_arguments(token_list)
+    ]
+
+
+def get_top_level_token_pos(token_list: list, target_token: int) -> int:
+    """
+    Find a token which is not inside any square brackets, returns -1 if not found
+    """
+
+    square_bracket_depth = 0
+    for pos, token in enumerate(token_list):
+        if token == TOKENS[Bracket.OPENING_SQUARE_BRACKET]:
+            square_bracket_depth += 1
+        elif token == TOKENS[Bracket.CLOSING_SQUARE_BRACKET]:
+            square_bracket_depth -= 1
+        elif token == target_token and square_bracket_depth == 0:
+            return pos
+
+    return -1
+
+
+def split_arguments(token_list: list) -> list:
+    """
+    Split tokens at each comma which is not inside any square brackets
+    """
+
+    arguments = []
+
+    cur_tokens = []
+    square_bracket_depth = 0
+    for token in [*token_list, TOKENS[Punctuation.COMMA]]:
+        if token == TOKENS[Bracket.OPENING_SQUARE_BRACKET]:
+            square_bracket_depth += 1
+        elif token == TOKENS[Bracket.CLOSING_SQUARE_BRACKET]:
+            square_bracket_depth -= 1
+
+        if token == TOKENS[Punctuation.COMMA] and square_bracket_depth == 0:
+            if any(token != TOKENS[Punctuation.SPACE] for token in cur_tokens):
+                arguments.append(cur_tokens)
+
+            cur_tokens = []
+        else:
+            cur_tokens.append(token)
+
+    return arguments
+
+
+def parse_parameters(
+    token_list: list, line_number: int, identifier_types: dict = {}
+) -> list:
+    parameters = []
+
+    for argument in parse_arguments(token_list, line_number, identifier_types):
+        parameters.extend(argument)
+
+    return parameters
+
+
+def parse_parameter_declarations(token_list: list, line_number: int) -> list:
+    """
+    Parse function parameter declarations such as
+    `angka1: desimal, angka2: himpunan<desimal>, nama: kamus<campuran,desimal>`
+    """
+
+    parameters = []
+    is_type_declaration = False
+    angle_bracket_depth = 0
+
+    for token in token_list:
+        if token == TOKENS[Punctuation.SPACE]:
+            continue
+
+        if token == TOKENS[Bracket.OPENING_ANGLE_BRACKET]:
+            angle_bracket_depth += 1
+        elif token == TOKENS[Bracket.CLOSING_ANGLE_BRACKET]:
+            angle_bracket_depth -= 1
+
+        if token == TOKENS[Punctuation.COMMA] and angle_bracket_depth > 0:
+            # Comma between the content types of a container
+            parameters[-1]["type"] += token_to_string(token)
+        elif token == TOKENS[Punctuation.COMMA]:
+            is_type_declaration = False
+        elif token == TOKENS[Punctuation.COLON] and len(parameters) > 0:
+            is_type_declaration = True
+            parameters[-1]["type"] = ""
+        elif is_type_declaration and token in TYPE_DECLARATION_TOKENS:
+            parameters[-1]["type"] += token_to_string(token)
+        elif isinstance(token, str) and not is_type_declaration:
+            parameters.append({"name": token, "type": Type.GENERIC.value})
+        else:
+            error(
+                f"Illegal token '{token_to_string(token) if isinstance(token, int) else token}' in function parameters",
+                line_number,
+            )
+
+    return parameters
+
+
+def parse_type_declaration(token_list: list, line_number: int) -> str:
+    declared_type = ""
+
+    for token in token_list:
+        if token not in [*TYPE_DECLARATION_TOKENS, TOKENS[Punctuation.COMMA]]:
+            error(
+                f"Illegal token '{token_to_string(token) if isinstance(token, int) else token}' in type declaration",
+                line_number,
+            )
+
+        declared_type += token_to_string(token)
+
+    if declared_type == "":
+        error("Type declaration not found", line_number)
+
+    return declared_type
+
+
+def get_expression_type(expressions: list, identifier_types: dict) -> Union[str, None]:
+    if len(expressions) == 0:
+        return None
+
+    if len(expressions) > 1:
+        # Expression with several segments could only came from a format string
+        return Type.STRING.value
+
+    return get_operand_type(expressions[0], identifier_types)
+
+
+def parse_loop_header(
+    token_list: list, line_number: int, identifier_types: dict
+) -> Tuple[tuple or str, list]:
+    """
+    Parse the header of a loop (x didalam y) into the identifier
+    which holds each element along with the iterable expressions
+    """
+
+    tokens = [token for token in token_list if token != TOKENS[Punctuation.SPACE]]
+    if (
+        len(tokens) < 3
+        or not (
+            isinstance(tokens[0], str)
+            or (isinstance(tokens[0], tuple) and tokens[0][1] == LocalIdentifier)
+        )
+        or tokens[1] != TOKENS[Keyword.IN]
+    ):
+        error(
+            f"Expecting '{Keyword.FOR.value} ([identifier] {Keyword.IN.value} [expression])'",
+            line_number,
+        )
+
+    return (tokens[0], parse_expression(tokens[2:], line_number, identifier_types))
+
+
+def parse_declaration(
+    statement_tokens: list, line_number: int, function_bytecode: FunctionBytecode
+) -> list:
+    """
+    Parse identifier declaration such as
+    `variabel angka: desimal = 1 + 2;`
+    """
+
+    identifier = statement_tokens[1]
+    identifier_name = get_identifier_name(identifier)
+
+    assign_pos = (
+        statement_tokens.index(TOKENS[Punctuation.ASSIGN])
+        if TOKENS[Punctuation.ASSIGN] in statement_tokens
+        else len(statement_tokens)
+    )
+
+    declared_type = None
+    if len(statement_tokens) > 2 and statement_tokens[2] == TOKENS[Punctuation.COLON]:
+        declared_type = parse_type_declaration(
+            statement_tokens[3:assign_pos], line_number
+        )
+    elif assign_pos != 2:
+        error(f"Expecting '{Punctuation.ASSIGN.value}'", line_number)
+
+    expressions = (
+        parse_expression(
+            statement_tokens[assign_pos + 1 :],
+            line_number,
+            function_bytecode.identifier_types,
+        )
+        if assign_pos < len(statement_tokens)
+        else []
+    )
+
+    if len(expressions) == 0 and function_bytecode.is_identifier_constant(
+        identifier_name
+    ):
+        error(f"Constant '{identifier_name}' should be given a value", line_number)
+
+    value_type = get_expression_type(expressions, function_bytecode.identifier_types)
+    if not is_assignable(value_type, declared_type):
+        error(
+            f"Could not assign '{value_type}' value to '{identifier_name}' which is declared as '{declared_type}'",
+            line_number,
+        )
+
+    function_bytecode.set_identifier_type(
+        identifier_name, declared_type if declared_type else value_type
+    )
+
+    if is_array_type(declared_type):
+        expressions = [
+            define_array_storage(
+                load_expression(expressions) if expressions else define_array([]),
+                get_element_type(declared_type),
+            )
+        ]
+
+    return define_assignment(identifier, expressions)
+
+
+def parse_assignment(
+    statement_tokens: list, line_number: int, function_bytecode: FunctionBytecode
+) -> list:
+    identifier = statement_tokens[0]
+    if not isinstance(identifier, str) and not (
+        isinstance(identifier, tuple) and identifier[1] == LocalIdentifier
+    ):
+        error("Illegal assignment", line_number)
+
+    identifier_name = get_identifier_name(identifier)
+    if function_bytecode.is_identifier_constant(identifier_name):
+        error(f"Constant '{identifier_name}' could not be changed", line_number)
+
+    expressions = parse_expression(
+        statement_tokens[2:], line_number, function_bytecode.identifier_types
+    )
+
+    declared_type = function_bytecode.get_identifier_type(identifier_name)
+    value_type = get_expression_type(expressions, function_bytecode.identifier_types)
+    if not is_assignable(value_type, declared_type):
+        error(
+            f"Could not assign '{value_type}' value to '{identifier_name}' which is declared as '{declared_type}'",
+            line_number,
+        )
+
+    if is_array_type(declared_type):
+        expressions = [
+            define_array_storage(
+                load_expression(expressions), get_element_type(declared_type)
+            )
+        ]
+
+    return define_assignment(identifier, expressions)
+
+
+def get_identifier_operand(expressions: list) -> Union[tuple, str, None]:
+    """
+    Get the identifier if the expression is nothing but an identifier
+    (which could already be loaded as its typed bytecodes)
+    """
+
+    match expressions:
+        case [str() as identifier]:
+            return identifier
+        case [(_, v_type) as identifier] if v_type == LocalIdentifier:
+            return identifier
+        case [[Instr(name="LOAD_FAST", arg=name)]]:
+            return (name, LocalIdentifier)
+        case [[Instr(name="LOAD_NAME", arg=name)]]:
+            return name
+
+    return None
+
+
+def parse_subscript_assignment(
+    statement_tokens: list, line_number: int, identifier_types: dict
+) -> list:
+    assign_pos = statement_tokens.index(TOKENS[Punctuation.ASSIGN])
+    container, index = parse_subscript_target(
+        statement_tokens[:assign_pos], line_number, identifier_types
+    )
+
+    expressions = parse_expression(
+        statement_tokens[assign_pos + 1 :], line_number, identifier_types
+    )
+
+    element_type = get_element_type(get_expression_type(container, identifier_types))
+    value_type = get_expression_type(expressions, identifier_types)
+    if element_type == Type.STRING.value or not is_assignable(
+        value_type, element_type
+    ):
+        error(
+            f"Could not assign '{value_type}' value to element of '{element_type}'",
+            line_number,
+        )
+
+    if element_type == Type.INT.value and (
+        identifier := get_identifier_operand(container)
+    ):
+        return define_number_element_assignment(identifier, index, expressions)
+
+    return define_subscript_assignment(container, index, expressions)
+
+
+def parse_deletion(
+    statement_tokens: list, line_number: int, identifier_types: dict
+) -> list:
+    """
+    Parse deletion such as `hapus angka[0];` or `hapus angka;`
+    """
+
+    if statement_tokens[-1] == TOKENS[Bracket.CLOSING_SQUARE_BRACKET]:
+        return define_subscript_deletion(
+            *parse_subscript_target(statement_tokens, line_number, identifier_types)
+        )
+
+    if len(statement_tokens) == 1 and (
+        isinstance(statement_tokens[0], str)
+        or (
+            isinstance(statement_tokens[0], tuple)
+            and statement_tokens[0][1] == LocalIdentifier
+        )
+    ):
+        return define_deletion(statement_tokens[0])
+
+    error("Illegal deletion", line_number)
+
+
+def parse_statement(
+    token_list: list,
+    line_number: int,
+    function_bytecode: Union[FunctionBytecode, None],
+) -> list:
+    """
+    Parse the statement which is ended by the last
+    semicolon in the token list into bytecodes
+    """
+
+    statement_tokens = get_statement_tokens(token_list)
+    identifier_types = function_bytecode.identifier_types if function_bytecode else {}
+
+    if len(statement_tokens) == 0:
+        return []
+
+    match statement_tokens[0]:
+        case return_token if return_token == TOKENS[Keyword.RETURN]:
+            expressions = (
+                parse_expression(statement_tokens[1:], line_number, identifier_types)
+                if len(statement_tokens) > 1
+                else []
+            )
+
+            if function_bytecode:
+                value_type = get_expression_type(expressions, identifier_types)
+                if not is_assignable(value_type, function_bytecode.return_type):
+                    error(
+                        f"Could not return '{value_type}' value from '{function_bytecode.function_name}' function which returns '{function_bytecode.return_type}'",
+                        line_number,
+                    )
+
+                return function_bytecode.create_return_bytecodes(expressions)
+
+            return define_return(expressions)
+
+        case yield_token if yield_token == TOKENS[Keyword.YIELD]:
+            if function_bytecode is None or function_bytecode.is_entrypoint_function:
+                error(
+                    f"'{Keyword.YIELD.value}' could only be used inside a function other than '{Keyword.MAIN.value}'",
+                    line_number,
+                )
+
+            # Function which yields any value is turned into a generator
+            return define_yield(
+                parse_expression(statement_tokens[1:], line_number, identifier_types)
+                if len(statement_tokens) > 1
+                else []
+            )
+
+        case loop_token if loop_token in [
+            TOKENS[Keyword.BREAK],
+            TOKENS[Keyword.CONTINUE],
+        ]:
+            if function_bytecode is None or function_bytecode.current_loop is None:
+                error(
+                    f"'{token_to_string(loop_token)}' could only be used inside a loop",
+                    line_number,
+                )
+
+            if loop_token == TOKENS[Keyword.BREAK]:
+                return function_bytecode.current_loop.create_break_bytecodes()
+
+            return function_bytecode.current_loop.create_continue_bytecodes()
+
+        case declaration_token if function_bytecode and declaration_token in [
+            TOKENS[Keyword.VARIABLE],
+            TOKENS[Keyword.CONSTANT],
+        ]:
+            return parse_declaration(statement_tokens, line_number, function_bytecode)
+
+        case _ if (
+            function_bytecode
+            and len(statement_tokens) > 1
+            and statement_tokens[1] == TOKENS[Punctuation.ASSIGN]
+        ):
+            return parse_assignment(statement_tokens, line_number, function_bytecode)
+
+        case _ if (
+            len(statement_tokens) > 1
+            and statement_tokens[1] == TOKENS[Bracket.OPENING_SQUARE_BRACKET]
+            and TOKENS[Punctuation.ASSIGN] in statement_tokens
+        ):
+            return parse_subscript_assignment(
+                statement_tokens, line_number, identifier_types
+            )
+
+        case delete_token if delete_token == TOKENS[Keyword.DELETE]:
+            return parse_deletion(statement_tokens[1:], line_number, identifier_types)
+
+        case function_token if (
+            (isinstance(function_token, str) or function_token == TOKENS[Keyword.PRINT])
+            and len(statement_tokens) > 2
+            and statement_tokens[1] == TOKENS[Bracket.OPENING_ROUND_BRACKET]
+            and statement_tokens[-1] == TOKENS[Bracket.CLOSING_ROUND_BRACKET]
+        ):
+            # Function call statement is already turned into
+            # bytecodes once its closing round bracket is parsed
+            return []
+
+    statement = " ".join(
+        token_to_string(token)
+        if isinstance(token, int)
+        else (str(token[0]) if isinstance(token, tuple) else str(token))
+        for token in statement_tokens
+        if not isinstance(token, list)
+    )
+    error(f"Illegal statement '{statement}'", line_number)
+
+
+def parse_import(
+    statement_tokens: list,
+    line_number: int,
+    is_global_scope: bool,
+    is_optimized: bool,
+    declared_functions: list,
+    function_return_types: dict,
+    function_keys: dict,
+    python_modules: Union[Collection[str], None] = None,
+) -> list:
+    """
+    Parse the import statement (dari [module] impor [name], [name]) into
+    bytecodes, each imported name is declared as a function so it could be
+    called just like the functions which are declared by the program itself,
+    python modules could only be imported if they are in `python_modules`
+    (unless it is None)
+    """
+
+    from importlib.util import find_spec
+    from pyindo.importer import get_module_functions, get_module_key
+
+    if not is_global_scope:
+        error("Module could only be imported outside of any function", line_number)
+
+    if (
+        len(statement_tokens) < 4
+        or not isinstance(statement_tokens[1], str)
+        or statement_tokens[2] != TOKENS[Keyword.IMPORT]
+    ):
+        error("Expecting 'dari [module] impor [name]'", line_number)
+
+    module_name = statement_tokens[1]
+    names = [
+        token for token in statement_tokens[3:] if token != TOKENS[Punctuation.COMMA]
+    ]
+    if len(names) == 0 or not all(isinstance(name, str) for name in names):
+        error(f"Expecting the names to import from '{module_name}'", line_number)
+
+    if module_functions := get_module_functions(module_name, is_optimized):
+        functions, return_types = module_functions
+        for name in names:
+            if name not in functions:
+                error(
+                    f"'{name}' function is not declared inside '{module_name}' module",
+                    line_number,
+                )
+    else:
+        if python_modules is not None and module_name not in python_modules:
+            error(
+                f"Python module '{module_name}' is not allowed to be imported",
+                line_number,
+            )
+
+        # Python module, the return type of its functions are not known
+        try:
+            is_module_exist = find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            is_module_exist = False
+
+        if not is_module_exist:
+            error(f"Module '{module_name}' is not found", line_number)
+
+        return_types = {}
+
+    for name in names:
+        if name in declared_functions or name in BUILTIN_FUNCTIONS:
+            error(f"'{name}' function is already declared before", line_number)
+
+        check_legal_identifier(name, line_number)
+        declared_functions.append(name)
+        function_return_types[name] = return_types.get(name)
+
+    # Functions calling the imported ones are compiled
+    # again (instead of cached) once the module is changed
+    module_key = get_module_key(module_name, is_optimized)
+    for name in names:
+        function_keys[name] = module_key
+
+    return define_import(module_name, names)
+
+
+def parse_program(
+    program_buffer: str,
+    is_optimized: bool = False,
+    function_cache: Union[FunctionCache, None] = None,
+    global_scope: Union[dict, None] = None,
+    python_modules: Union[Collection[str], None] = None,
+) -> Tuple[list, list[CodeType]]:
+    """
+    Parse and compile a whole program, `global_scope` is given to compile
+    the program as a continuation of the previous one (which is what the
+    REPL does), it is then updated with what is declared by the program
+    and the program does not have to declare an entrypoint on its own
+
+    `python_modules` limits the python modules which could be imported
+    by the program, any python module could be imported if it is None
+    """
+
+    is_entrypoint_exist = False
+
+    entrypoint_bytecode = None
+
+    # Key of each function which is used as the dependency
+    # of the other functions that are calling it
+    function_keys = {}
+    cached_function = None
+
+    token_list = TokenBuffer(program_buffer)
+    parsed_params = []
+    declared_functions = []
+    inline_functions = {}
+    function_return_types = {}
+    function_memo_size = None
+    global_identifiers = {}
+
+    context_stack: List[Context] = []
+    round_bracket_stack: List[RoundBracket] = []
+    bytecode_stack: List[
+        Union[FunctionBytecode, ConditionBytecode, LoopBytecode]
+    ] = []
+    function_context_stack: List[str] = []
+
+    program_bytecodes = []
+    program_codechunks = []
+
+    if global_scope is not None:
+        declared_functions.extend(global_scope["functions"])
+        function_return_types.update(global_scope["return_types"])
+        inline_functions.update(global_scope["inline_functions"])
+
+    parsed_buffer = ""
+    line_number = 1
+
+    # Line number and column of the first character of the statement
+    # being parsed, every instruction of the statement points to it
+    statement_start: Union[Tuple[int, int], None] = None
 
     pos = 0
     while (char := program_buffer[pos]) != Punctuation.EOF.value:
         parsed_buffer += char
 
+        # Brackets and other kind of quote inside a string are just a part
+        # of the string itself, unless it is inside a format string expression
+        is_string_literal = is_inside_string_literal(context_stack)
+
+        if not is_string_literal:
+            if program_buffer[pos - 1] in STATEMENT_END_CHARS:
+                statement_start = None
+
+            if statement_start is None and char not in NON_STATEMENT_START_CHARS:
+                statement_start = (line_number, get_column(program_buffer, pos))
+
         match char:
-            case Bracket.OPENING_ROUND_BRACKET.value:
+            case Bracket.OPENING_ROUND_BRACKET.value if not is_string_literal:
                 # Start to parse function name backward
                 function_name = parsed_buffer[:-1].strip()
                 last_token, _ = get_first_token(token_list, False)
@@ -754,10 +2051,29 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                                 line_number,
                             )
 
+                        if function_name in BUILTIN_FUNCTIONS:
+                            error(
+                                f"'{function_name}' is a builtin function which could not be declared again",
+                                line_number,
+                            )
+
+                        if (
+                            function_name == Keyword.MAIN.value
+                            and function_memo_size is not None
+                        ):
+                            error(
+                                f"'{Keyword.MAIN.value}' function could not be annotated with '{Keyword.MEMO.value}'",
+                                line_number,
+                            )
+
                         declared_functions.append(function_name)
                 else:
                     # Function call
-                    if function_name != "" and function_name not in declared_functions:
+                    if (
+                        function_name != ""
+                        and function_name not in declared_functions
+                        and function_name not in BUILTIN_FUNCTIONS
+                    ):
                         error(
                             f"'{parsed_buffer[:-1]}' function is not declared anywhere",
                             line_number,
@@ -767,80 +2083,197 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                     check_legal_identifier(function_name, line_number)
                     token_list.append(function_name)
 
+                if last_token in [TOKENS[Keyword.FUNCTION], TOKENS[Keyword.MAIN]]:
+                    round_bracket_stack.append(RoundBracket.PARAMETERS)
+                elif last_token == TOKENS[Keyword.FOR]:
+                    round_bracket_stack.append(RoundBracket.LOOP)
+                elif last_token in FUNCTION_KEYWORD_TOKENS:
+                    round_bracket_stack.append(RoundBracket.CONDITION)
+                elif function_name != "" or last_token == TOKENS[Keyword.PRINT]:
+                    round_bracket_stack.append(RoundBracket.ARGUMENTS)
+                else:
+                    # Round bracket that is not owned by any function
+                    # is just grouping some part of an expression
+                    round_bracket_stack.append(RoundBracket.GROUPING)
+
                 token_list.append(TOKENS[Bracket.OPENING_ROUND_BRACKET])
                 context_stack.append(Context.ROUND_BRACKET)
                 parsed_buffer = ""
 
-            case Bracket.CLOSING_ROUND_BRACKET.value:
+            case Bracket.CLOSING_ROUND_BRACKET.value if not is_string_literal:
                 if (
                     len(context_stack) == 0
                     or Context.ROUND_BRACKET not in context_stack
                 ):
                     error("Unexpected ')'", line_number)
 
-                # Start to parse function parameter backward
-                opening_bracket_pos = (
-                    len(token_list)
-                    - 1
-                    - token_list[::-1].index(TOKENS[Bracket.OPENING_ROUND_BRACKET])
-                )
-                parsed_params = parse_parameters(
-                    token_list[opening_bracket_pos + 1 :],
-                    line_number,
-                )
+                round_bracket = round_bracket_stack.pop()
+                if round_bracket == RoundBracket.GROUPING:
+                    # Leave the grouped expression to the expression parser
+                    context_stack.pop()
+                    parsed_buffer = ""
+                    token_list.append(TOKENS[Bracket.CLOSING_ROUND_BRACKET])
+                    pos += 1
+                    continue
+
+                opening_bracket_pos = get_opening_bracket_pos(token_list)
+
+                match round_bracket:
+                    case RoundBracket.PARAMETERS:
+                        # Function definition
+                        parsed_params = parse_parameter_declarations(
+                            token_list[opening_bracket_pos + 1 :],
+                            line_number,
+                        )
 
-                second_last_token, _ = get_first_token(
-                    token_list, False, opening_bracket_pos - 1
-                )
-                if (
-                    second_last_token == TOKENS[Keyword.FUNCTION]
-                    or second_last_token in FUNCTION_KEYWORD_TOKENS
-                ):
-                    # Function definition
-                    search(
-                        program_buffer,
-                        pos + 1,
-                        line_number,
-                        Bracket.OPENING_CURLY_BRACKET,
-                    )
-                else:
-                    # Function call
-                    last_token, _ = get_first_token(
-                        token_list, False, opening_bracket_pos
-                    )
-                    function_name = (
-                        token_to_string(last_token)
-                        if last_token in TOKENS.values()
-                        else last_token
-                    )
+                        _, type_pos = search(
+                            program_buffer,
+                            pos + 1,
+                            line_number,
+                            Punctuation.COLON,
+                            should_exist=False,
+                        )
 
-                    if len(bytecode_stack) == 0:
-                        program_bytecodes.extend(
-                            call_function(
-                                function_name,
-                                parsed_params,
-                                line_number,
-                                True,
+                        if type_pos != -1:
+                            # Skip the function return type declaration
+                            while program_buffer[type_pos] in [" ", "\n"]:
+                                type_pos += 1
+
+                            return_type_pos = type_pos
+
+                            while program_buffer[type_pos] in [
+                                *ascii_letters,
+                                *digits,
+                                "_",
+                                Bracket.OPENING_ANGLE_BRACKET.value,
+                                Bracket.CLOSING_ANGLE_BRACKET.value,
+                            ]:
+                                type_pos += 1
+
+                            function_return_types[declared_functions[-1]] = (
+                                program_buffer[return_type_pos:type_pos]
                             )
+
+                        search(
+                            program_buffer,
+                            type_pos if type_pos != -1 else pos + 1,
+                            line_number,
+                            Bracket.OPENING_CURLY_BRACKET,
                         )
-                    else:
-                        bytecodes = call_function(
-                            function_name,
-                            parsed_params,
+
+                    case RoundBracket.LOOP:
+                        parsed_params = parse_loop_header(
+                            token_list[opening_bracket_pos + 1 :],
+                            line_number,
+                            get_identifier_types(bytecode_stack),
+                        )
+
+                        search(
+                            program_buffer,
+                            pos + 1,
                             line_number,
-                            False,
+                            Bracket.OPENING_CURLY_BRACKET,
                         )
 
-                        if isinstance(bytecode_stack[-1], FunctionBytecode):
-                            bytecode_stack[-1].add_content_bytecodes(bytecodes)
-                        elif isinstance(bytecode_stack[-1], ConditionBytecode):
-                            bytecode_stack[-1].add_conditional_statement(bytecodes)
+                    case RoundBracket.CONDITION:
+                        parsed_params = parse_parameters(
+                            token_list[opening_bracket_pos + 1 :],
+                            line_number,
+                            get_identifier_types(bytecode_stack),
+                        )
 
-                    search(program_buffer, pos + 1, line_number, Punctuation.SEMICOLON)
+                        search(
+                            program_buffer,
+                            pos + 1,
+                            line_number,
+                            Bracket.OPENING_CURLY_BRACKET,
+                        )
+
+                    case RoundBracket.ARGUMENTS:
+                        # Function call
+                        function_token, distance = get_first_token(
+                            token_list, False, opening_bracket_pos
+                        )
+                        function_pos = opening_bracket_pos - 1 - distance
+                        function_name = (
+                            token_to_string(function_token)
+                            if isinstance(function_token, int)
+                            else function_token
+                        )
+
+                        is_statement = (
+                            Context.DOUBLE_QUOTE not in context_stack
+                            and Context.SINGLE_QUOTE not in context_stack
+                            and get_first_token(token_list, False, function_pos)[0]
+                            in STATEMENT_BOUNDARY_TOKENS
+                        )
+
+                        function_args = parse_arguments(
+                            token_list[opening_bracket_pos + 1 :],
+                            line_number,
+                            get_identifier_types(bytecode_stack),
+                        )
+
+                        if (
+                            function_name in inline_functions
+                            and len(function_args)
+                            == len(inline_functions[function_name][0])
+                        ):
+                            caller_bytecode = get_function_bytecode(bytecode_stack)
+                            bytecodes = define_inline_call(
+                                function_name,
+                                function_args,
+                                *inline_functions[function_name],
+                                caller_bytecode is None
+                                or caller_bytecode.is_entrypoint_function,
+                                is_statement,
+                            )
+                        else:
+                            bytecodes = call_function(
+                                function_name,
+                                function_args,
+                                line_number,
+                                len(bytecode_stack) == 0,
+                                is_statement,
+                            )
+
+                        if not is_statement:
+                            # Function call is a part of another expression, so
+                            # replace the whole call with its evaluated bytecodes
+                            del token_list[function_pos:]
+                            token_list.append(
+                                TypedBytecodes(
+                                    bytecodes,
+                                    function_return_types.get(
+                                        function_name,
+                                        BUILTIN_FUNCTIONS.get(function_name),
+                                    ),
+                                )
+                            )
+
+                            context_stack.pop()
+                            parsed_buffer = ""
+                            pos += 1
+                            continue
+
+                        add_statement_bytecodes(
+                            bytecode_stack,
+                            program_bytecodes,
+                            bytecodes,
+                            get_statement_location(
+                                program_buffer, statement_start, pos, line_number
+                            ),
+                        )
+
+                        search(
+                            program_buffer, pos + 1, line_number, Punctuation.SEMICOLON
+                        )
 
                 context_stack.pop()
 
-            case Punctuation.DOUBLEQUOTE.value | Punctuation.SINGLEQUOTE.value:
+            case Punctuation.DOUBLEQUOTE.value | Punctuation.SINGLEQUOTE.value if (
+                not is_string_literal or context_stack[-1].value[0] == char
+            ):
                 # Start to parse string inside double || single quote backward
                 cur_quote = (
                     Punctuation.DOUBLEQUOTE
@@ -848,19 +2281,9 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                     else Punctuation.SINGLEQUOTE
                 )
                 if TOKENS[cur_quote] in token_list:
-                    if (
-                        len(
-                            [
-                                token
-                                for token in token_list
-                                if token == TOKENS[cur_quote]
-                            ]
-                        )
-                        % 2
-                        != 0
-                    ):
+                    if token_list.count(TOKENS[cur_quote]) % 2 != 0:
                         # Closing double || single quote
-                        if parsed_buffer[:-1] != Bracket.CLOSING_CURLY_BRACKET.value:
+                        if parsed_buffer[:-1] != "":
                             token_list.append((parsed_buffer[:-1], LiteralString))
 
                         token_list.append(TOKENS[cur_quote])
@@ -880,7 +2303,10 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
 
                 parsed_buffer = ""
 
-            case Bracket.OPENING_CURLY_BRACKET.value:
+            case Bracket.OPENING_CURLY_BRACKET.value if (
+                not is_string_literal
+                or program_buffer[pos - 1] == Punctuation.DOLLAR.value
+            ):
                 if len(declared_functions) == 0:
                     error("Unexpected '{'", line_number)
 
@@ -891,7 +2317,9 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                     or Context.SINGLE_QUOTE in context_stack
                 ):
                     if program_buffer[pos - 1] == Punctuation.DOLLAR.value:
-                        token_list.append((parsed_buffer[:-2], LiteralString))
+                        if parsed_buffer[:-2] != "":
+                            token_list.append((parsed_buffer[:-2], LiteralString))
+
                         token_list.append(
                             TOKENS[
                                 Punctuation.DOUBLEQUOTE
@@ -907,6 +2335,23 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                         )
 
                         parsed_buffer = ""
+                elif function_context_stack[-1:] == [Keyword.FOR.value]:
+                    function_bytecode = get_function_bytecode(bytecode_stack)
+                    loop_bytecode = LoopBytecode()
+
+                    function_bytecode.add_content_bytecodes(
+                        loop_bytecode.create_header_bytecodes(
+                            *parsed_params,
+                            get_statement_location(
+                                program_buffer, statement_start, pos, line_number
+                            ),
+                        )
+                    )
+                    function_bytecode.enter_loop(loop_bytecode)
+                    bytecode_class = loop_bytecode
+
+                    function_context_stack.clear()
+
                 elif (
                     Keyword.IF.value in function_context_stack
                     or Keyword.ELIF.value in function_context_stack
@@ -925,27 +2370,64 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                     match last_branch_context:
                         case Keyword.IF.value:
                             condition_bytecode = ConditionBytecode(Keyword.IF.value)
-                            condition_bytecode.set_conditional_expression(
-                                parsed_params[0]
-                            )
-                            bytecode_class = condition_bytecode
 
                         case Keyword.ELIF.value:
-                            condition_bytecode = ConditionBytecode(Keyword.ELIF.value)
-                            condition_bytecode.set_conditional_expression(
-                                parsed_params[0]
+                            condition_bytecode = ConditionBytecode(
+                                Keyword.ELIF.value,
+                                get_previous_branch(bytecode_stack, line_number),
                             )
-                            bytecode_class = condition_bytecode
 
                     match token_to_string(get_first_token(token_list, False)[0]):
                         case Keyword.ELSE.value:
-                            condition_bytecode = ConditionBytecode(Keyword.ELSE.value)
-                            bytecode_class = condition_bytecode
+                            condition_bytecode = ConditionBytecode(
+                                Keyword.ELSE.value,
+                                get_previous_branch(bytecode_stack, line_number),
+                            )
+
+                    get_function_bytecode(bytecode_stack).add_content_bytecodes(
+                        condition_bytecode.create_header_bytecodes(
+                            parsed_params[0] if len(parsed_params) > 0 else [],
+                            get_statement_location(
+                                program_buffer, statement_start, pos, line_number
+                            ),
+                        )
+                    )
+                    bytecode_class = condition_bytecode
+
+                    # The branch block is opened, so there is
+                    # no more branch context waiting for its block
+                    function_context_stack.clear()
 
                 else:
                     function_bytecode = FunctionBytecode(declared_functions[-1])
                     function_bytecode.set_function_params(parsed_params)
-                    function_bytecode.set_header_bytecodes(line_number)
+                    function_bytecode.set_return_type(
+                        function_return_types.get(declared_functions[-1])
+                    )
+                    function_bytecode.set_memo_size(function_memo_size)
+                    function_bytecode.set_generator(
+                        is_generator_source(program_buffer, pos)
+                    )
+                    function_bytecode.set_header_bytecodes(
+                        get_statement_location(
+                            program_buffer, statement_start, pos, line_number
+                        )
+                    )
+
+                    if (
+                        global_scope is not None
+                        and function_bytecode.is_entrypoint_function
+                    ):
+                        # Entrypoint content lives in the global scope, so
+                        # continue from the identifiers declared before
+                        for name, identifier_type in global_scope[
+                            "identifiers"
+                        ].items():
+                            function_bytecode.add_identifier(
+                                name,
+                                identifier_type,
+                                name in global_scope["constants"],
+                            )
                     bytecode_class = function_bytecode
 
                 if bytecode_class:
@@ -954,7 +2436,7 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                 context_stack.append(Context.CURLY_BRACKET)
                 parsed_params = []
 
-            case Bracket.CLOSING_CURLY_BRACKET.value:
+            case Bracket.CLOSING_CURLY_BRACKET.value if not is_string_literal:
                 if (
                     len(declared_functions) == 0
                     or len(context_stack) == 0
@@ -979,6 +2461,7 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                                 ],
                             ]
                         )
+                        parsed_buffer = ""
                 elif isinstance(bytecode_stack[-1], ConditionBytecode):
                     is_else_ahead = (
                         search(
@@ -991,56 +2474,81 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                         == TOKENS[Keyword.ELSE]
                     )
 
-                    if not is_else_ahead:
-                        condition_stack: List[ConditionBytecode] = []
-                        while isinstance(bytecode_stack[-1], ConditionBytecode):
-                            condition_stack.append(bytecode_stack.pop())
-
-                        target_label = Label()
-
-                        condition_temp = None
-                        condition_label = None
-                        for condition in condition_stack:
-                            if not condition_temp:
-                                condition_temp = condition
-                            else:
-                                condition_temp = (
-                                    condition_temp.create_condition_bytecodes(
-                                        target_label, condition_label
-                                    )
-                                )
-                                condition_label = (
-                                    condition.add_other_conditional_statement(
-                                        condition_temp
-                                    )
-                                )
-                                condition_temp = condition
-
-                        bytecode_stack[-1].add_content_bytecodes(
-                            [
-                                *condition_temp.create_condition_bytecodes(
-                                    target_label,
-                                    condition_label
-                                    if condition_label
-                                    else target_label,
-                                ),
-                                target_label,
-                            ]
+                    # Another branch keeps the current one on the stack,
+                    # so it could continue the chain from there
+                    condition_bytecode = (
+                        bytecode_stack[-1] if is_else_ahead else bytecode_stack.pop()
+                    )
+                    get_function_bytecode(bytecode_stack).add_content_bytecodes(
+                        condition_bytecode.create_tail_bytecodes(not is_else_ahead)
+                    )
+                elif isinstance(bytecode_stack[-1], LoopBytecode):
+                    loop_bytecode = bytecode_stack.pop()
+                    function_bytecode = get_function_bytecode(bytecode_stack)
+                    function_bytecode.exit_loop()
+                    function_bytecode.add_content_bytecodes(
+                        loop_bytecode.create_tail_bytecodes(
+                            function_bytecode.get_last_location()
                         )
-                    else:
-                        # There are another condition, so keep on parsing...
-                        pass
+                    )
                 else:
-                    bytecode_stack[-1].create_function_bytecodes(line_number)
+                    bytecode_stack[-1].create_function_bytecodes(
+                        get_statement_location(program_buffer, None, pos, line_number)
+                    )
 
+                    function_bytecode = bytecode_stack.pop()
                     (
                         bytecodes,
                         function_codechunk,
-                    ) = bytecode_stack.pop().get_function_bytecodes()
+                    ) = function_bytecode.get_function_bytecodes()
+
+                    if function_bytecode.is_entrypoint_function:
+                        entrypoint_bytecode = function_bytecode
+
+                    if is_optimized and (
+                        inline_bytecodes := function_bytecode.get_inline_bytecodes()
+                    ):
+                        # Keep the function definition for any other caller
+                        # but also place its body directly in the next call sites
+                        inline_functions[function_bytecode.function_name] = (
+                            function_bytecode.function_params,
+                            inline_bytecodes,
+                        )
 
                     if function_codechunk:
                         program_codechunks.append(function_codechunk)
 
+                    # Function with any unclosed bracket is left to
+                    # be reported at the end of the program instead
+                    if (
+                        cached_function
+                        and len(bytecode_stack) == 0
+                        and context_stack == [Context.CURLY_BRACKET]
+                        and len(round_bracket_stack) == 0
+                    ):
+                        function_cache.set(
+                            cached_function["key"],
+                            {
+                                "name": function_bytecode.function_name,
+                                "return_type": function_return_types.get(
+                                    function_bytecode.function_name
+                                ),
+                                "inline": inline_functions.get(
+                                    function_bytecode.function_name
+                                ),
+                                "is_entrypoint": function_bytecode.is_entrypoint_function,
+                                "bytecodes": bytecodes,
+                                "codechunk": function_codechunk,
+                                "first_line": cached_function["first_line"],
+                                "line_count": cached_function["line_count"],
+                            },
+                        )
+
+                        function_keys[function_bytecode.function_name] = (
+                            cached_function["dependency_key"]
+                        )
+                        cached_function = None
+
                     if len(bytecode_stack) == 0:
                         program_bytecodes.extend(bytecodes)
                     else:
@@ -1049,16 +2557,7 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                 context_stack.pop()
 
         if parsed_buffer in TOKEN_KEYS:
-            should_parse = True
-
-            if (
-                Context.DOUBLE_QUOTE in context_stack
-                or Context.SINGLE_QUOTE in context_stack
-            ):
-                if context_stack[-1] == Context.CURLY_BRACKET:
-                    should_parse = True
-                else:
-                    should_parse = False
+            should_parse = not is_inside_string_literal(context_stack)
 
             if should_parse:
                 # Parse token with the longest char possible first
@@ -1078,25 +2577,130 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                     )
                 )
 
+                token_start = pos - len(parsed_buffer) + 1
                 pos += (
                     2
                     if isinstance(three_char, int)
                     else (1 if isinstance(two_char, int) else 0)
                 )
 
-                token_list.append(token)
+                token_list.append(token, token_start, pos + 1 - token_start)
                 parsed_buffer = ""
-        else:
-            should_parse = True
 
-            if (
-                Context.DOUBLE_QUOTE in context_stack
-                or Context.SINGLE_QUOTE in context_stack
-            ):
-                if context_stack[-1] == Context.CURLY_BRACKET:
-                    should_parse = True
-                else:
-                    should_parse = False
+                if token == TOKENS[Keyword.MEMO] and len(bytecode_stack) > 0:
+                    error(
+                        f"'{Keyword.MEMO.value}' could only be used right before '{Keyword.FUNCTION.value}'",
+                        line_number,
+                    )
+
+                if token == TOKENS[Keyword.FUNCTION]:
+                    function_memo_size = get_memo_size(
+                        token_list, len(token_list) - 1, line_number
+                    )
+
+                if (
+                    function_cache is not None
+                    and token == TOKENS[Keyword.FUNCTION]
+                    and len(bytecode_stack) == 0
+                ):
+                    span_start = pos - len(Keyword.FUNCTION.value) + 1
+                    span_end = get_function_span_end(program_buffer, span_start)
+
+                    if span_end != -1:
+                        # Annotation is outside of the function source,
+                        # but changing it still changes the function
+                        function_key = get_function_key(
+                            (
+                                f"{Keyword.MEMO.value}({function_memo_size}) "
+                                if function_memo_size is not None
+                                else ""
+                            )
+                            + program_buffer[span_start : span_end + 1],
+                            function_keys,
+                            is_optimized,
+                        )
+                        cached_function = {
+                            "key": function_key,
+                            # Without inlining, callers only
+                            # depend on the function signature
+                            "dependency_key": function_key
+                            if is_optimized
+                            else get_function_key(
+                                program_buffer[
+                                    span_start : program_buffer.index("{", span_start)
+                                ],
+                                {},
+                                is_optimized,
+                            ),
+                            "first_line": line_number,
+                            "line_count": program_buffer[span_start:span_end].count(
+                                "\n"
+                            ),
+                        }
+
+                        if entry := function_cache.get(function_key):
+                            # Function is not changed since the last compilation
+                            entry = shift_line_numbers(
+                                entry, line_number - entry["first_line"]
+                            )
+
+                            if entry["name"] in declared_functions:
+                                error(
+                                    f"'{entry['name']}' function is already declared before",
+                                    line_number,
+                                )
+
+                            declared_functions.append(entry["name"])
+                            function_keys[entry["name"]] = cached_function[
+                                "dependency_key"
+                            ]
+
+                            if entry["return_type"]:
+                                function_return_types[entry["name"]] = entry[
+                                    "return_type"
+                                ]
+
+                            if entry["inline"]:
+                                inline_functions[entry["name"]] = entry["inline"]
+
+                            if entry["codechunk"]:
+                                program_codechunks.append(entry["codechunk"])
+
+                            is_entrypoint_exist |= entry["is_entrypoint"]
+                            program_bytecodes.extend(entry["bytecodes"])
+
+                            token_list[-1] = TOKENS[Bracket.CLOSING_CURLY_BRACKET]
+                            line_number += entry["line_count"]
+                            pos = span_end
+                            cached_function = None
+
+                if token == TOKENS[Punctuation.SEMICOLON]:
+                    statement_tokens = get_statement_tokens(token_list)
+                    add_statement_bytecodes(
+                        bytecode_stack,
+                        program_bytecodes,
+                        parse_import(
+                            statement_tokens,
+                            line_number,
+                            len(bytecode_stack) == 0,
+                            is_optimized,
+                            declared_functions,
+                            function_return_types,
+                            function_keys,
+                            python_modules,
+                        )
+                        if statement_tokens[:1] == [TOKENS[Keyword.FROM]]
+                        else parse_statement(
+                            token_list,
+                            line_number,
+                            get_function_bytecode(bytecode_stack),
+                        ),
+                        get_statement_location(
+                            program_buffer, statement_start, pos, line_number
+                        ),
+                    )
+        else:
+            should_parse = not is_inside_string_literal(context_stack)
 
             if (
                 program_buffer[pos + 1]
@@ -1109,36 +2713,107 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                 ]
                 or char == "\n"
             ) and should_parse:
-                match clean_string := clean_identifier(parsed_buffer):
+                clean_string = clean_identifier(parsed_buffer)
+
+                # Identifiers and literals are read back from the source
+                lexeme_start = parsed_buffer.find(clean_string)
+                if lexeme_start != -1:
+                    lexeme_start += pos + 1 - len(parsed_buffer)
+
+                match clean_string:
                     case "benar" | "BENAR" | "salah" | "SALAH" as v_boolean:
-                        token_list.append((v_boolean, bool))
+                        token_list.append_lexeme(BOOLEAN_KIND, v_boolean, lexeme_start)
                     case _ as v_integer if clean_string.isdigit():
-                        token_list.append((v_integer, int))
+                        token_list.append_lexeme(INTEGER_KIND, v_integer, lexeme_start)
                     case _ as v_float if clean_string.replace(
                         ".", ""
                     ).isdigit() and "." in clean_string:
-                        token_list.append((v_float, float))
+                        token_list.append_lexeme(FLOAT_KIND, v_float, lexeme_start)
                     case _ as identifier if clean_string != "":
                         if program_buffer[pos + 1] not in [
                             Bracket.OPENING_ROUND_BRACKET.value,
                             Bracket.OPENING_CURLY_BRACKET.value,
                         ]:
-                            if len(bytecode_stack) == 0:
+                            if (
+                                len(round_bracket_stack) > 0
+                                and round_bracket_stack[-1] == RoundBracket.PARAMETERS
+                            ):
+                                # Function parameter declaration
+                                check_legal_identifier(identifier, line_number)
+                                token_list.append_lexeme(
+                                    IDENTIFIER_KIND, identifier, lexeme_start
+                                )
+                            elif len(bytecode_stack) == 0 and get_first_token(
+                                token_list, False
+                            )[0] in IMPORT_STATEMENT_TOKENS:
+                                # Module name or the names imported from it
+                                token_list.append_lexeme(
+                                    IDENTIFIER_KIND, identifier, lexeme_start
+                                )
+                            elif len(bytecode_stack) == 0:
                                 # GLobal identifiers
                                 if identifier not in global_identifiers.keys():
                                     error(
                                         f"Identifier '{identifier}' has not declared yet",
                                         line_number,
                                     )
+
+                                token_list.append_lexeme(
+                                    IDENTIFIER_KIND, identifier, lexeme_start
+                                )
                             else:
                                 # Local identifiers
-                                if not bytecode_stack[-1].is_identifier_exist(
+                                function_bytecode = get_function_bytecode(
+                                    bytecode_stack
+                                )
+
+                                declaration_token, _ = get_first_token(
+                                    token_list, False
+                                )
+                                if (
+                                    len(round_bracket_stack) > 0
+                                    and round_bracket_stack[-1] == RoundBracket.LOOP
+                                    and declaration_token
+                                    == TOKENS[Bracket.OPENING_ROUND_BRACKET]
+                                    and not function_bytecode.is_identifier_exist(
+                                        identifier
+                                    )
+                                ):
+                                    # Identifier which holds each element of the loop
+                                    check_legal_identifier(identifier, line_number)
+                                    function_bytecode.add_identifier(identifier)
+                                elif declaration_token in [
+                                    TOKENS[Keyword.VARIABLE],
+                                    TOKENS[Keyword.CONSTANT],
+                                ]:
+                                    if function_bytecode.is_identifier_exist(
+                                        identifier
+                                    ):
+                                        error(
+                                            f"Identifier '{identifier}' is already declared before",
+                                            line_number,
+                                        )
+
+                                    check_legal_identifier(identifier, line_number)
+                                    function_bytecode.add_identifier(
+                                        identifier,
+                                        is_constant=declaration_token
+                                        == TOKENS[Keyword.CONSTANT],
+                                    )
+
+                                if not function_bytecode.is_identifier_exist(
                                     identifier
                                 ):
                                     error(
                                         f"Identifier '{identifier}' has not declared yet",
                                         line_number,
                                     )
+
+                                token_list.append_lexeme(
+                                    function_bytecode.get_identifier_kind(),
+                                    identifier,
+                                    lexeme_start,
+                                )
                         else:
                             pos += 1
                             continue
@@ -1152,6 +2827,7 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                 TOKENS[Keyword.FUNCTION],
                 TOKENS[Keyword.THEN],
                 TOKENS[Keyword.RETURN],
+                TOKENS[Keyword.YIELD],
                 TOKENS[Keyword.VARIABLE],
                 TOKENS[Keyword.CONSTANT],
             ]:
@@ -1165,10 +2841,14 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                 # Semicolon have to exist after those self operators
                 search(program_buffer, pos + 1, line_number, Punctuation.SEMICOLON)
 
+            if token_list[-1] == TOKENS[Keyword.FOR]:
+                function_context_stack.append(Keyword.FOR.value)
+
             if token_list[-1] in [TOKENS[Keyword.IF], TOKENS[Keyword.ELSE]]:
                 if (
                     token_list[-1] == TOKENS[Keyword.IF]
-                    and get_first_token(token_list, False)[0] == TOKENS[Keyword.ELSE]
+                    and get_first_token(token_list, False, len(token_list) - 1)[0]
+                    == TOKENS[Keyword.ELSE]
                 ):
                     function_context_stack.append(Keyword.ELIF.value)
                 else:
@@ -1190,8 +2870,12 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
                         "\n"
                     )
 
-                    pos += closing_position
-                    token_list.append(Punctuation.CLOSING_MULTILINE_COMMENT)
+                    pos += (
+                        closing_position
+                        + len(Punctuation.CLOSING_MULTILINE_COMMENT.value)
+                        - 1
+                    )
+                    token_list.append(TOKENS[Punctuation.CLOSING_MULTILINE_COMMENT])
                 else:
                     # End the parsing process directly if no closing multiline comment found
                     break
@@ -1206,7 +2890,24 @@ def parse_program(program_buffer: str) -> Tuple[list, list[CodeType]]:
 
     token_list.append(TOKENS[Punctuation.EOF])
 
-    if not is_entrypoint_exist:
+    if global_scope is not None:
+        global_scope["functions"] = [
+            function_name
+            for function_name in declared_functions
+            if function_name != Keyword.MAIN.value
+        ]
+        global_scope["return_types"] = function_return_types
+        global_scope["inline_functions"] = inline_functions
+
+        if not is_entrypoint_exist:
+            # Nothing but functions are declared, so return
+            # from the module right after storing them
+            program_bytecodes.extend(define_function_tail(False)[0])
+
+        if entrypoint_bytecode:
+            global_scope["identifiers"] = entrypoint_bytecode.identifier_types
+            global_scope["constants"] = entrypoint_bytecode.constant_identifiers
+    elif not is_entrypoint_exist:
         error(
             "Entrypoint is not exist, you should create it first using `utama` function"
         )
@@ -0,0 +1,302 @@
+from contextlib import redirect_stdout
+from io import StringIO
+from math import ceil
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from os import EX_SOFTWARE, cpu_count
+from queue import Queue
+from threading import Lock
+from time import perf_counter
+from typing import Collection, List, NamedTuple, Union
+
+import resource
+import signal
+
+# Imported before any worker is started, so every
+# worker already has the compiler ready to be used
+from pyindo.compiler import compile_bytecodes
+from pyindo.parser import parse_program
+
+
+# Budget of each program unless it is given when the pool is created
+CPU_TIME_LIMIT = 2
+MEMORY_LIMIT = 512 * 1024 * 1024
+WALL_TIME_LIMIT = 5.0
+
+# Seconds of cpu time between SIGXCPU and the worker being killed by
+# the kernel, for the programs which handle or ignore the signal
+CPU_TIME_GRACE = 1
+
+# Exit code of a program which is stopped because it exceeds its budget
+EX_LIMIT_EXCEEDED = 137
+
+
+class ExecutionResult(NamedTuple):
+    output: str
+    exit_code: int
+
+    # Either `ok`, `error`, `cpu_limit`, `memory_limit` or `timeout`
+    status: str
+
+
+class CpuTimeExceeded(Exception):
+    pass
+
+
+def handle_cpu_time_exceeded(signum: int, frame: object) -> None:
+    raise CpuTimeExceeded()
+
+
+def lower_limit(limit: int, soft_limit: int, hard_limit: int) -> None:
+    # Hard limit could only be lowered, never raised
+    _, current_hard_limit = resource.getrlimit(limit)
+    if current_hard_limit != resource.RLIM_INFINITY:
+        soft_limit = min(soft_limit, current_hard_limit)
+        hard_limit = min(hard_limit, current_hard_limit)
+
+    resource.setrlimit(limit, (soft_limit, hard_limit))
+
+
+def set_limits(cpu_time_limit: int, memory_limit: int) -> None:
+    """
+    Limit the cpu time (counted from what the worker has used so far)
+    and the memory of the worker for the program, the hard limits are
+    lowered as well so the program could not raise them on its own,
+    which is why a worker is replaced after running a single program
+    """
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_limit = ceil(usage.ru_utime + usage.ru_stime) + cpu_time_limit
+    lower_limit(resource.RLIMIT_CPU, cpu_limit, cpu_limit + CPU_TIME_GRACE)
+    lower_limit(resource.RLIMIT_AS, memory_limit, memory_limit)
+
+
+def run_program(
+    source: str,
+    is_optimized: bool,
+    cpu_time_limit: int,
+    memory_limit: int,
+    python_modules: Collection[str],
+) -> ExecutionResult:
+    """
+    Compile and run a program inside the budget, returns what it prints
+    (or the compile error) along with its exit code and status
+    """
+
+    output = StringIO()
+    try:
+        with redirect_stdout(output):
+            set_limits(cpu_time_limit, memory_limit)
+
+            bytecodes, _ = parse_program(
+                source + "\0", is_optimized, python_modules=python_modules
+            )
+            code = compile_bytecodes(bytecodes, is_optimized=is_optimized)
+
+            # Every program starts from a clean global scope
+            exec(code, {"__name__": "__main__"})
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+        return ExecutionResult(
+            output.getvalue(), exit_code, "ok" if exit_code == 0 else "error"
+        )
+    except CpuTimeExceeded:
+        return ExecutionResult(
+            output.getvalue() + "\nCPU time limit exceeded",
+            EX_LIMIT_EXCEEDED,
+            "cpu_limit",
+        )
+    except MemoryError:
+        return ExecutionResult(
+            output.getvalue() + "\nMemory limit exceeded",
+            EX_LIMIT_EXCEEDED,
+            "memory_limit",
+        )
+    except Exception as e:
+        return ExecutionResult(
+            output.getvalue() + f"\n{type(e).__name__}: {e}", EX_SOFTWARE, "error"
+        )
+
+    return ExecutionResult(output.getvalue(), 0, "ok")
+
+
+def serve_worker(connection: Connection, pool_connection: Connection) -> None:
+    """
+    Run each program which is received until the pool
+    asks the worker to stop or the connection is closed
+    """
+
+    # Pool end of the pipe is inherited by the fork, it has to be closed
+    # so the worker receives EOF once the pool closes its own end
+    pool_connection.close()
+
+    signal.signal(signal.SIGXCPU, handle_cpu_time_exceeded)
+
+    # Interrupting the pool should not print a traceback for each worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            break
+
+        # Other workers are forked with a copy of the pool end of this
+        # pipe too, so the pool could not rely on EOF alone to stop it
+        if job is None:
+            break
+
+        connection.send(run_program(*job))
+
+
+class Worker:
+    def __init__(self, context):
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(
+            target=serve_worker,
+            args=(worker_connection, self.connection),
+            daemon=True,
+        )
+        self.process.start()
+        worker_connection.close()
+
+    def close(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            # Worker is already stopped
+            pass
+
+        self.connection.close()
+        self.process.join(1)
+
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+class ExecutionPool:
+    """
+    Pool of worker processes which run many programs, every worker is
+    forked with the compiler already imported and runs a single program
+    within its cpu time, memory and wall time budget, then it is replaced
+    so nothing left behind by the program could affect the next one
+
+    Python modules are refused unless they are in `python_modules`, but
+    the pool only bounds the resources used by the programs, it is not a
+    sandbox as a program could still read and write files through the
+    standard library of pyindo
+    """
+
+    def __init__(
+        self,
+        worker_count: Union[int, None] = None,
+        cpu_time_limit: int = CPU_TIME_LIMIT,
+        memory_limit: int = MEMORY_LIMIT,
+        wall_time_limit: float = WALL_TIME_LIMIT,
+        python_modules: Collection[str] = (),
+    ):
+        self.cpu_time_limit = cpu_time_limit
+        self.memory_limit = memory_limit
+        self.wall_time_limit = wall_time_limit
+        self.python_modules = frozenset(python_modules)
+
+        self._context = get_context("fork")
+        self._workers: List[Worker] = [
+            Worker(self._context) for _ in range(worker_count or cpu_count() or 1)
+        ]
+        self._idle_workers: Queue = Queue()
+        for worker in self._workers:
+            self._idle_workers.put(worker)
+
+        self._stats_lock = Lock()
+        self.program_count = 0
+        self.recycled_count = 0
+        self._start_time = perf_counter()
+
+    def _replace_worker(self, worker: Worker, is_killed: bool) -> Worker:
+        if is_killed:
+            worker.kill()
+        else:
+            worker.close()
+
+        new_worker = Worker(self._context)
+        with self._stats_lock:
+            self._workers[self._workers.index(worker)] = new_worker
+            self.recycled_count += 1
+
+        return new_worker
+
+    def run(self, source: str, is_optimized: bool = False) -> ExecutionResult:
+        """
+        Run the program on the first idle worker, this could be
+        called from several threads to run the programs in parallel
+        """
+
+        worker = self._idle_workers.get()
+        try:
+            worker.connection.send(
+                (
+                    source,
+                    is_optimized,
+                    self.cpu_time_limit,
+                    self.memory_limit,
+                    self.python_modules,
+                )
+            )
+
+            if worker.connection.poll(self.wall_time_limit):
+                result = worker.connection.recv()
+            else:
+                result = ExecutionResult(
+                    "Wall time limit exceeded", EX_LIMIT_EXCEEDED, "timeout"
+                )
+        except (EOFError, OSError):
+            worker.process.join(self.wall_time_limit)
+            if worker.process.exitcode in [-signal.SIGKILL, -signal.SIGXCPU]:
+                # Killed by the kernel once the program keeps on running
+                # past its cpu time limit without handling SIGXCPU
+                result = ExecutionResult(
+                    "CPU time limit exceeded", EX_LIMIT_EXCEEDED, "cpu_limit"
+                )
+            else:
+                result = ExecutionResult(
+                    "Worker stopped unexpectedly", EX_SOFTWARE, "error"
+                )
+
+        # Limits of the worker could not be raised again for the next program,
+        # the worker is still running the program once it has timed out
+        worker = self._replace_worker(worker, result.status == "timeout")
+
+        with self._stats_lock:
+            self.program_count += 1
+
+        self._idle_workers.put(worker)
+        return result
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._workers)
+
+    def get_throughput(self) -> float:
+        """
+        Number of programs run per second since the pool is created
+        (including the time taken to start the workers)
+        """
+
+        return self.program_count / (perf_counter() - self._start_time)
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.close()
+
+    def __enter__(self) -> "ExecutionPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
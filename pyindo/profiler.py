@@ -0,0 +1,100 @@
+from collections import Counter
+from threading import Event, Thread, get_ident, main_thread
+from types import CodeType, FrameType
+from typing import List, Union
+
+import signal
+import sys
+
+
+# Interval between each sample in seconds (of cpu time whenever
+# the samples are taken by the profiling timer)
+SAMPLING_INTERVAL = 0.001
+
+
+def get_code_objects(code: CodeType) -> set:
+    """
+    Collect the code object of the program along with
+    every function code object which is declared inside
+    """
+
+    code_objects = {code}
+    for constant in code.co_consts:
+        if isinstance(constant, CodeType):
+            code_objects |= get_code_objects(constant)
+
+    return code_objects
+
+
+class SamplingProfiler:
+    """
+    Sample the stack of the running pyindo program periodically, only
+    frames of the program code objects are kept so each sample is the
+    pyindo call stack (along with the line being run in each function)
+    """
+
+    def __init__(
+        self, code: CodeType, file_name: str, interval: float = SAMPLING_INTERVAL
+    ):
+        self.file_name = file_name
+        self.interval = interval
+        self.samples: Counter = Counter()
+
+        self._code_objects = get_code_objects(code)
+        self._module_code = code
+        self._thread_id = get_ident()
+        self._sampler_thread: Union[Thread, None] = None
+        self._stop_event = Event()
+
+    def get_frame_name(self, frame: FrameType) -> str:
+        code = frame.f_code
+
+        # The entrypoint is inlined at the module level
+        function_name = "utama" if code is self._module_code else code.co_name
+        return f"{self.file_name}:{function_name}:{frame.f_lineno}"
+
+    def sample(self, frame: Union[FrameType, None]) -> None:
+        stack = []
+        while frame is not None:
+            if frame.f_code in self._code_objects:
+                stack.append(self.get_frame_name(frame))
+
+            frame = frame.f_back
+
+        if stack:
+            self.samples[";".join(reversed(stack))] += 1
+
+    def _handle_signal(self, signum: int, frame: Union[FrameType, None]) -> None:
+        self.sample(frame)
+
+    def _sample_thread(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sample(sys._current_frames().get(self._thread_id))
+
+    def start(self) -> None:
+        # The profiling timer is only available on unix and the
+        # signal could only be handled by the main thread, sample
+        # it from another thread otherwise
+        if hasattr(signal, "setitimer") and self._thread_id == main_thread().ident:
+            signal.signal(signal.SIGPROF, self._handle_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._sampler_thread = Thread(target=self._sample_thread, daemon=True)
+            self._sampler_thread.start()
+
+    def stop(self) -> None:
+        if self._sampler_thread is not None:
+            self._stop_event.set()
+            self._sampler_thread.join()
+            self._sampler_thread = None
+        else:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def get_collapsed_stacks(self) -> List[str]:
+        """
+        Format the samples as collapsed stacks which
+        could be used directly by flamegraph tools
+        """
+
+        return [f"{stack} {count}" for stack, count in sorted(self.samples.items())]
@@ -0,0 +1,118 @@
+from copy import deepcopy
+from typing import Union
+
+from pyindo.compiler import compile_bytecodes
+from pyindo.parser import parse_program
+
+
+PROMPT = ">>> "
+CONTINUATION_PROMPT = "... "
+
+# Maximum number of compiled inputs kept by the REPL
+COMPILE_CACHE_SIZE = 256
+
+
+class Repl:
+    """
+    Read, compile and run the pyindo program line by line, every input is
+    compiled as the continuation of the previous ones so the variables and
+    functions that are declared before could still be used afterwards
+    """
+
+    def __init__(self):
+        self.globals = {"__name__": "__main__"}
+        self.global_scope = {
+            "functions": [],
+            "return_types": {},
+            "inline_functions": {},
+            "identifiers": {},
+            "constants": [],
+        }
+        self.compile_cache: dict = {}
+
+    def wrap_input(self, source: str) -> str:
+        """
+        Wrap the input inside the entrypoint (unless it declares a function
+        or imports a module), a bare expression is printed just like python does
+        """
+
+        stripped_source = source.strip()
+        if stripped_source.startswith(("fungsi", "dari")):
+            return source
+
+        if not stripped_source.endswith((";", "}")):
+            stripped_source = f'tampilkan("${{{stripped_source}}}\\n");'
+
+        # Keep everything on the first line so the error line number
+        # shown by the compiler is the same as the one being typed
+        return f"fungsi utama() {{ {stripped_source}\n}}"
+
+    def compile(self, source: str) -> Union[object, None]:
+        """
+        Compile the input, returns None if there is a compile error
+        (which is already shown by the compiler) and keep the global
+        scope untouched in that case
+        """
+
+        program = self.wrap_input(source) + "\0"
+        cache_key = (program, repr(self.global_scope))
+        if cache_key in self.compile_cache:
+            code, global_scope = self.compile_cache[cache_key]
+            self.global_scope = deepcopy(global_scope)
+            return code
+
+        global_scope = deepcopy(self.global_scope)
+        try:
+            bytecodes, _ = parse_program(program, global_scope=global_scope)
+            code = compile_bytecodes(bytecodes)
+        except SystemExit:
+            return None
+
+        if len(self.compile_cache) >= COMPILE_CACHE_SIZE:
+            del self.compile_cache[next(iter(self.compile_cache))]
+
+        self.compile_cache[cache_key] = (code, deepcopy(global_scope))
+        self.global_scope = global_scope
+        return code
+
+    def run(self, source: str) -> None:
+        code = self.compile(source)
+        if code is None:
+            # Compile error is already shown by the compiler
+            print()
+            return
+
+        try:
+            exec(code, self.globals)
+        except SystemExit:
+            pass
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+
+    def read(self) -> str:
+        """
+        Read a single input, keep on reading the next
+        lines while there is a curly bracket left unclosed
+        """
+
+        source = input(PROMPT)
+        while source.count("{") > source.count("}"):
+            source += "\n" + input(CONTINUATION_PROMPT)
+
+        return source
+
+    def loop(self) -> None:
+        print("pyindo REPL, press Ctrl-D to exit")
+
+        while True:
+            try:
+                source = self.read()
+            except EOFError:
+                print()
+                break
+            except KeyboardInterrupt:
+                print()
+                continue
+
+            if source.strip():
+                self.run(source)
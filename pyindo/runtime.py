@@ -0,0 +1,199 @@
+from array import array
+from collections import deque
+from itertools import repeat
+from typing import Union
+
+import operator
+
+try:
+    import numpy
+except ImportError:
+    # Fallback to a loop over the typed array inside `elementwise`
+    numpy = None
+
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+FLOAT_EXACT_MAX = 2**53
+
+ELEMENTWISE_OPERATIONS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "**": operator.pow,
+}
+
+
+class NumberArray(array):
+    """
+    Contiguous typed array which keeps a himpunan of numbers, it
+    is shown just like a list as any other himpunan is shown
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    __str__ = __repr__
+
+
+class ElementDeque(deque):
+    """
+    Deque which keeps a himpunan of any other element type,
+    it is also shown just like a list
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    __str__ = __repr__
+
+
+def number_array(typecode: str, values) -> Union[NumberArray, list]:
+    """
+    Keep the numbers inside a typed array, or inside a list whenever
+    any of the integers does not fit in 64 bits (pyindo integers just
+    like python integers have no limit)
+    """
+
+    values = values if isinstance(values, (list, tuple)) else list(values)
+    try:
+        return NumberArray(typecode, values)
+    except OverflowError:
+        return list(values)
+
+
+def store_element(container, index, value):
+    """
+    Store the element of a himpunan of integers, returns the himpunan
+    itself or a list of its elements whenever the element does not fit
+    in the typed array
+    """
+
+    try:
+        container[index] = value
+    except OverflowError:
+        container = list(container)
+        container[index] = value
+
+    return container
+
+
+def is_sequence(operand) -> bool:
+    return not isinstance(operand, (int, float))
+
+
+def get_typecode(operand) -> Union[str, None]:
+    """
+    Get the typecode of the elements of an operand,
+    returns None if it could not be known without
+    going through each of the elements
+    """
+
+    match operand:
+        case array():
+            return "d" if operand.typecode in ["f", "d"] else "q"
+        case float():
+            return "d"
+        case int() if INT64_MIN <= operand <= INT64_MAX:
+            return "q"
+
+    return None
+
+
+def get_bound(operand) -> int:
+    """
+    Get the largest absolute value of an integer operand
+    """
+
+    if not is_sequence(operand):
+        return abs(operand)
+
+    if len(operand) == 0:
+        return 0
+
+    return max(-min(operand), max(operand))
+
+
+def has_zero(operand) -> bool:
+    return 0 in operand if is_sequence(operand) else operand == 0
+
+
+def is_vectorizable(o_type: str, l_operand, r_operand, typecodes: list) -> bool:
+    """
+    Check whether numpy would compute exactly what python computes for
+    the operation, every other case (integers overflowing 64 bits, power
+    and division by zero) is left to the loop inside `elementwise`
+    """
+
+    if o_type == "**" or None in typecodes:
+        return False
+
+    if o_type in ["/", "%"] and has_zero(r_operand):
+        return False
+
+    if "d" in typecodes or o_type == "%":
+        return True
+
+    l_bound, r_bound = get_bound(l_operand), get_bound(r_operand)
+    match o_type:
+        case "*":
+            return l_bound * r_bound <= INT64_MAX
+        case "/":
+            # Integers are only exactly converted into floats up to 2 ** 53
+            return max(l_bound, r_bound) <= FLOAT_EXACT_MAX
+
+    return l_bound + r_bound <= INT64_MAX
+
+
+def elementwise(o_type: str, l_operand, r_operand) -> Union[NumberArray, list]:
+    """
+    Compute an operation between each element of himpunan of numbers,
+    either of the operands could also be a single number which is then
+    applied to every element, the result is kept inside a typed array
+    unless any of its integers does not fit in 64 bits
+    """
+
+    if is_sequence(l_operand) and is_sequence(r_operand):
+        if len(l_operand) != len(r_operand):
+            raise ValueError(
+                f"Could not compute himpunan of {len(l_operand)} and {len(r_operand)} elements"
+            )
+
+    typecodes = [get_typecode(l_operand), get_typecode(r_operand)]
+
+    if numpy and is_vectorizable(o_type, l_operand, r_operand, typecodes):
+        # Floats overflowing into inf are not an error in python either
+        with numpy.errstate(all="ignore"):
+            result = ELEMENTWISE_OPERATIONS[o_type](
+                numpy.asarray(l_operand), numpy.asarray(r_operand)
+            )
+
+        typecode = "d" if result.dtype.kind == "f" else "q"
+        values = NumberArray(typecode)
+        values.frombytes(memoryview(result.astype(typecode, copy=False)).cast("B"))
+
+        return values
+
+    results = map(
+        ELEMENTWISE_OPERATIONS[o_type],
+        l_operand if is_sequence(l_operand) else repeat(l_operand),
+        r_operand if is_sequence(r_operand) else repeat(r_operand),
+    )
+
+    if o_type == "/" or "d" in typecodes:
+        return number_array("d", results)
+
+    # Power with a negative exponent could turn integers into floats
+    if o_type != "**" and None not in typecodes:
+        return number_array("q", results)
+
+    results = list(results)
+    return number_array(
+        "d" if any(isinstance(result, float) for result in results) else "q",
+        results,
+    )
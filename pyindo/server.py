@@ -0,0 +1,289 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from hashlib import sha256
+from io import StringIO
+from os import EX_SOFTWARE, EX_UNAVAILABLE, remove
+from os.path import dirname, exists
+from socket import AF_UNIX, SOCK_STREAM, socket
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from sys import exit
+from threading import Lock
+from typing import Tuple, Union
+
+import marshal
+import re
+
+from pyindo.assembler import DEFAULT_FILE_NAME
+from pyindo.cache import FunctionCache
+from pyindo.client import get_socket_path, receive_message, send_message
+from pyindo.compiler import compile_bytecodes
+from pyindo.importer import get_module_path, get_source_stat, install, unload_modules
+from pyindo.parser import Keyword, parse_program
+
+
+# Maximum number of compiled programs kept by the server
+PROGRAM_CACHE_SIZE = 256
+
+# Function cache of each program path, every worker has its own
+function_caches: dict = {}
+
+# Name of each module imported by a program, a name inside a comment
+# or a string is also matched but it is only checked needlessly
+IMPORTED_MODULE_RE = re.compile(
+    rf"\b{Keyword.FROM.value}\s+([A-Za-z_][A-Za-z0-9_.]*)\s+{Keyword.IMPORT.value}\b"
+)
+
+
+def get_dependencies(
+    source: str, is_optimized: bool, path: Union[str, None]
+) -> dict:
+    """
+    Get the modification time and size of the source of each module
+    imported by a program, the compiled program is only up to date as
+    long as none of them is changed
+    """
+
+    if path:
+        install(dirname(path), is_optimized)
+
+    dependencies = {}
+    for module_name in set(IMPORTED_MODULE_RE.findall(source)):
+        if module_path := get_module_path(module_name, is_optimized):
+            dependencies[module_path] = get_source_stat(module_path)
+
+    return dependencies
+
+
+def is_dependencies_changed(dependencies: dict) -> bool:
+    for module_path, source_stat in dependencies.items():
+        try:
+            if get_source_stat(module_path) != source_stat:
+                return True
+        except OSError:
+            return True
+
+    return False
+
+
+def compile_source(
+    source: str, is_optimized: bool, path: Union[str, None]
+) -> Tuple[bytes, str, int, dict]:
+    """
+    Compile a program inside a worker, returns the marshalled code along
+    with the compiler output and its exit code if the compilation failed,
+    and the dependencies that the compiled code is only valid for
+    """
+
+    function_cache = (
+        function_caches.setdefault(path, FunctionCache()) if path else None
+    )
+
+    # Taken before compiling, so a module changed while
+    # the program is compiled is never kept as up to date
+    dependencies = get_dependencies(source, is_optimized, path)
+
+    output = StringIO()
+    try:
+        with redirect_stdout(output):
+            bytecodes, _ = parse_program(source + "\0", is_optimized, function_cache)
+            compiled_code = compile_bytecodes(
+                bytecodes,
+                is_optimized=is_optimized,
+                file_name=path or DEFAULT_FILE_NAME,
+            )
+
+        return (marshal.dumps(compiled_code), output.getvalue(), 0, dependencies)
+    except SystemExit as e:
+        return (
+            b"",
+            output.getvalue(),
+            e.code if isinstance(e.code, int) else 1,
+            dependencies,
+        )
+
+
+def run_code(code_data: bytes, path: Union[str, None] = None) -> Tuple[str, int]:
+    """
+    Run a compiled program inside a worker, returns
+    what it prints along with its exit code
+    """
+
+    # Modules are loaded again by each run, so the
+    # latest version of them is always the one used
+    unload_modules()
+    if path:
+        install(dirname(path))
+
+    output = StringIO()
+    try:
+        with redirect_stdout(output):
+            exec(marshal.loads(code_data), {"__name__": "__main__"})
+    except SystemExit as e:
+        return (output.getvalue(), e.code if isinstance(e.code, int) else 1)
+    except Exception as e:
+        return (output.getvalue() + f"\n{type(e).__name__}: {e}", EX_SOFTWARE)
+
+    return (output.getvalue(), 0)
+
+
+class CompileServer(ThreadingUnixStreamServer):
+    """
+    Server which keeps the compiler warm, each request is handled on
+    its own thread and the work itself is done by the worker processes
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, max_workers: Union[int, None] = None):
+        super().__init__(socket_path, CompileRequestHandler)
+
+        self.max_workers = max_workers
+        self.worker_pool = ProcessPoolExecutor(max_workers)
+        self.worker_pool_lock = Lock()
+        self.program_cache: dict = {}
+        self.program_cache_lock = Lock()
+
+    def submit(self, function, *args):
+        """
+        Run a function on one of the workers and wait for its result, the
+        worker pool is replaced whenever any of its worker is killed as
+        a broken pool would not run anything else
+        """
+
+        worker_pool = self.worker_pool
+        try:
+            return worker_pool.submit(function, *args).result()
+        except BrokenProcessPool:
+            with self.worker_pool_lock:
+                # Another request could have replaced it already
+                if self.worker_pool is worker_pool:
+                    worker_pool.shutdown(wait=False)
+                    self.worker_pool = ProcessPoolExecutor(self.max_workers)
+
+            raise
+
+    def compile(
+        self, source: str, is_optimized: bool, path: Union[str, None]
+    ) -> Tuple[bytes, str, int]:
+        # Path is kept in the compiled code and it is
+        # also where the imported modules are searched
+        program_key = sha256(f"{is_optimized}:{path}:{source}".encode()).hexdigest()
+
+        with self.program_cache_lock:
+            entry = self.program_cache.get(program_key)
+
+        if entry and not is_dependencies_changed(entry["dependencies"]):
+            return (entry["code"], "", 0)
+
+        code_data, output, exit_code, dependencies = self.submit(
+            compile_source, source, is_optimized, path
+        )
+
+        if exit_code == 0:
+            with self.program_cache_lock:
+                self.program_cache.pop(program_key, None)
+                if len(self.program_cache) >= PROGRAM_CACHE_SIZE:
+                    # Forget the oldest compiled program
+                    del self.program_cache[next(iter(self.program_cache))]
+
+                self.program_cache[program_key] = {
+                    "code": code_data,
+                    "dependencies": dependencies,
+                }
+
+        return (code_data, output, exit_code)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.worker_pool.shutdown()
+
+
+class CompileRequestHandler(StreamRequestHandler):
+    """
+    Handle a request with this header:
+        action -> `compile` to get the marshalled code or `run` to get the output
+        path -> path of the program, it is read by the server if there is no body
+        optimized -> whether the program should be compiled with optimizations
+    """
+
+    def respond(self, header: dict, body: bytes) -> Tuple[bytes, str, int]:
+        path = header.get("path")
+        if body:
+            source = body.decode()
+        elif path:
+            with open(path, "r") as f:
+                source = f.read()
+        else:
+            return (b"", "Error: Expecting either the program or its path", EX_SOFTWARE)
+
+        code_data, output, exit_code = self.server.compile(
+            source, header.get("optimized", False), path
+        )
+
+        if exit_code == 0 and header.get("action") == "run":
+            output, exit_code = self.server.submit(run_code, code_data, path)
+            code_data = b""
+
+        return (code_data, output, exit_code)
+
+    def handle(self) -> None:
+        try:
+            header, body = receive_message(self.connection)
+        except (ConnectionError, ValueError):
+            # Client is gone or it is not sending a pyindo request
+            return
+
+        path = header.get("path")
+        try:
+            code_data, output, exit_code = self.respond(header, body)
+        except BrokenProcessPool:
+            code_data, output, exit_code = (
+                b"",
+                "Error: Compile server worker is stopped unexpectedly",
+                EX_SOFTWARE,
+            )
+        except UnicodeDecodeError:
+            code_data, output, exit_code = (
+                b"",
+                f"Error: Could not decode file: {path}",
+                EX_SOFTWARE,
+            )
+        except OSError:
+            code_data, output, exit_code = (
+                b"",
+                f"Error: Could not open file: {path}",
+                EX_SOFTWARE,
+            )
+
+        try:
+            send_message(
+                self.connection,
+                {"output": output, "exit_code": exit_code},
+                code_data,
+            )
+        except ConnectionError:
+            # Client is gone before the response is sent
+            pass
+
+
+def serve(socket_path: Union[str, None] = None) -> None:
+    socket_path = socket_path or get_socket_path()
+    if exists(socket_path):
+        with socket(AF_UNIX, SOCK_STREAM) as connection:
+            if connection.connect_ex(socket_path) == 0:
+                print(f"Another pyindo server is already serving on {socket_path}")
+                exit(EX_UNAVAILABLE)
+
+        # Left behind by a server which is not stopped properly
+        remove(socket_path)
+
+    with CompileServer(socket_path) as server:
+        print(f"[+] Serving pyindo compiler on {socket_path}")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            remove(socket_path)
@@ -0,0 +1,109 @@
+from typing import Iterator, TextIO
+
+import sys
+
+
+# Size of the chunks read (and of the buffer used to write) by default,
+# large enough so going through a huge file takes only a few system calls
+CHUNK_SIZE = 1024 * 1024
+
+
+def rentang(awal: int, akhir: int = None, langkah: int = 1) -> range:
+    """
+    Numbers from `awal` up to (but not including) `akhir`, or from 0 up
+    to `awal` if there is no `akhir`, each number is only made when needed
+    """
+
+    if akhir is None:
+        return range(awal)
+
+    return range(awal, akhir, langkah)
+
+
+def baca_baris(jalur: str) -> Iterator[str]:
+    """
+    Read the file line by line (without the line break), only
+    a single chunk of the file is kept in the memory at a time
+    """
+
+    with open(jalur, "r", buffering=CHUNK_SIZE) as berkas:
+        for baris in berkas:
+            yield baris.rstrip("\n")
+
+
+def baca_potongan(jalur: str, ukuran: int = CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Read the file in binary chunks of the given size, every chunk is
+    read into the same buffer so each of them is only valid until the
+    next one is read (copy it with `bytes` to keep it for later)
+    """
+
+    buffer = bytearray(ukuran)
+    view = memoryview(buffer)
+
+    with open(jalur, "rb", buffering=0) as berkas:
+        while size := berkas.readinto(buffer):
+            yield view[:size]
+
+
+def hitung_baris(jalur: str) -> int:
+    """
+    Count the lines of the file, a last line without any
+    line break at its end is also counted as a line
+    """
+
+    jumlah = 0
+    last_byte = b"\n"
+    buffer = bytearray(CHUNK_SIZE)
+
+    # Count inside the reused buffer so no chunk is ever copied
+    with open(jalur, "rb", buffering=0) as berkas:
+        while size := berkas.readinto(buffer):
+            jumlah += buffer.count(b"\n", 0, size)
+            last_byte = buffer[size - 1 : size]
+
+    return jumlah + (last_byte != b"\n")
+
+
+def salin_berkas(sumber: str, tujuan: str) -> int:
+    """
+    Copy the file chunk by chunk, returns the number of bytes copied
+    """
+
+    jumlah = 0
+    with open(tujuan, "wb", buffering=0) as berkas:
+        for potongan in baca_potongan(sumber):
+            jumlah += berkas.write(potongan)
+
+    return jumlah
+
+
+def buka_penulis(jalur: str, tambahkan: bool = False) -> TextIO:
+    """
+    Open the file to be written through a buffer, the file is
+    appended instead of being replaced if `tambahkan` is benar
+    """
+
+    return open(jalur, "a" if tambahkan else "w", buffering=CHUNK_SIZE)
+
+
+def tulis(penulis: TextIO, teks: str) -> None:
+    penulis.write(str(teks))
+
+
+def tutup(penulis: TextIO) -> None:
+    # Whatever is left inside the buffer is written first
+    penulis.close()
+
+
+def statistik_ingatan(nama_fungsi: str) -> tuple:
+    """
+    Hits, misses and size of the memo of the function which is annotated
+    with `ingat`, the function is looked up by its name from the caller
+    """
+
+    fungsi = sys._getframe(1).f_globals.get(nama_fungsi)
+    if not hasattr(fungsi, "cache_info"):
+        raise ValueError(f"'{nama_fungsi}' function is not annotated with 'ingat'")
+
+    return fungsi.cache_info()
@@ -0,0 +1,152 @@
+from array import array
+from typing import Any, Iterator, Union
+
+from pyindo.types import LocalIdentifier
+
+
+# Kinds of the tokens which are not one of the token numbers, those
+# numbers start from 100 so they never collide with any of these kinds
+VALUE_KIND = 0
+IDENTIFIER_KIND = 1
+LOCAL_IDENTIFIER_KIND = 2
+BOOLEAN_KIND = 3
+INTEGER_KIND = 4
+FLOAT_KIND = 5
+
+LITERAL_KIND_TYPES = {
+    BOOLEAN_KIND: bool,
+    INTEGER_KIND: int,
+    FLOAT_KIND: float,
+}
+
+# Token numbers (and so the kinds) are all below this
+MAX_KIND = 1000
+
+
+def make_lexeme_token(kind: int, lexeme: str) -> Union[str, tuple]:
+    if kind == IDENTIFIER_KIND:
+        return lexeme
+    elif kind == LOCAL_IDENTIFIER_KIND:
+        return (lexeme, LocalIdentifier)
+
+    return (lexeme, LITERAL_KIND_TYPES[kind])
+
+
+class TokenBuffer:
+    """
+    Token list of a program which is stored as parallel arrays of the kind
+    of each token along with its start offset and length inside the source,
+    identifiers and literals are only sliced out of the source when they
+    are read, the other tokens which could not be stored as a kind (such
+    as the collapsed function call bytecodes) are kept aside by their index
+
+    Reading a token gives the same value as the token list used to hold,
+    slicing it gives a plain list of those values
+    """
+
+    __slots__ = ("source", "kinds", "starts", "lengths", "_values", "_kind_counts")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.kinds = array("H")
+        self.starts = array("I")
+        self.lengths = array("I")
+        self._values: dict = {}
+        self._kind_counts = array("I", bytes(4 * MAX_KIND))
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __iter__(self) -> Iterator[Any]:
+        for pos in range(len(self.kinds)):
+            yield self._get_token(pos)
+
+    def __contains__(self, token: Any) -> bool:
+        if isinstance(token, int) and 0 <= token < MAX_KIND:
+            return self._kind_counts[token] > 0
+
+        return any(value == token for value in self)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self._get_token(pos) for pos in range(*key.indices(len(self)))]
+
+        if key < 0:
+            key += len(self.kinds)
+
+        if not 0 <= key < len(self.kinds):
+            raise IndexError("token index out of range")
+
+        return self._get_token(key)
+
+    def __setitem__(self, pos: int, token: Any) -> None:
+        if pos < 0:
+            pos += len(self.kinds)
+
+        self._kind_counts[self.kinds[pos]] -= 1
+        self._values.pop(pos, None)
+        self._set_kind(pos, token)
+
+    def __delitem__(self, key: slice) -> None:
+        # Tokens are only ever removed from the end of the list
+        start, stop, _ = key.indices(len(self))
+        if stop != len(self):
+            raise ValueError("Only the tail of the token list could be removed")
+
+        for pos in range(start, stop):
+            self._kind_counts[self.kinds[pos]] -= 1
+            self._values.pop(pos, None)
+
+        del self.kinds[start:]
+        del self.starts[start:]
+        del self.lengths[start:]
+
+    def _get_token(self, pos: int) -> Any:
+        kind = self.kinds[pos]
+        if kind > FLOAT_KIND:
+            return kind
+
+        if kind == VALUE_KIND:
+            return self._values[pos]
+
+        start = self.starts[pos]
+        return make_lexeme_token(
+            kind, self.source[start : start + self.lengths[pos]]
+        )
+
+    def _set_kind(self, pos: int, token: Any) -> None:
+        if isinstance(token, int) and FLOAT_KIND < token < MAX_KIND:
+            self.kinds[pos] = token
+        else:
+            self.kinds[pos] = VALUE_KIND
+            self._values[pos] = token
+
+        self._kind_counts[self.kinds[pos]] += 1
+
+    def append(self, token: Any, start: int = 0, length: int = 0) -> None:
+        self.kinds.append(VALUE_KIND)
+        self.starts.append(start)
+        self.lengths.append(length)
+        self._set_kind(len(self.kinds) - 1, token)
+
+    def append_lexeme(self, kind: int, lexeme: str, start: int) -> None:
+        """
+        Append an identifier or a literal, only its position is kept
+        whenever the lexeme could be found there inside the source
+        """
+
+        if start < 0 or not self.source.startswith(lexeme, start):
+            self.append(make_lexeme_token(kind, lexeme))
+            return
+
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.lengths.append(len(lexeme))
+        self._kind_counts[kind] += 1
+
+    def extend(self, tokens: list) -> None:
+        for token in tokens:
+            self.append(token)
+
+    def count(self, token: int) -> int:
+        return self._kind_counts[token]
@@ -1,3 +1,19 @@
 class LiteralString(str):
     def __init__(self):
         pass
+
+
+class LocalIdentifier(str):
+    def __init__(self):
+        pass
+
+
+class TypedBytecodes(list):
+    """
+    Bytecodes of an evaluated expression along with the
+    type of the value which it leaves on top of the stack
+    """
+
+    def __init__(self, bytecodes: list = [], value_type: str = None):
+        super().__init__(bytecodes)
+        self.value_type = value_type
@@ -0,0 +1,128 @@
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+from os import close, read, stat
+from os.path import abspath, basename, dirname
+from select import select
+from struct import calcsize, unpack_from
+from time import sleep
+from typing import List, Union
+
+
+# Flags of the inotify events which mean a file
+# is done being written (directly or replaced)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_CLOEXEC = 0o2000000
+
+INOTIFY_EVENT_FORMAT = "iIII"
+INOTIFY_EVENT_SIZE = calcsize(INOTIFY_EVENT_FORMAT)
+
+POLLING_INTERVAL = 0.25
+
+
+class FileWatcher:
+    """
+    Wait for any of the watched files to be changed, this uses inotify
+    whenever it is available and fallback to polling the stat of each
+    file (only the watched ones) otherwise
+    """
+
+    def __init__(self, file_paths: List[str]):
+        self._file_paths = [abspath(file_path) for file_path in file_paths]
+        self._file_stats = {
+            file_path: self._get_file_stat(file_path) for file_path in self._file_paths
+        }
+        self._inotify_fd = self._init_inotify()
+
+    @property
+    def is_using_inotify(self) -> bool:
+        return self._inotify_fd is not None
+
+    def _get_file_stat(self, file_path: str) -> Union[tuple, None]:
+        try:
+            file_stat = stat(file_path)
+            return (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            return None
+
+    def _init_inotify(self) -> Union[int, None]:
+        libc_name = find_library("c")
+        if not libc_name:
+            return None
+
+        try:
+            libc = CDLL(libc_name, use_errno=True)
+            inotify_fd = libc.inotify_init1(IN_CLOEXEC)
+        except (AttributeError, OSError):
+            return None
+
+        if inotify_fd < 0:
+            return None
+
+        # Editors commonly replace the file instead of writing into
+        # it, so the directory of each file is the one being watched
+        for directory in {dirname(file_path) for file_path in self._file_paths}:
+            if (
+                libc.inotify_add_watch(
+                    inotify_fd,
+                    directory.encode(),
+                    IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE,
+                )
+                < 0
+            ):
+                print(f"Could not watch {directory} (errno {get_errno()})")
+                close(inotify_fd)
+                return None
+
+        return inotify_fd
+
+    def _get_changed_files(self) -> List[str]:
+        changed_files = []
+
+        for file_path in self._file_paths:
+            file_stat = self._get_file_stat(file_path)
+            if file_stat != self._file_stats[file_path]:
+                self._file_stats[file_path] = file_stat
+                changed_files.append(file_path)
+
+        return changed_files
+
+    def _wait_inotify(self) -> None:
+        file_names = {basename(file_path) for file_path in self._file_paths}
+
+        while True:
+            select([self._inotify_fd], [], [])
+            events = read(self._inotify_fd, 4096)
+
+            pos = 0
+            while pos < len(events):
+                _, _, _, name_length = unpack_from(INOTIFY_EVENT_FORMAT, events, pos)
+                name_pos = pos + INOTIFY_EVENT_SIZE
+                name = events[name_pos : name_pos + name_length].rstrip(b"\0").decode()
+                pos = name_pos + name_length
+
+                if name in file_names:
+                    return
+
+    def wait(self) -> List[str]:
+        """
+        Block until at least one of the watched files
+        is changed, returns the path of the changed files
+        """
+
+        while True:
+            if self._inotify_fd is not None:
+                self._wait_inotify()
+            else:
+                sleep(POLLING_INTERVAL)
+
+            # Events could also come from another file with the same name
+            # inside a watched directory, so the stat is still compared
+            if changed_files := self._get_changed_files():
+                return changed_files
+
+    def close(self) -> None:
+        if self._inotify_fd is not None:
+            close(self._inotify_fd)
+            self._inotify_fd = None
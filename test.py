@@ -1,7 +1,179 @@
-from os import popen
+from os import environ, popen
+from os.path import isfile
 from glob import glob
+from tempfile import TemporaryDirectory
+
+import signal
+import sys
+
+
+# Operations of himpunan which numpy and the python loop must agree on
+ELEMENTWISE_CASES = [
+    ("+", [1, 2, 3], [4, 5, 6]),
+    ("*", [2**40, 3], [2**40, 2]),
+    ("+", [2**63 - 1, 1], 1),
+    ("-", [-(2**63), 0], [1, 1]),
+    ("**", [2, 3], [-1, 2]),
+    ("**", [2, 3], [70, 2]),
+    ("/", [1, 2], [2, 4]),
+    ("/", [2**60 + 1, 3], [1, 1]),
+    ("/", [1.5, 2.5], [0.0, 1.0]),
+    ("%", [7, -7], [0, 2]),
+    ("%", [7, -7], [3, 2]),
+    ("*", [1e308, 1.5], 10),
+]
+
+
+# Program which spends most of its time on the body of its loop
+HOT_LOOP_PROGRAM = """fungsi hitung(batas: desimal): desimal {
+    variabel total: desimal = 0;
+    untuk (i didalam rentang(batas)) {
+        total = total + i * i % 7;
+    }
+    hasilkan total;
+}
+
+fungsi utama() {
+    hitung(1000000);
+}
+"""
+HOT_LOOP_LINE = 4
+
+# Program which shows the process id of the worker running it
+PID_PROGRAM = """dari os impor getpid;
+
+fungsi utama() {
+    tampilkan("${getpid()}");
+}
+"""
+
+# Program which keeps on running after ignoring SIGXCPU
+CPU_HOG_PROGRAM = f"""dari signal impor signal;
+
+fungsi utama() {{
+    signal({int(signal.SIGXCPU)}, {int(signal.SIG_IGN)});
+
+    variabel total: desimal = 0;
+    untuk (i didalam rentang(10 ** 12)) {{
+        total = total + i;
+    }}
+}}
+"""
+
+
+def program_options(program: str) -> str:
+    """
+    Get the compiler options of a test program which are
+    written inside its `.options` file (if any)
+    """
+
+    options_file = program.replace(".pyind", ".options")
+    return open(options_file, "r").read().strip() if isfile(options_file) else ""
+
+
+def get_worker_pids(run_count: int = 3) -> list:
+    """
+    Get the process id of the worker which runs each program,
+    it should differ as a worker only runs a single program
+    """
+
+    from pyindo.pool import ExecutionPool
+
+    with ExecutionPool(worker_count=1, python_modules={"os"}) as pool:
+        results = [pool.run(PID_PROGRAM) for _ in range(run_count)]
+
+    return [result.output for result in results if result.status == "ok"]
+
+
+def run_on_pool(program: str, **pool_options) -> str:
+    """
+    Get the status of a program which is run on the execution pool
+    """
+
+    from pyindo.pool import ExecutionPool
+
+    with ExecutionPool(worker_count=1, **pool_options) as pool:
+        return pool.run(program).status
+
+
+def compute_elementwise(o_type: str, l_operand, r_operand) -> tuple:
+    """
+    Get the elements and typecode (or the raised error) of an operation
+    between typed himpunan
+    """
+
+    from pyindo.runtime import elementwise, number_array
+
+    operands = [
+        number_array(
+            "d" if any(isinstance(element, float) for element in operand) else "q",
+            operand,
+        )
+        if isinstance(operand, list)
+        else operand
+        for operand in [l_operand, r_operand]
+    ]
+
+    try:
+        result = elementwise(o_type, *operands)
+    except ArithmeticError as e:
+        return type(e).__name__, None
+
+    return list(result), getattr(result, "typecode", None)
+
+
+def compare_elementwise_paths(o_type: str, l_operand, r_operand) -> tuple:
+    """
+    Compute an operation with numpy (if it is installed) and with the
+    python loop it falls back to, both of them should agree
+    """
+
+    import pyindo.runtime as runtime
+
+    numpy_result = compute_elementwise(o_type, l_operand, r_operand)
+
+    numpy, runtime.numpy = runtime.numpy, None
+    try:
+        loop_result = compute_elementwise(o_type, l_operand, r_operand)
+    finally:
+        runtime.numpy = numpy
+
+    return numpy_result, loop_result
+
+
+def sample_hot_loop() -> float:
+    """
+    Get the share of the samples of the profiler which land
+    on the body of the loop instead of anywhere else
+    """
+
+    from pyindo.compiler import compile_bytecodes
+    from pyindo.parser import parse_program
+    from pyindo.profiler import SamplingProfiler
+
+    bytecodes, _ = parse_program(HOT_LOOP_PROGRAM + "\0")
+    code = compile_bytecodes(bytecodes)
+
+    profiler = SamplingProfiler(code, "hot_loop.pyind")
+    profiler.start()
+    try:
+        exec(code, {"__name__": "__main__"})
+    finally:
+        profiler.stop()
+
+    hot_samples = sum(
+        count
+        for stack, count in profiler.samples.items()
+        if stack.endswith(f":hitung:{HOT_LOOP_LINE}")
+    )
+    return hot_samples / max(sum(profiler.samples.values()), 1)
+
 
 if __name__ == "__main__":
+    # Cache of the imported modules is written outside of the tests
+    cache_directory = TemporaryDirectory()
+    environ["PYTHONPYCACHEPREFIX"] = sys.pycache_prefix = cache_directory.name
+
     incorrect_programs, incorrect_programs_out = [
         sorted(glob("tests/error/*.pyind")),
         sorted(glob("tests/error/*.output")),
@@ -19,7 +191,11 @@ if __name__ == "__main__":
     for iteration, program, output in zip(
         range(len(incorrect_programs)), incorrect_programs, incorrect_programs_out
     ):
-        program_out = popen(f"python3 main.py {program}").read().lstrip("\n")
+        program_out = (
+            popen(f"python3 main.py {program} {program_options(program)}")
+            .read()
+            .lstrip("\n")
+        )
         expected_out = open(output, "r").read()
 
         print(f"[{iteration + 1}] {program} ", end="")
@@ -38,7 +214,11 @@ if __name__ == "__main__":
     for iteration, program, output in zip(
         range(len(correct_programs)), correct_programs, correct_programs_out
     ):
-        program_out = popen(f"python3 main.py {program}").read().lstrip("\n")
+        program_out = (
+            popen(f"python3 main.py {program} {program_options(program)}")
+            .read()
+            .lstrip("\n")
+        )
         expected_out = open(output, "r").read()
 
         print(f"[{iteration + 1}] {program} ", end="")
@@ -48,3 +228,71 @@ if __name__ == "__main__":
             print("\033[91m(FAIL)\033[0m")
             print(f"Expected: `{expected_out}`")
             print(f"Got: `{program_out}`", end="\n\n")
+
+    print("\n================================")
+    print("[+] Testing the himpunan kernels")
+    print("================================")
+
+    # Test that numpy and the python loop agree on every operation
+    for iteration, (o_type, l_operand, r_operand) in enumerate(ELEMENTWISE_CASES):
+        numpy_result, loop_result = compare_elementwise_paths(
+            o_type, l_operand, r_operand
+        )
+
+        print(f"[{iteration + 1}] {l_operand} {o_type} {r_operand} ", end="")
+        if numpy_result == loop_result:
+            print("\033[92m(PASSED)\033[0m")
+        else:
+            print("\033[91m(FAIL)\033[0m")
+            print(f"Expected: `{loop_result}`")
+            print(f"Got: `{numpy_result}`", end="\n\n")
+
+    print("\n=========================")
+    print("[+] Testing the profiler")
+    print("=========================")
+
+    hot_share = sample_hot_loop()
+
+    print(f"[1] samples on the loop body ({hot_share:.0%}) ", end="")
+    if hot_share > 0.5:
+        print("\033[92m(PASSED)\033[0m")
+    else:
+        print("\033[91m(FAIL)\033[0m")
+        print("Expected: most of the samples on the loop body", end="\n\n")
+
+    print("\n==============================")
+    print("[+] Testing the execution pool")
+    print("==============================")
+
+    worker_pids = get_worker_pids()
+    pool_checks = [
+        (
+            "worker is replaced after each program",
+            len(worker_pids) == 3 and len(set(worker_pids)) == 3,
+            "a different worker process for each of the 3 programs",
+        ),
+        (
+            "python module is refused",
+            run_on_pool(PID_PROGRAM) == "error",
+            "`error` status",
+        ),
+        (
+            "program ignoring SIGXCPU is stopped",
+            run_on_pool(
+                CPU_HOG_PROGRAM,
+                cpu_time_limit=1,
+                wall_time_limit=10,
+                python_modules={"signal"},
+            )
+            == "cpu_limit",
+            "`cpu_limit` status",
+        ),
+    ]
+
+    for iteration, (name, is_passed, expected) in enumerate(pool_checks):
+        print(f"[{iteration + 1}] {name} ", end="")
+        if is_passed:
+            print("\033[92m(PASSED)\033[0m")
+        else:
+            print("\033[91m(FAIL)\033[0m")
+            print(f"Expected: {expected}", end="\n\n")